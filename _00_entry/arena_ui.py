@@ -2,6 +2,7 @@ import sys
 import os
 import random
 import time
+import traceback
 from PySide6.QtWidgets import QApplication, QMessageBox, QPushButton, QCheckBox, QWidget, QHBoxLayout, QVBoxLayout
 from PySide6.QtCore import QTimer
 
@@ -9,53 +10,153 @@ from PySide6.QtCore import QTimer
 from _00_entry.main_game import MainWindow
 # Importamos nuestros agentes IA
 from _02_engines.ai_player import AIAgent
+from _02_engines.llm_cache import LLMResponseCache
+from _02_engines.action_sampler import sample_valid_actions
+from _01_core_logic.recorder import GameRecorder
+from _01_core_logic.sim_loop import FixedStepLoop
+from _01_core_logic import instrumentation, log_config
+from _01_core_logic.log_writer import AsyncLogWriter
+from _03_ui.agent_worker import AgentMoves
 
 class DualLogger:
-    def __init__(self, filename):
+    """Copia sys.stdout al registro de la partida; el fichero lo escribe un hilo (AsyncLogWriter)."""
+    def __init__(self, filename, max_bytes=10 * 1024 * 1024, backup_count=5, compress=True):
         self.terminal = sys.stdout
-        self.log_file = open(filename, "a", encoding='utf-8')
+        self.log_file = AsyncLogWriter(filename, max_bytes=max_bytes, backup_count=backup_count, compress=compress)
         self.enabled = True
 
     def write(self, message):
+        if not self.enabled:
+            return
         try:
-            if self.enabled:
-                self.terminal.write(message)
-                self.log_file.write(message)
-                self.log_file.flush() # Ensure it's written immediately
+            self.terminal.write(message)
         except Exception:
              pass # Prevent crashes on logging errors
+        self.log_file.write(message) # Solo encola: el hilo de la GUI nunca espera al disco
 
     def flush(self):
+        # print(flush=True) llega aquí en cada línea: el fichero se vuelca por bloques en su hilo
         if self.enabled:
             self.terminal.flush()
+
+    def capture_exceptions(self):
+        """Escribe en el registro (y vuelca a disco) las excepciones no capturadas antes de delegarlas."""
+        previous_hook = sys.excepthook
+
+        def hook(exc_type, exc, tb):
+            self.log_file.write("".join(traceback.format_exception(exc_type, exc, tb)))
             self.log_file.flush()
+            previous_hook(exc_type, exc, tb)
+        sys.excepthook = hook
+
+    def close(self):
+        """Restaura sys.stdout y escribe lo pendiente."""
+        if sys.stdout is self:
+            sys.stdout = self.terminal
+        self.log_file.close()
+
+class ArenaServerView:
+    """The slice of the GameServer interface AIAgent.get_move uses, over one board (live or a snapshot)."""
+    def __init__(self, board_state, grid_size, realtime_mode, player):
+        self.board = board_state
+        self.player = player
+        self.grid_size = grid_size
+        self.realtime_mode = realtime_mode
+        
+    def get_valid_actions(self):
+        valid = []
+        # Place actions (sample)
+        empty_cells = []
+        for y in range(self.grid_size):
+            for x in range(self.grid_size):
+                if (x, y) not in self.board.stones:
+                    empty_cells.append((x,y))
+        
+        sample_cells = random.sample(empty_cells, min(10, len(empty_cells))) if len(empty_cells) > 0 else []
+        for (x, y) in sample_cells:
+            for st in ["PRISM", "MIRROR", "SPLITTER", "BLOCKER"]:
+                valid.append({"type": "place", "x": x, "y": y, "stone_type": st})
+                
+        # Rotate actions
+        for pos, stone in self.board.stones.items():
+            if stone.player == self.player: 
+                valid.append({"type": "rotate", "x": pos[0], "y": pos[1], "angle": 90})
+                
+                # Move actions (all 8 directions + wrapping)
+                if self.realtime_mode:
+                    directions = [
+                        (0, -1), (0, 1), (-1, 0), (1, 0),  # Cardinal
+                        (-1, -1), (1, -1), (-1, 1), (1, 1)  # Diagonal
+                    ]
+                    for dx, dy in directions:
+                        nx = (pos[0] + dx) % self.grid_size
+                        ny = (pos[1] + dy) % self.grid_size
+                        if (nx, ny) not in self.board.stones:
+                            valid.append({"type": "move", "from_x": pos[0], "from_y": pos[1], "to_x": nx, "to_y": ny})
+                    
+                    # Curve move actions (quadratic Bezier with random control point)
+                    import math
+                    for _ in range(2):  # 2 random curve options per stone
+                        angle = random.uniform(0, 2 * math.pi)
+                        radius = random.randint(1, min(3, self.grid_size // 4))
+                        cx = pos[0] + radius * math.cos(angle)
+                        cy = pos[1] + radius * math.sin(angle)
+                        ex = int(round(pos[0] + 2 * radius * math.cos(angle))) % self.grid_size
+                        ey = int(round(pos[1] + 2 * radius * math.sin(angle))) % self.grid_size
+                        if (ex, ey) not in self.board.stones:
+                            valid.append({
+                                "type": "curve_move",
+                                "from_x": pos[0], "from_y": pos[1],
+                                "control_x": round(cx, 1), "control_y": round(cy, 1),
+                                "end_x": ex, "end_y": ey
+                            })
+                
+        return {"valid_actions": valid}
+    
+    def sample_valid_actions(self, k_per_type=None, rng=None):
+        return sample_valid_actions(self.board, self.player, k_per_type, rng, self.realtime_mode)
 
 class ArenaWindow(MainWindow):
-    def __init__(self, p1_model="gemma3:4b", p2_model="gemma3:4b", use_all_playbooks=True):
+    def __init__(self, p1_model="gemma3:4b", p2_model="gemma3:4b", use_all_playbooks=True, cache=None,
+                 tick_rate=2.0, frame_rate=60, log_level=None, log_max_bytes=10 * 1024 * 1024, log_backups=5,
+                 log_compress=True):
         super().__init__()
         
         # --- CONFIGURAR LOGGING ---
         if not os.path.exists("logs"):
             os.makedirs("logs")
         log_filename = f"logs/match_{time.strftime('%Y%m%d-%H%M%S')}.txt"
-        self.logger = DualLogger(log_filename)
+        self.logger = DualLogger(log_filename, max_bytes=log_max_bytes, backup_count=log_backups, compress=log_compress)
         sys.stdout = self.logger
+        self.logger.capture_exceptions()
+        # Los agentes registran con logging: mismo destino que los print (terminal + fichero)
+        log_config.configure(log_level, default="INFO", stream=self.logger, fmt="%(message)s")
         print(f"=== INICIO DE REGISTRO EN: {log_filename} ===")
         
         self.setWindowTitle("GoLuminamics - AI Arena")
         
         # Configurar agentes
         # use_all_playbooks determina si cargamos 1 o 20 estrategias
-        self.p1_agent = AIAgent(1, p1_model, mechanics_path="MECHANICS.md", use_all_playbooks=use_all_playbooks)
-        self.p2_agent = AIAgent(2, p2_model, mechanics_path="MECHANICS.md", use_all_playbooks=use_all_playbooks)
+        # cache (LLMResponseCache) es opcional y compartido por ambos agentes
+        self.p1_agent = AIAgent(1, p1_model, mechanics_path="MECHANICS.md", use_all_playbooks=use_all_playbooks, cache=cache)
+        self.p2_agent = AIAgent(2, p2_model, mechanics_path="MECHANICS.md", use_all_playbooks=use_all_playbooks, cache=cache)
         self.agents = {1: self.p1_agent, 2: self.p2_agent}
+        self._record_models(self.recorder)
         
         # Timer para el bucle de juego
         self.turn_timer = QTimer(self)
         self.turn_timer.timeout.connect(self.play_next_turn)
         # NO iniciamos el timer automáticamente
         
+        # Realtime: fixed-rate simulation ticks, drawn (and interpolated) at display rate
+        self.sim_loop = FixedStepLoop(self.realtime_step, tick_rate=tick_rate)
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setInterval(max(1, int(1000 / frame_rate)))
+        self.frame_timer.timeout.connect(self.render_frame)
+        
         self.is_thinking = False
+        # Realtime decisions run on worker threads; ticks apply the ones that have arrived
+        self.agent_moves = AgentMoves(self)
         
         # Iniciar modo infinito de energía por defecto
         self.board.board_state.infinite_energy = True
@@ -102,8 +203,27 @@ class ArenaWindow(MainWindow):
         
         print(f"Arena Inicializada. Modelos: {p1_model} vs {p2_model}. All Playbooks: {use_all_playbooks}")
 
+    def _create_recorder(self):
+        """Arena matches stream every turn to disk so a crash does not lose the game."""
+        if not os.path.exists("games"):
+            os.makedirs("games")
+        stream_path = f"games/arena_match_{time.strftime('%Y%m%d-%H%M%S')}.jsonl.gz"
+        # Windows opened, restarted or resized without a match played leave no empty log behind
+        recorder = GameRecorder(player1_name="Player 1", player2_name="Player 2", grid_size=self.board.grid_size,
+                                stream_path=stream_path, compression="gzip", discard_empty=True)
+        if hasattr(self, "agents"): # The first recorder is created before the agents
+            self._record_models(recorder)
+        return recorder
+    
+    def _record_models(self, recorder):
+        """Note each side's model and playbook in the game metadata (indexed by the game library and analytics)."""
+        settings = recorder.metadata.setdefault("game_settings", {})
+        settings["models"] = {str(pid): agent.model_name for pid, agent in self.agents.items()}
+        settings["playbooks"] = {str(pid): agent.playbook_name for pid, agent in self.agents.items()}
+        recorder.stream.write_metadata(recorder.metadata)
+    
     def toggle_match(self):
-        if self.turn_timer.isActive():
+        if self.turn_timer.isActive() or self.frame_timer.isActive():
             self.stop_match()
         else:
             self.start_match()
@@ -122,8 +242,11 @@ class ArenaWindow(MainWindow):
         print("Iniciando partida IA...")
         if self.realtime_mode:
             self.realtime_elapsed = 0.0
-            self.turn_timer.start(500)  # 500ms realtime ticks
-            print("REALTIME: 500ms tick, both players each tick")
+            self.sim_loop.reset()
+            self.sim_loop.start()
+            self.board.interpolate_moves = True
+            self.frame_timer.start()
+            print(f"REALTIME: {self.sim_loop.dt * 1000:.0f}ms tick, both players each tick")
         else:
             self.turn_timer.start(2000)  # 2s per turn (classic)
         self.start_btn.setText("PAUSE AI MATCH")
@@ -132,6 +255,11 @@ class ArenaWindow(MainWindow):
     def stop_match(self):
         print("Pausando partida IA...")
         self.turn_timer.stop()
+        self.frame_timer.stop()
+        self.sim_loop.pause()
+        self.agent_moves.cancel_all() # Decisions for the paused board are not applied on resume
+        self.board.settle_motion()
+        self.board.interpolate_moves = False
         self.start_btn.setText("RESUME AI MATCH")
         self.start_btn.setStyleSheet("background-color: #007ACC; font-weight: bold; padding: 10px;")
 
@@ -173,13 +301,23 @@ class ArenaWindow(MainWindow):
             if is_enabled:
                 print(f"=== REGISTRO {status} ===")
 
+    def _finish_if_game_over(self):
+        """Stop the match loops and save once the game has ended. Returns True if it has."""
+        if not self.board.board_state.game_over:
+            return False
+        self.turn_timer.stop()
+        self.frame_timer.stop()
+        self.sim_loop.pause()
+        self.agent_moves.cancel_all()
+        self.board.settle_motion()
+        self.start_btn.setText("MATCH FINISHED")
+        self.start_btn.setEnabled(False)
+        print("Juego terminado. Guardando partida...")
+        self.auto_save_game()
+        return True
+
     def play_next_turn(self):
-        if self.board.board_state.game_over:
-            self.turn_timer.stop()
-            self.start_btn.setText("MATCH FINISHED")
-            self.start_btn.setEnabled(False)
-            print("Juego terminado. Guardando partida...")
-            self.auto_save_game()
+        if self._finish_if_game_over():
             return
             
         if self.is_thinking:
@@ -189,88 +327,65 @@ class ArenaWindow(MainWindow):
         QApplication.processEvents()
         
         try:
-            if self.realtime_mode:
-                # REALTIME: Both players act each tick
-                self.realtime_elapsed += 0.5  # 500ms per tick
-                for pid in [1, 2]:
-                    self._play_one_agent(pid)
-            else:
-                # CLASSIC: Alternating turns
-                current_pid = self.board.current_player
-                self._play_one_agent(current_pid)
+            # CLASSIC: Alternating turns
+            current_pid = self.board.current_player
+            self._play_one_agent(current_pid)
                 
         except Exception as e:
             print(f"Error en turno de IA: {e}")
-            if not self.realtime_mode:
-                self.handle_pass()
+            self.handle_pass()
         finally:
             self.is_thinking = False
 
+    def render_frame(self):
+        """Display-rate callback: run the simulation ticks that are due, then draw."""
+        self.sim_loop.advance()
+        self.board.render_interpolated(self.sim_loop.alpha)
+
+    def realtime_step(self, dt):
+        """
+        One fixed simulation tick of realtime mode: each player applies the
+        decision that has arrived from its worker (if any) and asks for the next.
+        The agents think off the GUI thread, so a tick never waits on a model.
+        """
+        if self._finish_if_game_over():
+            return
+
+        self.board.settle_motion() # Last tick's moves have finished sliding
+        self.realtime_elapsed += dt
+        for pid in [1, 2]:
+            try:
+                if self.agent_moves.has_move(pid):
+                    self._apply_realtime_move(pid, self.agent_moves.take(pid))
+            except Exception as e:
+                print(f"Error en turno de IA: {e}")
+            if self.board.board_state.game_over:
+                return
+            if not self.agent_moves.is_pending(pid) and not self.agent_moves.has_move(pid):
+                # The agent reads a snapshot: the live board keeps changing while it thinks
+                view = ArenaServerView(self.board.board_state.clone(), self.board.grid_size, self.realtime_mode, pid)
+                self.agent_moves.request(pid, self.agents[pid], view)
+
+    def _apply_realtime_move(self, pid, action):
+        """Apply a decision from the worker for pid; the board re-validates it against the live state."""
+        if not action or action.get("type") == "pass":
+            return # In realtime mode, pass is acceptable (stone stays still)
+        agent = self.agents[pid]
+        if "thought" in action:
+            print(f"💭 PENSAMIENTO ({agent.model_name}): {action['thought']}")
+        self.board.current_player = pid # Ownership checks in execute_ai_move use the acting player
+        if not self.execute_ai_move(action):
+            print(f"Movimiento {action.get('type')} fallido (Jugador {pid}).")
+
     def _play_one_agent(self, current_pid):
-        """Execute one AI agent's turn (used by both classic and realtime modes)."""
+        """Execute one AI agent's turn synchronously (classic mode)."""
         agent = self.agents[current_pid]
         
         if not self.realtime_mode:
             print(f"Turno de IA Jugador {current_pid} ({agent.model_name})...")
         
-        class DummyServer:
-            def __init__(self, board_state, grid_size, realtime_mode):
-                self.board = board_state
-                self.grid_size = grid_size
-                self.realtime_mode = realtime_mode
-                
-            def get_valid_actions(self):
-                valid = []
-                # Place actions (sample)
-                empty_cells = []
-                for y in range(self.grid_size):
-                    for x in range(self.grid_size):
-                        if (x, y) not in self.board.stones:
-                            empty_cells.append((x,y))
-                
-                sample_cells = random.sample(empty_cells, min(10, len(empty_cells))) if len(empty_cells) > 0 else []
-                for (x, y) in sample_cells:
-                    for st in ["PRISM", "MIRROR", "SPLITTER", "BLOCKER"]:
-                        valid.append({"type": "place", "x": x, "y": y, "stone_type": st})
-                        
-                # Rotate actions
-                for pos, stone in self.board.stones.items():
-                    if stone.player == current_pid: 
-                        valid.append({"type": "rotate", "x": pos[0], "y": pos[1], "angle": 90})
-                        
-                        # Move actions (all 8 directions + wrapping)
-                        if self.realtime_mode:
-                            directions = [
-                                (0, -1), (0, 1), (-1, 0), (1, 0),  # Cardinal
-                                (-1, -1), (1, -1), (-1, 1), (1, 1)  # Diagonal
-                            ]
-                            for dx, dy in directions:
-                                nx = (pos[0] + dx) % self.grid_size
-                                ny = (pos[1] + dy) % self.grid_size
-                                if (nx, ny) not in self.board.stones:
-                                    valid.append({"type": "move", "from_x": pos[0], "from_y": pos[1], "to_x": nx, "to_y": ny})
-                            
-                            # Curve move actions (quadratic Bezier with random control point)
-                            import math
-                            for _ in range(2):  # 2 random curve options per stone
-                                angle = random.uniform(0, 2 * math.pi)
-                                radius = random.randint(1, min(3, self.grid_size // 4))
-                                cx = pos[0] + radius * math.cos(angle)
-                                cy = pos[1] + radius * math.sin(angle)
-                                ex = int(round(pos[0] + 2 * radius * math.cos(angle))) % self.grid_size
-                                ey = int(round(pos[1] + 2 * radius * math.sin(angle))) % self.grid_size
-                                if (ex, ey) not in self.board.stones:
-                                    valid.append({
-                                        "type": "curve_move",
-                                        "from_x": pos[0], "from_y": pos[1],
-                                        "control_x": round(cx, 1), "control_y": round(cy, 1),
-                                        "end_x": ex, "end_y": ey
-                                    })
-                        
-                return {"valid_actions": valid}
-
         # The Grid Size se pasa actualizado aquí cada turno
-        dummy_server = DummyServer(self.board.board_state, self.board.grid_size, self.realtime_mode)
+        dummy_server = ArenaServerView(self.board.board_state, self.board.grid_size, self.realtime_mode, current_pid)
         
         # RETRY LOOP (Max 3 attempts to avoid passing)
         max_retries = 3
@@ -384,11 +499,12 @@ class ArenaWindow(MainWindow):
                 
                 stone = self.board.board_state.get_stone_at(from_pos)
                 if stone and stone.player == self.board.current_player:
+                    _, path = self.board.board_state.trace_curve(from_pos, control_points)
                     final_pos = self.board.board_state.move_stone_along_curve(
                         from_pos, control_points, self.board.current_player
                     )
                     if final_pos is not None:
-                        self.board.move_stone_visual(from_pos, final_pos)
+                        self.board.move_stone_visual(from_pos, final_pos, path=path)
                         if not self.realtime_mode:
                             self.board.end_turn()
                         return True
@@ -406,7 +522,10 @@ class ArenaWindow(MainWindow):
                     
                 start = (x, y)
                 direction = (dx, dy)
-                self.handle_laser_mouse(start, direction, self.board.current_player)
+                # Synchronous: the next AI turn must see this shot's captures
+                player = self.board.current_player
+                captured = self.board.shoot_laser(start, direction, player)
+                self.on_laser_fired(start, direction, player, captured)
                 return True
 
             elif action_type == "select":
@@ -436,15 +555,35 @@ class ArenaWindow(MainWindow):
         if not os.path.exists("games"):
             os.makedirs("games")
             
-        timestamp = time.strftime("%Y%m%d-%H%M%S")
-        filename = f"games/arena_match_{timestamp}.json"
+        # The match was streamed as it was played; finalise that log rather than expanding it to V2 JSON
+        filename = self.recorder.stream.path
         
         try:
-            self.recorder.save_game(filename)
-            print(f"Partida guardada automáticamente en: {filename}")
-            QMessageBox.information(self, "Arena Finalizada", f"Juego terminado.\nGuardado en: {filename}")
+            self.saver.save(self.recorder, filename, kind="auto") # Snapshots (flushes) the stream now
         except Exception as e:
             print(f"Error guardando partida: {e}")
+        finally:
+            # Saving the stream onto itself writes nothing: close it so the gzip trailer is written
+            self.recorder.close()
+
+    def on_game_saved(self, kind, file_name):
+        if kind != "auto":
+            return super().on_game_saved(kind, file_name)
+        print(f"Partida guardada automáticamente en: {file_name}")
+        QMessageBox.information(self, "Arena Finalizada", f"Juego terminado.\nGuardado en: {file_name}")
+
+    def on_save_failed(self, kind, file_name, error):
+        if kind != "auto":
+            return super().on_save_failed(kind, file_name, error)
+        print(f"Error guardando partida: {error}")
+
+    def closeEvent(self, event):
+        """Stop the match and finish its log (deleted if no turn was played) once queued saves are written."""
+        self.turn_timer.stop()
+        self.frame_timer.stop()
+        self.agent_moves.cancel_all()
+        super().closeEvent(event)
+        self.recorder.close()
 
 if __name__ == "__main__":
     import argparse
@@ -452,9 +591,35 @@ if __name__ == "__main__":
     parser.add_argument("--p1", type=str, default="gemma3:4b", help="Model for Player 1")
     parser.add_argument("--p2", type=str, default="gemma3:4b", help="Model for Player 2")
     parser.add_argument("--single-strategy", action="store_true", help="If set, AI selects ONE random strategy instead of all.")
+    parser.add_argument("--cache", type=str, default=None, help="Path to the SQLite LLM response cache")
+    parser.add_argument("--replay", action="store_true", help="Serve moves only from the cache (offline, no model server)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible prompts and fallbacks")
+    parser.add_argument("--tick-rate", type=float, default=2.0, help="Realtime simulation ticks per second")
+    parser.add_argument("--fps", type=int, default=60, help="Realtime display refresh rate")
+    parser.add_argument("--profile", type=str, default=None, metavar="DIR",
+                        help="Write timing summaries and a Chrome trace of the session to DIR")
+    parser.add_argument("--profile-interval", type=float, default=10.0, help="Seconds between summary rewrites")
+    parser.add_argument("--log-level", type=str, default=None,
+                        help="Log levels, e.g. 'DEBUG' or 'INFO,_02_engines.ai_player=DEBUG' (prompts are DEBUG)")
+    parser.add_argument("--log-max-mb", type=float, default=10.0, help="Rotate the match log at this size")
+    parser.add_argument("--log-backups", type=int, default=5, help="Rotated match logs to keep")
+    parser.add_argument("--no-log-gzip", action="store_true", help="Keep rotated match logs uncompressed")
     
     args = parser.parse_args()
     
+    if args.seed is not None:
+        random.seed(args.seed)
+    
+    profiler = None
+    if args.profile:
+        instrumentation.enable(trace=True)
+        profiler = instrumentation.PeriodicSummary(os.path.join(args.profile, "summary.json"), args.profile_interval)
+        profiler.start()
+    
+    cache = None
+    if args.cache or args.replay:
+        cache = LLMResponseCache(args.cache or "cache/llm_cache.sqlite", replay=args.replay)
+    
     app = QApplication(sys.argv)
     
     # Estilos (copiados de main_game o importados si fuera posible reutilizar stylesheet)
@@ -466,7 +631,17 @@ if __name__ == "__main__":
     # Por defecto use_all_playbooks es True, a menos que se pase --single-strategy
     use_all = not args.single_strategy
     
-    window = ArenaWindow(args.p1, args.p2, use_all_playbooks=use_all)
+    window = ArenaWindow(args.p1, args.p2, use_all_playbooks=use_all, cache=cache,
+                         tick_rate=args.tick_rate, frame_rate=args.fps, log_level=args.log_level,
+                         log_max_bytes=int(args.log_max_mb * 1024 * 1024), log_backups=args.log_backups,
+                         log_compress=not args.no_log_gzip)
     window.show()
     
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    if profiler is not None:
+        profiler.stop()
+        trace_path = os.path.join(args.profile, f"trace_{time.strftime('%Y%m%d-%H%M%S')}.json")
+        instrumentation.write_chrome_trace(trace_path)
+        print(f"Perfil guardado en: {args.profile} (abrir {trace_path} en chrome://tracing)")
+    window.logger.close()
+    sys.exit(exit_code)
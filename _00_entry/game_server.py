@@ -5,20 +5,28 @@ Game Server for Rust RL Agent
 Provides a JSON IPC interface to the full Python game logic.
 
 Protocol:
-    Rust -> Python (stdin): {"command": "reset/step/get_valid_actions", ...}
+    Rust -> Python (stdin): {"command": "reset/step/get_valid_actions/sample_valid_actions", ...}
     Python -> Rust (stdout): {"observation": [...], "reward": ..., "done": ..., ...}
 
+Failed steps carry an "error" with the reason. Diagnostics go to stderr
+through logging (--log-level, e.g. "INFO,_01_core_logic.board_state=DEBUG"),
+never to stdout.
+
 Usage:
-    python -m _00_entry.game_server
+    python -m _00_entry.game_server [--log-level WARNING]
 """
 
 import sys
 import json
+import argparse
 import math
+import random
 from typing import Optional, Dict, Any, List, Tuple
 
 from _01_core_logic.board_state import BoardState2D, StoneType, StoneData2D
+from _01_core_logic import instrumentation, log_config
 from _02_engines.laser import LaserCalculator2D
+from _02_engines.action_sampler import sample_valid_actions
 
 
 class GameServer:
@@ -63,6 +71,7 @@ class GameServer:
             "info": {"grid_size": self.grid_size, "realtime_mode": self.realtime_mode}
         }
     
+    @instrumentation.timed("server.step")
     def step(self, action: Dict[str, Any]) -> Dict[str, Any]:
         """Execute an action and return result."""
         if self.board is None:
@@ -81,6 +90,7 @@ class GameServer:
         success = False
         reward = 0.0
         turn_ended = True # Default to true for most actions
+        error = None
         
         if action_type == "select":
             # Handle selection - does not end turn
@@ -104,6 +114,8 @@ class GameServer:
             if success:
                 self.board.reset_passes()
                 reward = 0.01  # Small reward for valid placement
+            else:
+                error = self.board.last_rejection
                 
         elif action_type == "rotate":
             x, y = action.get("x", 0), action.get("y", 0)
@@ -113,6 +125,8 @@ class GameServer:
                 self.board.set_rotation_to((x, y), angle)
                 success = True
                 reward = 0.005  # Small reward for rotation
+            else:
+                error = f"No stone of player {player} at {(x, y)}"
                 
         elif action_type == "laser":
             x, y = action.get("x", 0), action.get("y", 0)
@@ -141,6 +155,10 @@ class GameServer:
                 if wrapped is not None:
                     success = True
                     reward = 0.01
+                else:
+                    error = self.board.last_rejection
+            else:
+                error = f"No stone of player {player} at {from_pos}"
         
         elif action_type == "curve_move":
             from_x = action.get("from_x", 0)
@@ -157,6 +175,10 @@ class GameServer:
                 if final_pos is not None:
                     success = True
                     reward = 0.02  # Slightly higher reward for curved movement
+                else:
+                    error = self.board.last_rejection
+            else:
+                error = f"No stone of player {player} at {from_pos}"
             
         elif action_type == "pass":
             self.board.pass_turn(player)
@@ -170,6 +192,7 @@ class GameServer:
             self.current_player = 3 - self.current_player  # Switch: 1->2, 2->1
         else:
             reward = -0.1  # Penalty for invalid action
+            error = error or f"Unknown action type: {action_type}"
         
         # Check victory conditions
         self._check_victory()
@@ -187,7 +210,7 @@ class GameServer:
             else:
                 reward -= 10.0
         
-        return {
+        result = {
             "observation": self._get_observation(),
             "reward": reward,
             "done": self.game_over,
@@ -199,7 +222,11 @@ class GameServer:
                 "action_success": success
             }
         }
+        if error:
+            result["error"] = error
+        return result
     
+    @instrumentation.timed("server.get_valid_actions")
     def get_valid_actions(self) -> Dict[str, Any]:
         """Get list of valid actions for current player."""
         if self.board is None:
@@ -283,6 +310,17 @@ class GameServer:
         
         return {"valid_actions": valid, "count": len(valid)}
     
+    def sample_valid_actions(self, k_per_type=None, rng=None) -> Dict[str, Any]:
+        """Draw up to k valid actions per type without building the full list.
+        
+        Args:
+            k_per_type: int for every type, or dict {action_type: k}
+            rng: random.Random for reproducible draws (defaults to the random module)
+        """
+        if self.board is None:
+            return {"error": "Game not initialized"}
+        return sample_valid_actions(self.board, self.current_player, k_per_type, rng, self.realtime_mode)
+    
     def _get_observation(self) -> List[float]:
         """Get flattened observation vector."""
         if self.board is None:
@@ -326,6 +364,13 @@ class GameServer:
             self.victory_reason = result.get("reason", "victory")
             return
         
+        # Board-level endings (mutual pass, mercy rule) are flagged on the board itself
+        if self.board.game_over:
+            self.game_over = True
+            self.winner = self.board.winner if self.board.winner else None  # 0 = tie
+            self.victory_reason = self.board.victory_reason
+            return
+        
         # Check max turns
         if self.turn_count >= self.max_turns:
             self.game_over = True
@@ -343,6 +388,13 @@ class GameServer:
 
 def main():
     """Main server loop - reads JSON from stdin, writes to stdout."""
+    parser = argparse.ArgumentParser(description="GoLuminamics JSON IPC game server")
+    parser.add_argument("--log-level", type=str, default=None,
+                        help="Log levels for stderr, e.g. 'INFO,_01_core_logic.board_state=DEBUG'")
+    args = parser.parse_args()
+    # stdout is the protocol channel: diagnostics only ever go to stderr
+    log_config.configure(args.log_level, default="WARNING", stream=sys.stderr)
+    
     server = GameServer(grid_size=19)
     
     # Send ready signal
@@ -361,6 +413,10 @@ def main():
                 response = server.step(action)
             elif command == "get_valid_actions":
                 response = server.get_valid_actions()
+            elif command == "sample_valid_actions":
+                seed = request.get("seed")
+                rng = random.Random(seed) if seed is not None else None
+                response = server.sample_valid_actions(request.get("k_per_type"), rng)
             elif command == "quit":
                 print(json.dumps({"status": "goodbye"}), flush=True)
                 break
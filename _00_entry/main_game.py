@@ -12,6 +12,7 @@ from PySide6.QtCore import Qt
 from _03_ui.game_board import GameBoard
 from _03_ui.controls import UIControls
 from _01_core_logic.recorder import GameRecorder
+from _03_ui.save_worker import GameSaver
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -47,7 +48,13 @@ class MainWindow(QMainWindow):
         self.board = GameBoard(territory_threshold=initial_threshold)
         
         # Initialize Recorder
-        self.recorder = GameRecorder(player1_name="Player 1", player2_name="Player 2", grid_size=self.board.grid_size)
+        self.recorder = self._create_recorder()
+        
+        # Saves are written in the background; checkpoint every N recorded turns (0 = off)
+        self.saver = GameSaver(self)
+        self.saver.saved.connect(self.on_game_saved)
+        self.saver.save_failed.connect(self.on_save_failed)
+        self.checkpoint_every = self.board.autosave_config.get("checkpoint_every_turns", 0)
         
         layout.addWidget(self.board, stretch=1)
         layout.addWidget(self.controls, stretch=0)
@@ -64,11 +71,13 @@ class MainWindow(QMainWindow):
         self.controls.grid_size_changed.connect(self.handle_grid_size_change)
         self.controls.infinite_energy_changed.connect(self.handle_infinite_energy_change)
         self.controls.infinite_score_changed.connect(self.handle_infinite_score_change)
+        self.controls.territory_overlay_toggled.connect(self.board.set_territory_overlay_visible)
         
         # Connect stone placement to update energy display
         self.board.stone_placed.connect(self.on_stone_placed)
         self.board.stone_rotated.connect(self.on_stone_rotated)
         self.board.laser_input.connect(self.handle_laser_mouse)
+        self.board.laser_fired.connect(self.on_laser_fired)
         self.controls.manual_place.connect(self.handle_manual_place) # Connect manual placement
         
         # Connect control signals
@@ -90,6 +99,10 @@ class MainWindow(QMainWindow):
         # Initial energy display
         self.update_energy_display()
         
+    def _create_recorder(self):
+        """Create the game recorder (subclasses may enable streaming)."""
+        return GameRecorder(player1_name="Player 1", player2_name="Player 2", grid_size=self.board.grid_size)
+    
     def _record_action(self, action_type, params, description):
         """Helper to record an action to the log."""
         # Calculate reward (simple score difference for now)
@@ -107,6 +120,17 @@ class MainWindow(QMainWindow):
             terminal=self.board.board_state.game_over,
             event_log=[description, f"Score: P1={p1_score}, P2={p2_score}"]
         )
+        self._maybe_checkpoint()
+    
+    def _maybe_checkpoint(self):
+        """Every checkpoint_every turns, save a copy of the game in the background so a crash loses little."""
+        if not self.checkpoint_every or self.recorder.stream:
+            return # Streaming recorders are already on disk turn by turn
+        if (self.recorder.current_turn - 1) % self.checkpoint_every:
+            return
+        if self.saver.pending("checkpoint"):
+            return # Still writing the previous one; the next checkpoint will catch up
+        self.saver.save(self.recorder, f"games/{self.recorder.game_id}.autosave.json", kind="checkpoint")
     
     def on_stone_placed(self, pos, stone_type):
         """Handle stone placement updates."""
@@ -196,7 +220,8 @@ class MainWindow(QMainWindow):
         self.controls.emit_timer_settings()
         
         # Reset recorder
-        self.recorder = GameRecorder(player1_name="Player 1", player2_name="Player 2", grid_size=self.board.grid_size)
+        self.recorder.close()
+        self.recorder = self._create_recorder()
         
         self.update_energy_display()
         self.controls.update_score(0, 0)
@@ -265,7 +290,8 @@ class MainWindow(QMainWindow):
         
     def handle_save_game(self):
         """Save the current game state."""
-        file_name, _ = QFileDialog.getSaveFileName(self, "Save Game", "", "JSON Files (*.json)")
+        file_name, _ = QFileDialog.getSaveFileName(self, "Save Game", "",
+                                                   "JSON Files (*.json);;Compressed Game Logs (*.jsonl.gz);;JSON Lines (*.jsonl)")
         if file_name:
             try:
                 # Save theme in metadata
@@ -273,12 +299,26 @@ class MainWindow(QMainWindow):
                     self.recorder.metadata["game_settings"] = {}
                 self.recorder.metadata["game_settings"]["theme"] = self.board.current_theme
                 
-                # Use the recorder to save the full log
-                self.recorder.save_game(file_name)
-                print(f"Game saved to {file_name}")
+                # Serialised in the background; the result arrives in on_game_saved / on_save_failed
+                self.saver.save(self.recorder, file_name, kind="manual")
             except Exception as e:
-                print(f"Error saving game: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to save game: {str(e)}")
+                self.on_save_failed("manual", file_name, str(e))
+    
+    def on_game_saved(self, kind, file_name):
+        """A background save finished."""
+        if kind != "checkpoint":
+            print(f"Game saved to {file_name}")
+    
+    def on_save_failed(self, kind, file_name, error):
+        """A background save failed (a checkpoint failure is only reported on the console)."""
+        print(f"Error saving game to {file_name}: {error}")
+        if kind != "checkpoint":
+            QMessageBox.critical(self, "Error", f"Failed to save game: {error}")
+    
+    def closeEvent(self, event):
+        """Let queued saves reach the disk before the window goes away."""
+        self.saver.wait(10000)
+        super().closeEvent(event)
 
     def update_energy_display(self):
         """Update energy display in UI."""
@@ -304,11 +344,15 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 print(f"Error parsing command: {e}")
     
-    def handle_laser_mouse(self, start, direction, player):
-        """Handle laser input from mouse."""
+    def handle_laser_mouse(self, start, direction, player=None):
+        """Handle laser input from mouse (traced off the GUI thread, finished in on_laser_fired)."""
+        if player is None:
+            player = self.board.current_player # The Shoot button does not send a player
+        self.board.shoot_laser_async(start, direction, player)
+    
+    def on_laser_fired(self, start, direction, player, captured):
+        """Record a completed laser shot and refresh score displays."""
         try:
-            captured = self.board.shoot_laser(start, direction, player)
-            
             # Record the move
             self._record_action(
                 "laser",
@@ -8,15 +8,58 @@ Description: Source file.
 
 import sys
 import os
+import time
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QHBoxLayout, 
                                QVBoxLayout, QPushButton, QLabel, QFileDialog, QTextEdit,
                                QLineEdit, QMessageBox, QFrame, QSlider, QComboBox)
 from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QPalette, QLinearGradient, QPainterPath
 from PySide6.QtCore import Qt, QPointF, QTimer
 from _03_ui.game_board import GameBoard
+from _03_ui.library_dialog import GameLibraryDialog
 from _01_core_logic.recorder import GameRecorder
+from _01_core_logic.game_log import GameLogIndex, LazyGameLog
 from _02_engines.laser import LaserCalculator2D
 
+FIRST_MOVES = 50     # Turns indexed before a lazily loaded game is shown
+INDEX_BATCH = 5      # Turns indexed between deadline checks
+INDEX_SLICE_MS = 30  # Event-loop time spent indexing per timer tick
+
+
+def move_from_turn(turn, state):
+    """
+    Summarize a V2 turn as a replay move.
+    
+    state only needs the snapshot's scalar fields (player_captures), so a
+    LazyGameLog summary works as well as a full state_t.
+    """
+    action_data = turn.get('agent_action') or {}
+    params = action_data.get('params') or {}
+    
+    # Helper to get from params or action_data
+    def get_val(key, default=None):
+        return params.get(key, action_data.get(key, default))
+
+    move = {
+        "turn": turn.get('turn_id'),
+        "player": get_val('player', 1),
+        "action": action_data.get('type'),
+        "position": get_val('position'),
+        "stone_type": get_val('stone_type'),
+        "direction": get_val('direction'),
+        "angle": get_val('angle'),
+        "comment": " ".join(turn.get('event_log') or []),
+    }
+    
+    # Per-player captures straight from the snapshot
+    if state and 'player_captures' in state:
+        curr_caps = state['player_captures']
+        move['p1_captures'] = int(curr_caps.get("1", 0))
+        move['p2_captures'] = int(curr_caps.get("2", 0))
+    else:
+        move['p1_captures'] = 0
+        move['p2_captures'] = 0
+    return move
+
 class CaptureChart(QWidget):
     """Visual area chart showing captures over time."""
     def __init__(self):
@@ -202,6 +245,8 @@ class ReplayControls(QWidget):
         # Load Game Button
         self.load_btn = QPushButton("Load Game File")
         self.layout.addWidget(self.load_btn)
+        self.library_btn = QPushButton("Game Library")
+        self.layout.addWidget(self.library_btn)
         
         # Game Info
         self.info_label = QLabel("<i>No game loaded</i>")
@@ -260,6 +305,15 @@ class ReplayControls(QWidget):
         speed_layout.addWidget(self.speed_slider)
         self.layout.addLayout(speed_layout)
         
+        # Timeline (scrub to any move)
+        timeline_layout = QHBoxLayout()
+        timeline_layout.addWidget(QLabel("Timeline:"))
+        self.timeline_slider = QSlider(Qt.Horizontal)
+        self.timeline_slider.setRange(0, 0)
+        self.timeline_slider.setEnabled(False)
+        timeline_layout.addWidget(self.timeline_slider)
+        self.layout.addLayout(timeline_layout)
+        
         # Navigation Controls
         nav_layout = QHBoxLayout()
         
@@ -319,6 +373,10 @@ class ReplayerWindow(QMainWindow):
         
         # Game state
         self.game_data = None
+        self.game_log = None # Random access to recorded state_t snapshots (V2 logs)
+        self.index_timer = QTimer() # Reads the rest of a lazily loaded log between events
+        self.index_timer.setInterval(0)
+        self.index_timer.timeout.connect(self.index_step)
         self.current_move_index = 0
         self.laser_calc = LaserCalculator2D(grid_size=19)
         
@@ -329,6 +387,7 @@ class ReplayerWindow(QMainWindow):
         
         # Connect signals
         self.controls.load_btn.clicked.connect(self.load_game)
+        self.controls.library_btn.clicked.connect(self.open_library)
         self.controls.first_btn.clicked.connect(self.jump_to_first)
         self.controls.prev_btn.clicked.connect(self.previous_move)
         self.controls.next_btn.clicked.connect(self.next_move)
@@ -340,6 +399,7 @@ class ReplayerWindow(QMainWindow):
         self.controls.goto_btn.clicked.connect(self.jump_to_step)
         self.controls.step_input.returnPressed.connect(self.jump_to_step)
         self.controls.speed_slider.valueChanged.connect(self.update_speed)
+        self.controls.timeline_slider.valueChanged.connect(self.seek)
         self.controls.theme_combo.currentTextChanged.connect(self.board.set_theme)
         
         # Set default theme
@@ -390,100 +450,147 @@ class ReplayerWindow(QMainWindow):
             self,
             "Load Game File",
             default_dir,
-            "Game Files (*.json)"
+            "Game Files (*.json *.jsonl *.jsonl.gz *.jsonl.zst)"
         )
         
         if filename:
+            self.open_game(filename)
+    
+    def open_library(self):
+        """Pick a game from the game library index."""
+        dialog = GameLibraryDialog(parent=self)
+        if dialog.exec() and dialog.selected_path:
+            self.open_game(dialog.selected_path)
+    
+    def open_game(self, filename):
+        """
+        Load a game file and show its first move.
+        
+        V2 and streaming logs are read through LazyGameLog: the first moves
+        are indexed right away and the rest in short slices from the event
+        loop, so the board is usable before a long log is fully read and
+        snapshots are only decoded when a position is shown.
+        """
+        self.close_game_log()
+        try:
             try:
+                log = LazyGameLog(filename)
+            except ValueError:
+                log = None # Legacy "moves" file (or a V2 header we could not scan)
+            
+            if log is not None:
+                self.game_log = log
+                log.index_more(FIRST_MOVES)
+                self.game_data = {
+                    'game_id': log.game_id or "V2_Log",
+                    'players': self.apply_metadata(log.metadata),
+                    'grid_size': log.scalars[0].get('grid_size', 19) if log.scalars else 19,
+                    'moves': [],
+                }
+                self.append_moves()
+            else:
                 self.game_data = GameRecorder.load_game(filename)
                 
                 # Protocol V2 Support: Normalize to legacy format
                 if "turn_sequence" in self.game_data:
                     print("Detected Protocol V2 Log. Normalizing...")
-                    self.game_data['moves'] = []
-                    for turn in self.game_data['turn_sequence']:
-                        action_data = turn.get('agent_action') or {}
-                        params = action_data.get('params') or {}
-                        
-                        # Helper to get from params or action_data
-                        def get_val(key, default=None):
-                            return params.get(key, action_data.get(key, default))
-
-                        move = {
-                            "turn": turn.get('turn_id'),
-                            "player": get_val('player', 1),
-                            "action": action_data.get('type'),
-                            "position": get_val('position'),
-                            "stone_type": get_val('stone_type'),
-                            "direction": get_val('direction'),
-                            "angle": get_val('angle'),
-                            "comment": " ".join(turn.get('event_log') or []),
-                        }
-                        
-                        # Extract per-player captures directly from state_t
-                        state_t = turn.get('state_t')
-                        if state_t and 'player_captures' in state_t:
-                            curr_caps = state_t['player_captures']
-                            move['p1_captures'] = int(curr_caps.get("1", 0))
-                            move['p2_captures'] = int(curr_caps.get("2", 0))
-                        else:
-                            move['p1_captures'] = 0
-                            move['p2_captures'] = 0
-
-                        self.game_data['moves'].append(move)
-                    
-                    # Normalize Metadata
+                    turns = self.game_data['turn_sequence']
+                    self.game_data['moves'] = [move_from_turn(turn, turn.get('state_t')) for turn in turns]
                     if "metadata" in self.game_data:
-                        settings = self.game_data['metadata'].get('game_settings', {})
-                        self.game_data['players'] = [
-                            settings.get('player1', 'Player 1'),
-                            settings.get('player2', 'Player 2')
-                        ]
-                        
-                        # Load theme if available
-                        if "theme" in settings:
-                            theme = settings["theme"]
-                            # Block signal to avoid double update
-                            self.controls.theme_combo.blockSignals(True)
-                            self.controls.theme_combo.setCurrentText(theme)
-                            self.controls.theme_combo.blockSignals(False)
-                            self.board.set_theme(theme)
-                    
-                    self.game_data['total_turns'] = len(self.game_data['moves'])
-                    # Ensure game_id exists
-                    if 'game_id' not in self.game_data:
-                        self.game_data['game_id'] = "V2_Log"
-                        
-                    # Extract Grid Size from first turn if available
-                    if self.game_data.get('turn_sequence'):
-                         first_turn = self.game_data['turn_sequence'][0]
-                         state_t = first_turn.get('state_t', {})
-                         self.game_data['grid_size'] = state_t.get('grid_size', 19)
-                    else:
-                         self.game_data['grid_size'] = 19
+                        self.game_data['players'] = self.apply_metadata(self.game_data['metadata'])
+                    self.game_data.setdefault('game_id', "V2_Log")
+                    self.game_data['grid_size'] = (turns[0].get('state_t') or {}).get('grid_size', 19) if turns else 19
+                    self.game_log = GameLogIndex(data=self.game_data)
 
-                # Validate game data structure
-                if not self.game_data or 'moves' not in self.game_data:
-                    raise KeyError("Invalid game file format: missing 'moves' data")
-                
-                # Load chart data to show full graph immediately
-                self.controls.chart.set_data(self.game_data['moves'])
-                
-                # Update Board Grid Size
-                grid_size = self.game_data.get('grid_size', 19)
-                try:
-                    self.board.set_grid_size(grid_size)
-                except ValueError as e:
-                    QMessageBox.warning(self, "Warning", f"Invalid grid size in replay: {e}. Using default.")
-                
-                # Reset to beginning (don't auto-play)
-                self.reset_replay()
-                self.update_game_info()
-                self.enable_controls(True)
-            except Exception as e:
-                QMessageBox.critical(self, "Load Error", f"Failed to load game file:\n{str(e)}")
-                self.game_data = None
-                self.enable_controls(False)
+            # Validate game data structure
+            if not self.game_data or 'moves' not in self.game_data:
+                raise KeyError("Invalid game file format: missing 'moves' data")
+            self.game_data['total_turns'] = len(self.game_data['moves'])
+            
+            self.controls.timeline_slider.blockSignals(True)
+            self.controls.timeline_slider.setRange(0, len(self.game_data['moves']))
+            self.controls.timeline_slider.blockSignals(False)
+            
+            # Load chart data to show full graph immediately
+            self.controls.chart.set_data(self.game_data['moves'])
+            
+            # Update Board Grid Size
+            grid_size = self.game_data.get('grid_size', 19)
+            try:
+                self.board.set_grid_size(grid_size)
+            except ValueError as e:
+                QMessageBox.warning(self, "Warning", f"Invalid grid size in replay: {e}. Using default.")
+            
+            # Reset to beginning (don't auto-play)
+            self.reset_replay()
+            self.update_game_info()
+            self.enable_controls(True)
+            if log is not None and not log.complete:
+                self.index_timer.start()
+        except Exception as e:
+            QMessageBox.critical(self, "Load Error", f"Failed to load game file:\n{str(e)}")
+            self.close_game_log()
+            self.game_data = None
+            self.enable_controls(False)
+    
+    def apply_metadata(self, metadata):
+        """Apply the recorded theme and return the two player names."""
+        settings = metadata.get('game_settings', {})
+        if "theme" in settings:
+            theme = settings["theme"]
+            # Block signal to avoid double update
+            self.controls.theme_combo.blockSignals(True)
+            self.controls.theme_combo.setCurrentText(theme)
+            self.controls.theme_combo.blockSignals(False)
+            self.board.set_theme(theme)
+        return [settings.get('player1', 'Player 1'), settings.get('player2', 'Player 2')]
+    
+    def append_moves(self):
+        """Add move summaries for turns the lazy log indexed since the last call."""
+        moves = self.game_data['moves']
+        log = self.game_log
+        for i in range(len(moves), len(log)):
+            moves.append(move_from_turn(log.turns[i], log.scalars[i]))
+    
+    def index_step(self):
+        """Index the next slice of a lazily loaded log and grow the timeline."""
+        log = self.game_log
+        deadline = time.perf_counter() + INDEX_SLICE_MS / 1000
+        try:
+            while log.index_more(INDEX_BATCH) and time.perf_counter() < deadline:
+                pass
+        except Exception as e:
+            log.complete = True # Keep the turns read so far
+            QMessageBox.warning(self, "Load Warning", f"Stopped reading the game file:\n{str(e)}")
+        
+        self.append_moves()
+        moves = self.game_data['moves']
+        self.game_data['total_turns'] = len(moves)
+        self.controls.timeline_slider.blockSignals(True)
+        self.controls.timeline_slider.setRange(0, len(moves))
+        self.controls.timeline_slider.blockSignals(False)
+        self.controls.chart.set_data(moves)
+        
+        if log.complete:
+            self.index_timer.stop()
+            if self.is_playing and self.current_move_index >= len(moves):
+                self.next_move() # Playback was waiting for more moves
+        self.update_game_info()
+    
+    def still_indexing(self):
+        """True while a lazily loaded log is still being read."""
+        return self.index_timer.isActive()
+    
+    def close_game_log(self):
+        """Stop indexing and release the current log file."""
+        self.index_timer.stop()
+        if isinstance(self.game_log, LazyGameLog):
+            self.game_log.close()
+        self.game_log = None
+    
+    def closeEvent(self, event):
+        self.close_game_log()
+        super().closeEvent(event)
     
     def check_and_show_victory(self):
         """Check if game is over and show victory screen."""
@@ -529,11 +636,15 @@ class ReplayerWindow(QMainWindow):
         info = f"""<b>Game ID:</b> {self.game_data.get('game_id', 'Unknown')}<br>
 <b>Players:</b> {self.game_data['players'][0]} vs {self.game_data['players'][1]}<br>
 <b>Grid Size:</b> {grid_size}x{grid_size}<br>
-<b>Total Moves:</b> {self.game_data['total_turns']}<br>
+<b>Total Moves:</b> {self.game_data['total_turns']}{" (loading...)" if self.still_indexing() else ""}<br>
 <b>Current:</b> Move {self.current_move_index} of {len(self.game_data['moves'])}"""
         
         self.controls.info_label.setText(info)
         self.controls.chart.set_current_turn(self.current_move_index) # Update chart indicator
+        
+        self.controls.timeline_slider.blockSignals(True)
+        self.controls.timeline_slider.setValue(self.current_move_index)
+        self.controls.timeline_slider.blockSignals(False)
         self.update_score_display()
     
     def update_score_display(self):
@@ -570,6 +681,7 @@ class ReplayerWindow(QMainWindow):
                  self.controls.move_display.setText("<i>End of Game</i>")
             else:
                  self.controls.move_display.setText("<i>No move to display</i>")
+            self.update_game_info()
             return
         
         # Clear victory screen if not at the end
@@ -634,6 +746,8 @@ class ReplayerWindow(QMainWindow):
     def next_move(self):
         """Execute next move."""
         if not self.game_data or self.current_move_index >= len(self.game_data['moves']):
+            if self.game_data and self.still_indexing():
+                return # Not the end yet: wait for more moves
             if self.is_playing:
                 self.toggle_play() # Stop at end
             # Check if game is over and show victory screen
@@ -646,22 +760,52 @@ class ReplayerWindow(QMainWindow):
         self.update_move_display()
         
         # Check if this was the last move
-        if self.current_move_index >= len(self.game_data['moves']):
+        if self.current_move_index >= len(self.game_data['moves']) and not self.still_indexing():
+            self.check_and_show_victory()
+    
+    def seek(self, index):
+        """
+        Show the position after the first index moves.
+        
+        V2 logs rebuild the board straight from the recorded state_t snapshot;
+        legacy logs without snapshots replay the moves inside a render batch.
+        Either way the final position is drawn once.
+        """
+        if not self.game_data:
+            return
+        
+        total_moves = len(self.game_data['moves'])
+        index = max(0, min(index, total_moves))
+        
+        if self.game_log is None:
+            self.board.begin_batch()
+            try:
+                if index < self.current_move_index:
+                    self.board.clear_board()
+                    self.current_move_index = 0
+                while self.current_move_index < index:
+                    self.execute_move(self.game_data['moves'][self.current_move_index])
+                    self.current_move_index += 1
+            finally:
+                self.board.commit_batch()
+        else:
+            if index == 0:
+                self.board.clear_board()
+            else:
+                self.board.load_state(self.game_log.state_at(index - 1))
+            self.current_move_index = index
+        
+        self.update_move_display()
+        if self.current_move_index >= total_moves and not self.still_indexing():
             self.check_and_show_victory()
     
     def previous_move(self):
-        """Go back one move (requires reset and replay)."""
+        """Go back one move."""
         if self.is_playing:
             self.toggle_play() # Stop if playing
             
         if self.current_move_index > 0:
-            target_index = self.current_move_index - 1
-            self.reset_replay()
-            for _ in range(target_index):
-                self.next_move()
-            # Clear victory screen if not at end
-            if self.current_move_index < len(self.game_data['moves']):
-                self.board.clear_victory_screen()
+            self.seek(self.current_move_index - 1)
     
     def jump_to_first(self):
         """Jump to first move."""
@@ -669,10 +813,9 @@ class ReplayerWindow(QMainWindow):
     
     def jump_to_last(self):
         """Jump to last move."""
-        self.reset_replay()
-        while self.current_move_index < len(self.game_data['moves']):
-            self.next_move()
-        self.check_and_show_victory()
+        if not self.game_data:
+            return
+        self.seek(len(self.game_data['moves']))
             
     def jump_to_step(self):
         """Jump to specific step number."""
@@ -681,21 +824,7 @@ class ReplayerWindow(QMainWindow):
             if not self.game_data:
                 return
                 
-            total_moves = len(self.game_data['moves'])
-            if step < 0: step = 0
-            if step > total_moves: step = total_moves
-            
-            # Optimize direction
-            if step < self.current_move_index:
-                self.reset_replay()
-                target = step
-            else:
-                target = step
-                
-            while self.current_move_index < target:
-                self.next_move()
-                
-            self.update_move_display()
+            self.seek(step)
             
         except ValueError:
             QMessageBox.warning(self, "Invalid Input", "Please enter a valid step number.")
@@ -721,6 +850,7 @@ class ReplayerWindow(QMainWindow):
         self.controls.play_btn.setEnabled(enabled)
         self.controls.reset_btn.setEnabled(enabled)
         self.controls.goto_btn.setEnabled(enabled)
+        self.controls.timeline_slider.setEnabled(enabled)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
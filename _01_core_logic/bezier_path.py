@@ -0,0 +1,125 @@
+"""
+File: bezier_path.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Adaptive Bezier flattening and the grid cells a curve move sweeps through.
+"""
+
+from functools import lru_cache
+import math
+
+# Max distance (in cells) between the true curve and its flattened polyline
+FLATNESS_TOLERANCE = 0.1
+MAX_DEPTH = 10
+# Step used to walk polyline segments cell by cell (well under half a cell)
+CELL_STEP = 0.25
+
+
+def flatten_bezier(points, tolerance=FLATNESS_TOLERANCE):
+    """
+    Flatten a Bezier curve of any degree into a polyline.
+
+    points is the control polygon (start, controls..., end). It is split in
+    half with de Casteljau until every piece's control points lie within
+    tolerance of its chord, so gentle curves need few points and tight ones
+    get more.
+    """
+    points = [tuple(map(float, p)) for p in points]
+    polyline = [points[0]]
+    _subdivide(points, tolerance, 0, polyline)
+    return polyline
+
+
+def _subdivide(points, tolerance, depth, out):
+    if depth >= MAX_DEPTH or _flatness(points) <= tolerance:
+        out.append(points[-1])
+        return
+    left, right = [points[0]], [points[-1]]
+    level = points
+    while len(level) > 1:
+        level = [((a[0] + b[0]) / 2, (a[1] + b[1]) / 2) for a, b in zip(level, level[1:])]
+        left.append(level[0])
+        right.append(level[-1])
+    _subdivide(left, tolerance, depth + 1, out)
+    _subdivide(right[::-1], tolerance, depth + 1, out)
+
+
+def _flatness(points):
+    """Largest distance of an interior control point from the chord."""
+    (x0, y0), (x1, y1) = points[0], points[-1]
+    dx, dy = x1 - x0, y1 - y0
+    length = math.hypot(dx, dy)
+    worst = 0.0
+    for px, py in points[1:-1]:
+        if length == 0:
+            d = math.hypot(px - x0, py - y0)
+        else:
+            d = abs(dy * (px - x0) - dx * (py - y0)) / length
+        worst = max(worst, d)
+    return worst
+
+
+@lru_cache(maxsize=4096)
+def sample_curve(start, control_points, tolerance=FLATNESS_TOLERANCE):
+    """
+    Flatten a curve move and list the cells it sweeps, in order.
+
+    start and control_points must be hashable tuples (the result is cached
+    per curve, since agents score many candidate curves from the same
+    stones). Coordinates are not wrapped.
+
+    Returns (polyline, cells): polyline is a tuple of float points, cells a
+    tuple of (cell, segment) with cell the rounded (x, y) intersection and
+    segment the index of the polyline segment on which it is entered. The
+    first cell is the one containing start.
+    """
+    polyline = tuple(flatten_bezier((start,) + tuple(control_points), tolerance))
+    first = (int(round(polyline[0][0])), int(round(polyline[0][1])))
+    cells = [(first, 0)]
+    for segment, ((x0, y0), (x1, y1)) in enumerate(zip(polyline, polyline[1:])):
+        steps = max(1, int(math.ceil(math.hypot(x1 - x0, y1 - y0) / CELL_STEP)))
+        for s in range(1, steps + 1):
+            t = s / steps
+            cell = (int(round(x0 + (x1 - x0) * t)), int(round(y0 + (y1 - y0) * t)))
+            if cell != cells[-1][0]:
+                cells.append((cell, segment))
+    return polyline, tuple(cells)
+
+
+def sweep_curve(start, control_points, grid_size, is_blocked):
+    """
+    Follow a curve move from start until the first blocked cell.
+
+    The board wraps, so each control point is taken at its copy nearest the
+    previous point: an end point given as already wrapped (x % grid_size)
+    still continues the curve past the edge instead of doubling back.
+
+    is_blocked(cell) is asked for each swept cell after start, wrapped onto
+    the board. Returns (final_cell, path): final_cell is the wrapped last
+    free cell (start itself if the very first step is blocked) and path the
+    unwrapped polyline from start to that cell, for animation.
+    """
+    controls = []
+    prev = start
+    for x, y in control_points:
+        x = x - grid_size * round((x - prev[0]) / grid_size)
+        y = y - grid_size * round((y - prev[1]) / grid_size)
+        controls.append((x, y))
+        prev = (x, y)
+    polyline, cells = sample_curve(tuple(start), tuple(controls))
+    reached = 0
+    for i in range(1, len(cells)):
+        cell = cells[i][0]
+        if is_blocked((cell[0] % grid_size, cell[1] % grid_size)):
+            break
+        reached = i
+
+    cell, segment = cells[reached]
+    if reached == len(cells) - 1:
+        path = list(polyline)
+    else:
+        path = list(polyline[:segment + 1])
+    if path[-1] != cell:
+        path.append((float(cell[0]), float(cell[1]))) # End on the intersection the stone occupies
+    return (cell[0] % grid_size, cell[1] % grid_size), path
@@ -6,8 +6,13 @@ Version: 2.0.0
 Description: Source file.
 """
 
-from PySide6.QtGui import QVector2D
 from enum import Enum
+import logging
+
+from _01_core_logic.bezier_path import sweep_curve
+from _01_core_logic import instrumentation
+
+logger = logging.getLogger(__name__)
 
 class StoneType(Enum):
     PRISM = 1
@@ -52,6 +57,7 @@ class BoardState2D:
         self.grid_size = grid_size
         self.stones = {}  # Map (x,y) -> StoneData2D
         self.laser_sources = []  # List of (pos, dir, player) tuples
+        self.last_rejection = None  # Why the last place/move was refused (None if it succeeded)
         self.territory_threshold = territory_threshold # Victory condition threshold
         self.infinite_score = infinite_score  # When True, no mercy rule
         
@@ -94,15 +100,15 @@ class BoardState2D:
             "infinite_score": self.infinite_score,
             "infinite_energy": self.infinite_energy,
             "energy_cost": self.energy_cost,
-            "player_energy": self.player_energy,
+            "player_energy": dict(self.player_energy),
             "stones": stones_data,
-            "player_captures": self.player_captures,
+            "player_captures": dict(self.player_captures),
             "game_over": self.game_over,
             "winner": self.winner,
             "victory_reason": self.victory_reason,
             "total_time_limit": self.total_time_limit,
             "move_time_limit": self.move_time_limit,
-            "player_time_remaining": self.player_time_remaining,
+            "player_time_remaining": dict(self.player_time_remaining),
             "current_move_time_remaining": self.current_move_time_remaining
         }
 
@@ -119,14 +125,14 @@ class BoardState2D:
                     infinite_score=infinite_score)
         
         # Restore energy
-        board.player_energy = data.get("player_energy", {1: 10, 2: 10})
+        board.player_energy = dict(data.get("player_energy", {1: 10, 2: 10}))
         # Handle JSON string keys
         if "1" in board.player_energy:
             board.player_energy[1] = board.player_energy.pop("1")
         if "2" in board.player_energy:
             board.player_energy[2] = board.player_energy.pop("2")
             
-        board.player_captures = data.get("player_captures", {1: 0, 2: 0})
+        board.player_captures = dict(data.get("player_captures", {1: 0, 2: 0}))
         if "1" in board.player_captures:
             board.player_captures[1] = board.player_captures.pop("1")
         if "2" in board.player_captures:
@@ -139,7 +145,7 @@ class BoardState2D:
         # Restore timers
         board.total_time_limit = data.get("total_time_limit", 0)
         board.move_time_limit = data.get("move_time_limit", 30)
-        board.player_time_remaining = data.get("player_time_remaining", {1: 0.0, 2: 0.0})
+        board.player_time_remaining = dict(data.get("player_time_remaining", {1: 0.0, 2: 0.0}))
         # Handle JSON string keys for player_time_remaining
         if "1" in board.player_time_remaining:
             board.player_time_remaining[1] = board.player_time_remaining.pop("1")
@@ -195,21 +201,34 @@ class BoardState2D:
         
         return new_board
     
-    def place_stone(self, pos_tuple, stone_type_name="PRISM", player=1):
-        """Place a stone at (x, y). Costs 1 energy."""
+    def placement_error(self, pos_tuple, player=1):
+        """Reason place_stone would refuse (x, y) for player, or None if it is allowed."""
         x, y = pos_tuple
         if not (0 <= x < self.grid_size and 0 <= y < self.grid_size):
-            print(f"Position {pos_tuple} out of bounds")
-            return False
-        
+            return f"Position {pos_tuple} out of bounds"
         if pos_tuple in self.stones:
-            print(f"Stone already at {pos_tuple}")
-            return False
-        
+            return f"Stone already at {pos_tuple}"
         # Check energy (skip if infinite)
         if not self.infinite_energy and not self.has_energy(player, self.energy_cost):
-            print(f"Player {player} has insufficient energy")
+            return f"Player {player} has insufficient energy"
+        return None
+    
+    def _reject(self, reason):
+        self.last_rejection = reason
+        logger.debug("Rejected: %s", reason)
+        return None
+    
+    def place_stone(self, pos_tuple, stone_type_name="PRISM", player=1):
+        """Place a stone at (x, y). Costs 1 energy.
+        
+        Returns True on success. On failure returns False and leaves the
+        reason in last_rejection (see placement_error).
+        """
+        reason = self.placement_error(pos_tuple, player)
+        if reason is not None:
+            self._reject(reason)
             return False
+        self.last_rejection = None
         
         # Determine Type
         sType = StoneType.PRISM
@@ -256,10 +275,11 @@ class BoardState2D:
             to_pos: (x, y) target position (will be wrapped)
         
         Returns:
-            Wrapped (x, y) position if successful, None otherwise
+            Wrapped (x, y) position if successful, None otherwise (the
+            reason is left in last_rejection)
         """
         if from_pos not in self.stones:
-            return None
+            return self._reject(f"No stone at {from_pos}")
         
         # Wrap coordinates using modular arithmetic
         wrapped_x = to_pos[0] % self.grid_size
@@ -268,7 +288,8 @@ class BoardState2D:
         
         # Cannot move to occupied cell
         if wrapped_pos in self.stones and wrapped_pos != from_pos:
-            return None
+            return self._reject(f"Stone already at {wrapped_pos}")
+        self.last_rejection = None
         
         # Move the stone
         stone = self.stones.pop(from_pos)
@@ -276,9 +297,31 @@ class BoardState2D:
         self.reset_passes()
         return wrapped_pos
     
+    def trace_curve(self, from_pos, control_points):
+        """Sweep a curve move without making it.
+        
+        The curve is flattened adaptively and every intersection it crosses
+        is checked against the stones in order; the stone would stop on the
+        last free one before the first occupied one.
+        
+        Args:
+            from_pos: (x, y) starting position
+            control_points: List of (x, y) control points, end point last
+        
+        Returns:
+            (final wrapped (x, y) position, unwrapped polyline in grid units
+            from from_pos to it). The position is from_pos if the first step
+            is already blocked.
+        """
+        return sweep_curve(from_pos, control_points, self.grid_size,
+                           lambda cell: cell in self.stones and cell != from_pos)
+    
     def move_stone_along_curve(self, from_pos, control_points, player):
         """Move a stone along a Bezier curve path.
         
+        The stone follows the curve until the first occupied intersection
+        and stops just before it (see trace_curve).
+        
         Args:
             from_pos: (x, y) starting position
             control_points: List of (x, y) control points defining the curve.
@@ -287,28 +330,25 @@ class BoardState2D:
             player: Player who owns the stone
         
         Returns:
-            Final wrapped (x, y) position if successful, None otherwise
+            Final wrapped (x, y) position if successful, None otherwise (the
+            reason is left in last_rejection)
         """
         if from_pos not in self.stones:
-            return None
+            return self._reject(f"No stone at {from_pos}")
         stone = self.stones[from_pos]
         if stone.player != player:
-            return None
+            return self._reject(f"Stone at {from_pos} belongs to player {stone.player}")
         
         # The final destination is the last control point
         if not control_points:
-            return None
+            return self._reject("Curve move without control points")
         
-        end_point = control_points[-1]
+        final_pos, _path = self.trace_curve(from_pos, control_points)
         
-        # Wrap the final position
-        wrapped_x = int(round(end_point[0])) % self.grid_size
-        wrapped_y = int(round(end_point[1])) % self.grid_size
-        final_pos = (wrapped_x, wrapped_y)
-        
-        # Cannot move to occupied cell
-        if final_pos in self.stones and final_pos != from_pos:
-            return None
+        # Blocked on the very first step
+        if final_pos == from_pos:
+            return self._reject(f"Curve from {from_pos} is blocked on its first step")
+        self.last_rejection = None
         
         # Move the stone to final position
         s = self.stones.pop(from_pos)
@@ -481,6 +521,7 @@ class BoardState2D:
         else:
             self.victory_reason = f"Time Expired - P{self.winner} Wins ({p1_final} - {p2_final})"
     
+    @instrumentation.timed("board.calculate_score")
     def calculate_score(self):
         """Calculate territory score based on illuminated intersections."""
         from _02_engines.laser import LaserCalculator2D
@@ -0,0 +1,431 @@
+"""
+File: game_library.py
+Creation Date: 2026-10-19
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: SQLite index of the saved games under games/, for querying without opening logs.
+
+Usage:
+    python -m _01_core_logic.game_library update --workers 8
+    python -m _01_core_logic.game_library query --model gemma3:4b --winner 1 --limit 20
+
+    library = GameLibrary()
+    library.update()
+    for game in library.query(grid_size=19, min_turns=50, order_by="turns"):
+        print(game["path"], game["winner"], game["p1_score"], game["p2_score"])
+"""
+
+import json
+import multiprocessing
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from _01_core_logic.board_state import BoardState2D
+from _01_core_logic.game_log import LazyGameLog, is_stream_log
+
+DEFAULT_ROOT = "games"
+DEFAULT_DB = "games/library.sqlite"
+LOG_SUFFIXES = (".json", ".jsonl", ".jsonl.gz", ".jsonl.zst")
+
+COLUMNS = (
+    "path", "size", "mtime", "format", "game_id", "player1", "player2", "model1", "model2",
+    "grid_size", "turns", "game_over", "winner", "victory_reason", "p1_score", "p2_score",
+    "p1_captures", "p2_captures", "metadata", "error", "indexed_at",
+)
+ORDER_COLUMNS = ("mtime", "turns", "grid_size", "p1_score", "p2_score", "game_id", "path")
+PARALLEL_MIN_FILES = 16 # Fewer stale files are summarized in-process (worker start-up costs more)
+_SCORE_ENTRY = re.compile(r"Score: P1=(\d+), P2=(\d+)")
+
+
+def summarize_game(path):
+    """
+    Summarize one game log as a library row (a dict over COLUMNS).
+
+    The result mirrors what the replayer shows at the end of the game:
+    the recorded winner, or else the leader on territory + 2 x captures.
+    Unreadable files give a row with only error set, so they are not
+    retried until they change.
+    """
+    row = dict.fromkeys(COLUMNS)
+    row.update(path=path, size=0, mtime=0.0, indexed_at=time.time())
+    try:
+        stat = os.stat(path)
+        row.update(size=stat.st_size, mtime=stat.st_mtime)
+        row.update(_summarize_log(path))
+    except Exception as e:
+        row["error"] = str(e) or type(e).__name__ # Includes files deleted since the scan
+    return row
+
+
+def _summarize_log(path):
+    try:
+        log = LazyGameLog(path)
+    except ValueError:
+        return _summarize_legacy(path)
+    try:
+        log.index_all()
+        summary = _names(log.metadata)
+        summary.update(
+            format="stream" if is_stream_log(path) else "v2",
+            game_id=log.game_id,
+            turns=len(log),
+            metadata=json.dumps(log.metadata),
+        )
+        if len(log):
+            last = log.turns[-1]
+            summary.update(final_result(log.state_at(-1), recorded_territory(last), last.get("terminal")))
+        else:
+            summary["grid_size"] = log.metadata.get("game_settings", {}).get("grid_size")
+        return summary
+    finally:
+        log.close()
+
+
+def _summarize_legacy(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if "moves" not in data:
+        raise ValueError("not a game log")
+    players = data.get("players") or [None, None]
+    return {
+        "format": "legacy",
+        "game_id": data.get("game_id"),
+        "player1": players[0],
+        "player2": players[1],
+        "grid_size": data.get("grid_size", 19),
+        "turns": len(data["moves"]),
+    }
+
+
+def _names(metadata):
+    settings = metadata.get("game_settings", {})
+    models = settings.get("models", {})
+    return {
+        "player1": settings.get("player1"),
+        "player2": settings.get("player2"),
+        "model1": models.get("1"),
+        "model2": models.get("2"),
+    }
+
+
+def recorded_territory(turn):
+    """
+    Territory the game logged with a turn ("Score: P1=.., P2=.." in event_log), or None.
+
+    state_t does not carry the laser sources, so a board rebuilt from a log
+    cannot trace territory itself; the recorded figure is the real one.
+    """
+    for entry in turn.get("event_log") or ():
+        match = _SCORE_ENTRY.match(entry)
+        if match:
+            return {"player1": int(match.group(1)), "player2": int(match.group(2))}
+    return None
+
+
+def final_result(state, territory=None, terminal=False):
+    """
+    Result of a game from its last state_t, as the replayer's victory screen scores it.
+
+    territory ({"player1", "player2"}) is the final score the game logged
+    (recorded_territory); state_t has no laser sources, so it cannot be
+    traced from the rebuilt board. Returns grid_size, game_over, winner (0
+    for a draw), victory_reason, p1/p2_score (territory + 2 x captures) and
+    p1/p2_captures. Without territory the scores are None, and so are
+    winner and victory_reason unless the log recorded a winner.
+
+    A score winner is only inferred for a finished game (game_over in
+    state, or terminal set on the last turn). An unfinished one (a live,
+    crashed or abandoned match) gets winner None and reason "unfinished".
+    """
+    board = BoardState2D.from_dict(state)
+    p1_caps, p2_caps = board.get_captures(1), board.get_captures(2)
+    if territory is None:
+        p1_total = p2_total = None
+    else:
+        p1_total = territory["player1"] + p1_caps * 2
+        p2_total = territory["player2"] + p2_caps * 2
+
+    if board.winner:
+        winner, reason = board.winner, board.victory_reason
+    elif not (board.game_over or terminal):
+        winner, reason = None, "unfinished"
+    elif p1_total is None:
+        winner, reason = None, None # Unknown: captures alone do not decide a score victory
+    elif p1_total != p2_total:
+        winner, reason = (1 if p1_total > p2_total else 2), "Score Victory"
+    else:
+        winner, reason = 0, "Draw"
+
+    return {
+        "grid_size": board.grid_size,
+        "game_over": int(bool(board.game_over)),
+        "winner": winner,
+        "victory_reason": reason,
+        "p1_score": p1_total,
+        "p2_score": p2_total,
+        "p1_captures": p1_caps,
+        "p2_captures": p2_caps,
+    }
+
+
+def find_logs(root):
+    """Every game log under root (hidden and temporary files skipped)."""
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        for name in files:
+            if not name.startswith(".") and name.endswith(LOG_SUFFIXES):
+                yield os.path.join(directory, name)
+
+
+class GameLibrary:
+    """
+    SQLite index of the games saved under root.
+
+    update() stats every log and re-summarizes only new or changed files
+    (size or mtime differ), in parallel worker processes; rows of deleted
+    files are dropped. Queries then run against the index alone.
+    Paths are stored as found under root.
+
+    Workers are spawned rather than forked, so update() is safe to call
+    from a GUI worker thread.
+    """
+
+    def __init__(self, path=DEFAULT_DB, root=DEFAULT_ROOT):
+        self.path = path
+        self.root = root
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # The GUI may query while a CLI update writes
+        self.conn = sqlite3.connect(path, timeout=30.0)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS games (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                format TEXT,
+                game_id TEXT,
+                player1 TEXT,
+                player2 TEXT,
+                model1 TEXT,
+                model2 TEXT,
+                grid_size INTEGER,
+                turns INTEGER,
+                game_over INTEGER,
+                winner INTEGER,
+                victory_reason TEXT,
+                p1_score INTEGER,
+                p2_score INTEGER,
+                p1_captures INTEGER,
+                p2_captures INTEGER,
+                metadata TEXT,
+                error TEXT,
+                indexed_at REAL NOT NULL
+            )
+        """)
+        for column in ("mtime", "turns", "grid_size", "winner", "model1", "model2"):
+            self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_games_{column} ON games({column})")
+        self.conn.commit()
+
+    def update(self, workers=None, progress=None, batch_size=200, cancel=None):
+        """
+        Bring the index in line with the files under root.
+
+        progress(done, total) is called after every committed batch.
+        cancel is an optional threading.Event: once it is set, update()
+        commits the files summarized so far and returns; the rest are
+        picked up by the next update.
+        Returns counts of added, updated, removed, unchanged and failed files.
+        """
+        known = {path: (size, mtime) for path, size, mtime in
+                 self.conn.execute("SELECT path, size, mtime FROM games")}
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0, "failed": 0}
+
+        stale = []
+        seen = set()
+        for path in find_logs(self.root):
+            if cancel is not None and cancel.is_set():
+                return counts # Nothing removed: seen is incomplete
+            seen.add(path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue # Deleted while scanning
+            if known.get(path) == (stat.st_size, stat.st_mtime):
+                counts["unchanged"] += 1
+            else:
+                stale.append(path)
+
+        removed = [(path,) for path in known if path not in seen]
+        self.conn.executemany("DELETE FROM games WHERE path = ?", removed)
+        self.conn.commit()
+        counts["removed"] = len(removed)
+
+        insert = f"INSERT OR REPLACE INTO games ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+        batch = []
+
+        def commit_batch():
+            self.conn.executemany(insert, [[row[c] for c in COLUMNS] for row in batch])
+            self.conn.commit()
+            batch.clear()
+
+        workers = workers or os.cpu_count() or 1
+        done = 0
+        executor = None
+        if workers > 1 and len(stale) >= PARALLEL_MIN_FILES:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            rows = executor.map(summarize_game, stale, chunksize=16) if executor else map(summarize_game, stale)
+            for path, row in zip(stale, rows):
+                if cancel is not None and cancel.is_set():
+                    break
+                counts["updated" if path in known else "added"] += 1
+                if row["error"]:
+                    counts["failed"] += 1
+                batch.append(row)
+                done += 1
+                if len(batch) >= batch_size:
+                    commit_batch()
+                    if progress:
+                        progress(done, len(stale))
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+        if batch:
+            commit_batch()
+        if progress:
+            progress(done, len(stale))
+        return counts
+
+    def query(self, player=None, model=None, winner=None, grid_size=None, victory_reason=None,
+              min_turns=None, max_turns=None, since=None, text=None, log_format=None,
+              include_failed=False, order_by="mtime", descending=True, limit=None):
+        """
+        Return matching games as dicts, newest first by default.
+
+        player and model match either side. text is a case-insensitive
+        substring of the game id, path, players, models or victory reason.
+        since is a Unix time compared with the file's mtime; log_format is
+        "v2", "stream" or "legacy".
+        """
+        clauses, params = [], []
+        if not include_failed:
+            clauses.append("error IS NULL")
+        if player is not None:
+            clauses.append("(player1 = ? OR player2 = ?)")
+            params += [player, player]
+        if model is not None:
+            clauses.append("(model1 = ? OR model2 = ?)")
+            params += [model, model]
+        for column, value in (("winner", winner), ("grid_size", grid_size), ("victory_reason", victory_reason),
+                              ("format", log_format)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if min_turns is not None:
+            clauses.append("turns >= ?")
+            params.append(min_turns)
+        if max_turns is not None:
+            clauses.append("turns <= ?")
+            params.append(max_turns)
+        if since is not None:
+            clauses.append("mtime >= ?")
+            params.append(since)
+        if text:
+            fields = ("game_id", "path", "player1", "player2", "model1", "model2", "victory_reason")
+            clauses.append("(" + " OR ".join(f"{f} LIKE ? ESCAPE '\\'" for f in fields) + ")")
+            pattern = "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            params += [pattern] * len(fields)
+        if order_by not in ORDER_COLUMNS:
+            raise ValueError(f"Cannot order by '{order_by}'. Use one of {list(ORDER_COLUMNS)}")
+
+        sql = "SELECT * FROM games"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}, path"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def latest(self, log_format=None):
+        """Path of the most recently written game (optionally of one log format), or None."""
+        games = self.query(log_format=log_format, limit=1)
+        return games[0]["path"] if games else None
+
+    def stats(self):
+        """Number of indexed games, failed files and total turns."""
+        count, failed, turns = self.conn.execute(
+            "SELECT COUNT(*), COUNT(error), COALESCE(SUM(turns), 0) FROM games"
+        ).fetchone()
+        return {"games": count - failed, "failed": failed, "turns": turns}
+
+    def close(self):
+        """Close the underlying database connection."""
+        self.conn.close()
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Index and search saved GoLuminamics games")
+    parser.add_argument("--db", default=DEFAULT_DB, help="Index database")
+    parser.add_argument("--root", default=DEFAULT_ROOT, help="Directory holding the game logs")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    update = sub.add_parser("update", help="Index new and changed games")
+    update.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+
+    query = sub.add_parser("query", help="List indexed games")
+    query.add_argument("--player")
+    query.add_argument("--model")
+    query.add_argument("--winner", type=int, choices=[0, 1, 2], help="0 = draw")
+    query.add_argument("--grid-size", type=int)
+    query.add_argument("--reason", help="Victory reason")
+    query.add_argument("--min-turns", type=int)
+    query.add_argument("--max-turns", type=int)
+    query.add_argument("--text", help="Substring of id, path, players, models or reason")
+    query.add_argument("--order-by", default="mtime", choices=ORDER_COLUMNS)
+    query.add_argument("--ascending", action="store_true")
+    query.add_argument("--limit", type=int, default=50)
+    query.add_argument("--json", action="store_true", help="One JSON object per line")
+    args = parser.parse_args()
+
+    library = GameLibrary(args.db, args.root)
+    try:
+        if args.command == "update":
+            start = time.perf_counter()
+            counts = library.update(workers=args.workers)
+            print(", ".join(f"{n} {k}" for k, n in counts.items()) + f" in {time.perf_counter() - start:.1f}s")
+            stats = library.stats()
+            print(f"{stats['games']} games indexed ({stats['turns']} turns, {stats['failed']} unreadable files)")
+            return
+
+        games = library.query(player=args.player, model=args.model, winner=args.winner,
+                              grid_size=args.grid_size, victory_reason=args.reason,
+                              min_turns=args.min_turns, max_turns=args.max_turns, text=args.text,
+                              order_by=args.order_by, descending=not args.ascending, limit=args.limit)
+        for game in games:
+            if args.json:
+                print(json.dumps(game))
+                continue
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(game["mtime"]))
+            sides = f"{game['model1'] or game['player1']} vs {game['model2'] or game['player2']}"
+            if game["winner"] is None:
+                result = "-"
+            else:
+                result = "draw" if game["winner"] == 0 else f"P{game['winner']} ({game['victory_reason']})"
+                result += f" {game['p1_score']}-{game['p2_score']}"
+            print(f"{when}  {game['grid_size'] or '?':>2}x  {game['turns'] or 0:>5} turns  {sides}  {result}  {game['path']}")
+    finally:
+        library.close()
+
+
+if __name__ == "__main__":
+    main()
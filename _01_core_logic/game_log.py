@@ -0,0 +1,660 @@
+"""
+File: game_log.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Append-only streaming game log (JSON Lines) with keyframe + delta snapshots.
+
+Format (one JSON object per line):
+    {"record": "header", "log_version": "2.1.0", "keyframe_interval": K, "metadata": {...}}
+    {"record": "turn", "turn_id": 1, "state_kind": "keyframe", "state_t": {...}, "agent_action": ...}
+    {"record": "turn", "turn_id": 2, "state_kind": "delta", "state_delta": {...}, "agent_action": ...}
+    {"record": "metadata", "metadata": {...}}   (optional, latest one wins)
+
+Compression is chosen by file extension: .jsonl (plain), .jsonl.gz (gzip),
+.jsonl.zst (zstd, requires the 'zstandard' package). Every turn is flushed
+so a crash loses at most the turn being written.
+
+GameLogIndex gives random access to either log format: the board at any
+turn is rebuilt from the nearest keyframe in at most K delta applications.
+LazyGameLog does the same straight from the file, indexing it incrementally
+and decoding snapshots only when they are asked for.
+"""
+
+from array import array
+import bisect
+import codecs
+import gzip
+import io
+import itertools
+import json
+import os
+import re
+import tempfile
+import zlib
+from pathlib import Path
+
+from _01_core_logic.state_delta import diff_states, apply_delta
+
+STREAM_LOG_VERSION = "2.1.0"
+DEFAULT_KEYFRAME_INTERVAL = 10
+
+COMPRESSION_SUFFIXES = {
+    None: ".jsonl",
+    "gzip": ".jsonl.gz",
+    "zstd": ".jsonl.zst",
+}
+
+
+def _zstd():
+    """Import the optional zstandard module."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd compressed logs require the 'zstandard' package (pip install zstandard)") from e
+    return zstandard
+
+
+def compression_for_path(path):
+    """Return the compression implied by a file name, or None for plain JSON Lines."""
+    name = str(path)
+    if name.endswith(".jsonl.gz"):
+        return "gzip"
+    if name.endswith(".jsonl.zst"):
+        return "zstd"
+    return None
+
+
+def is_stream_log(path):
+    """True if path names a streaming (JSON Lines) log rather than a V2 JSON document."""
+    return any(str(path).endswith(suffix) for suffix in COMPRESSION_SUFFIXES.values())
+
+
+def stream_path_for(path, compression=None):
+    """Give path the extension matching the requested compression."""
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown compression '{compression}'. Use one of {list(COMPRESSION_SUFFIXES)}")
+    name = str(path)
+    for suffix in sorted(COMPRESSION_SUFFIXES.values(), key=len, reverse=True):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    else:
+        if name.endswith(".json"):
+            name = name[:-len(".json")]
+    return name + COMPRESSION_SUFFIXES[compression]
+
+
+def open_text_reader(path):
+    """Open a (possibly compressed) JSON Lines log for text reading."""
+    compression = compression_for_path(path)
+    if compression == "gzip":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if compression == "zstd":
+        zstandard = _zstd()
+        raw = open(path, "rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def _open_binary_reader(path, compression):
+    """Open a compressed JSON Lines log for reading decompressed bytes line by line."""
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    zstandard = _zstd()
+    reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True, closefd=True)
+    return io.BufferedReader(reader)
+
+
+def _is_truncation_error(e):
+    """True for the errors a compressed stream raises when its tail is missing."""
+    return isinstance(e, (EOFError, zlib.error)) or type(e).__module__.startswith("zstandard")
+
+
+class GameLogWriter:
+    """
+    Append-only writer for streaming game logs.
+
+    Snapshots (state_t) are stored as a full keyframe every keyframe_interval
+    turns and as a delta against the previous turn in between.
+    """
+
+    def __init__(self, path, metadata=None, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL, game_id=None):
+        self.path = str(path)
+        self.compression = compression_for_path(self.path)
+        self.keyframe_interval = max(1, int(keyframe_interval))
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._raw = open(self.path, "wb")
+        if self.compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="wb")
+        elif self.compression == "zstd":
+            self._zstandard = _zstd()
+            self._stream = self._zstandard.ZstdCompressor().stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+
+        self._prev_state = None
+        self._since_keyframe = 0
+        self.turns_written = 0
+        self.closed = False
+
+        self._write_record({
+            "record": "header",
+            "log_version": STREAM_LOG_VERSION,
+            "game_id": game_id,
+            "keyframe_interval": self.keyframe_interval,
+            "metadata": metadata or {},
+        })
+
+    def _write_record(self, record):
+        self._stream.write((json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8"))
+        self.flush()
+
+    def flush(self):
+        """Push everything written so far to disk in a readable state."""
+        if self.compression == "gzip":
+            self._stream.flush(zlib.Z_SYNC_FLUSH)
+        elif self.compression == "zstd":
+            self._stream.flush(self._zstandard.FLUSH_BLOCK)
+        self._raw.flush()
+
+    def write_turn(self, step_data):
+        """
+        Append one turn (the dict built by GameRecorder.record_step).
+
+        The state_t snapshot is kept as the base for the next delta, so the
+        caller must not mutate it afterwards.
+        """
+        state = step_data.get("state_t") or {}
+        record = {"record": "turn"}
+        record.update({k: v for k, v in step_data.items() if k != "state_t"})
+
+        use_keyframe = (
+            not state
+            or not self._prev_state
+            or self._since_keyframe >= self.keyframe_interval
+        )
+        if use_keyframe:
+            record["state_kind"] = "keyframe"
+            record["state_t"] = state
+            self._since_keyframe = 1
+        else:
+            record["state_kind"] = "delta"
+            record["state_delta"] = diff_states(self._prev_state, state)
+            self._since_keyframe += 1
+
+        self._prev_state = state
+        self.turns_written += 1
+        self._write_record(record)
+
+    def write_metadata(self, metadata):
+        """Record updated metadata (e.g. theme chosen at save time). The latest record wins."""
+        self._write_record({"record": "metadata", "metadata": metadata})
+
+    def close(self):
+        """Finish the compressed frame and close the file."""
+        if self.closed:
+            return
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.close()
+        self.closed = True
+
+
+def iter_records(path):
+    """
+    Yield raw records from a streaming log.
+
+    A truncated tail (crash while writing) ends the iteration quietly.
+    """
+    with open_text_reader(path) as f:
+        try:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Partially written last line
+                    return
+        except (EOFError, zlib.error):
+            return
+        except Exception as e:
+            # zstandard reports truncated frames with its own error type
+            if type(e).__module__.startswith("zstandard"):
+                return
+            raise
+
+
+def read_header(path):
+    """Return the header of a streaming log with the latest metadata merged in."""
+    header = None
+    metadata = None
+    for record in iter_records(path):
+        kind = record.get("record")
+        if kind == "header":
+            header = record
+        elif kind == "metadata":
+            metadata = record.get("metadata")
+    if header is None:
+        raise ValueError(f"{path} is not a streaming game log (missing header)")
+    if metadata is not None:
+        header = dict(header, metadata=metadata)
+    return header
+
+
+def iter_turns(path):
+    """
+    Lazily yield turns from a streaming log in the V2 turn schema.
+
+    Deltas are applied on the fly, so every yielded turn carries a complete
+    state_t, exactly like a turn from a V2 JSON log.
+    """
+    state = {}
+    for record in iter_records(path):
+        if record.get("record") != "turn":
+            continue
+        kind = record.pop("state_kind", "keyframe")
+        record.pop("record")
+        if kind == "delta":
+            state = apply_delta(state, record.pop("state_delta", {}))
+        else:
+            state = record.get("state_t") or {}
+        record["state_t"] = state
+        yield record
+
+
+class GameLogIndex:
+    """
+    Random access to the turns of a game log.
+
+    Keyframes and deltas are kept as recorded (nothing is expanded up front),
+    so memory stays proportional to the file size. state_at(i) walks back to
+    the nearest keyframe and applies at most keyframe_interval deltas; the
+    last reconstructed state is cached so stepping forward costs one delta.
+
+    V2 JSON logs are accepted too, with every turn treated as a keyframe;
+    pass data instead of path to index a log that is already loaded.
+    """
+
+    def __init__(self, path=None, data=None):
+        self.path = str(path) if path is not None else None
+        self.turns = []           # Turn records without their state payload
+        self.states = []          # ("keyframe", state) or ("delta", delta)
+        self.keyframe_indices = []
+
+        if data is not None:
+            self.metadata = data.get("metadata", {})
+            self.keyframe_interval = 1
+            records = data.get("turn_sequence", [])
+        elif is_stream_log(self.path):
+            header = read_header(self.path)
+            self.metadata = header.get("metadata", {})
+            self.keyframe_interval = header.get("keyframe_interval", DEFAULT_KEYFRAME_INTERVAL)
+            records = (r for r in iter_records(self.path) if r.get("record") == "turn")
+        else:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.metadata = data.get("metadata", {})
+            self.keyframe_interval = 1
+            records = data.get("turn_sequence", [])
+
+        for record in records:
+            record = dict(record)
+            record.pop("record", None)
+            kind = record.pop("state_kind", "keyframe")
+            if kind == "delta":
+                self.states.append(("delta", record.pop("state_delta", {})))
+            else:
+                self.keyframe_indices.append(len(self.states))
+                self.states.append(("keyframe", record.pop("state_t", None) or {}))
+            self.turns.append(record)
+
+        self._cached_index = None
+        self._cached_state = None
+
+    def __len__(self):
+        return len(self.turns)
+
+    def _state_record(self, index):
+        """("keyframe", state) or ("delta", delta) of turn index."""
+        return self.states[index]
+
+    def state_at(self, index):
+        """
+        Return the full state_t of turn index (0-based, negative indices allowed).
+
+        Reconstructed states share unchanged parts with each other; treat them as read-only.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"turn index {index} out of range (0..{len(self) - 1})")
+
+        if self._cached_index is not None and self._cached_index <= index:
+            start, state = self._cached_index, self._cached_state
+        else:
+            start, state = None, None
+
+        # A keyframe between the cached turn and the target is a shorter path
+        keyframe = self.keyframe_indices[bisect.bisect_right(self.keyframe_indices, index) - 1] \
+            if self.keyframe_indices and self.keyframe_indices[0] <= index else None
+        if start is None or (keyframe is not None and keyframe > start):
+            if keyframe is None:
+                start, state = -1, {}
+            else:
+                start, state = keyframe, self._state_record(keyframe)[1]
+
+        for i in range(start + 1, index + 1):
+            kind, payload = self._state_record(i)
+            state = payload if kind == "keyframe" else apply_delta(state, payload)
+
+        self._cached_index, self._cached_state = index, state
+        return state
+
+    def turn_at(self, index):
+        """Return turn index in the V2 turn schema (with a full state_t)."""
+        turn = dict(self.turns[index])
+        turn["state_t"] = self.state_at(index)
+        return turn
+
+
+V2_READ_CHUNK = 1 << 20 # Characters read per step while scanning a V2 JSON document
+V2_HEADER_LIMIT = 4 << 20 # Give up looking for "turn_sequence" after this many characters
+_V2_SEQUENCE = re.compile(r'"turn_sequence"\s*:\s*\[')
+_V2_SEPARATORS = re.compile(r'[\s,]*')
+_STATE_FIELDS = ("record", "state_kind", "state_t", "state_delta")
+
+
+def _utf8_len(text, start, end):
+    piece = text[start:end]
+    return len(piece) if piece.isascii() else len(piece.encode("utf-8"))
+
+
+class LazyGameLog(GameLogIndex):
+    """
+    Random access to a game log read incrementally from disk.
+
+    index_more() reads the next batch of turns, keeping only where each
+    record lies in the file, the turn fields without their snapshot and the
+    snapshot's scalar fields (grid size, captures, ...), which deltas carry
+    whole. Boards are decoded on demand: state_at(i) re-reads the nearest
+    keyframe and at most keyframe_interval deltas, so memory does not grow
+    with the boards in the log, and the first turns can be shown while the
+    rest is still being indexed.
+
+    Streaming logs and V2 JSON documents are supported; compressed streams
+    are decompressed once into an anonymous temporary file so records can be
+    read back by offset. Anything else (e.g. legacy "moves" files) raises
+    ValueError. Call close() when done.
+    """
+
+    def __init__(self, path, spool_dir=None):
+        self.path = str(path)
+        self.metadata = {}
+        self.log_version = None
+        self.game_id = None
+        self.keyframe_interval = 1
+        self.turns = []           # Turn records without their state payload
+        self.scalars = []         # Non-stone state fields per turn (unchanged ones share a dict)
+        self.keyframe_indices = []
+        self.complete = False
+
+        self._offsets = array("q")
+        self._lengths = array("q")
+        self._reader = None       # Scanning handle
+        self._source = None       # Handle records are re-read from (the log itself or the spool)
+        self._spooled = False
+        self._cached_index = None
+        self._cached_state = None
+
+        try:
+            if is_stream_log(self.path):
+                self._scanner = self._open_stream(spool_dir)
+            else:
+                self._scanner = self._open_v2()
+        except BaseException:
+            self.close()
+            raise
+
+    # --- Scanning ---
+
+    def _open_stream(self, spool_dir):
+        compression = compression_for_path(self.path)
+        if compression is None:
+            self._reader = open(self.path, "rb")
+            self._source = open(self.path, "rb")
+        else:
+            self._reader = _open_binary_reader(self.path, compression)
+            self._source = tempfile.TemporaryFile(dir=spool_dir)
+            self._spooled = True
+
+        line = self._reader.readline()
+        try:
+            header = json.loads(line)
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or header.get("record") != "header":
+            raise ValueError(f"{self.path} is not a streaming game log (missing header)")
+        self.log_version = header.get("log_version")
+        self.game_id = header.get("game_id")
+        self.metadata = header.get("metadata", {})
+        self.keyframe_interval = header.get("keyframe_interval", DEFAULT_KEYFRAME_INTERVAL)
+        return self._scan_stream(len(line))
+
+    def _scan_stream(self, offset):
+        while True:
+            try:
+                line = self._reader.readline()
+            except Exception as e:
+                if _is_truncation_error(e):
+                    return
+                raise
+            if not line:
+                return
+            start, offset = offset, offset + len(line)
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                return # Partially written last line
+            kind = record.get("record")
+            if kind == "metadata":
+                self.metadata = record.get("metadata", {})
+            elif kind == "turn":
+                if self._spooled:
+                    self._source.seek(0, os.SEEK_END)
+                    start = self._source.tell()
+                    self._source.write(line)
+                yield start, len(line), record
+
+    def _open_v2(self):
+        self._reader = open(self.path, "rb")
+        self._source = open(self.path, "rb")
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._eof = False
+
+        while True:
+            match = _V2_SEQUENCE.search(self._text)
+            if match:
+                break
+            if self._eof or len(self._text) > V2_HEADER_LIMIT:
+                raise ValueError(f"{self.path} is not a V2 game log (no turn_sequence)")
+            self._read_chunk()
+
+        head = self._text[:match.start()]
+        self.log_version = self._head_value(head, "log_version")
+        self.game_id = self._head_value(head, "game_id")
+        self.metadata = self._head_value(head, "metadata") or {}
+        return self._scan_v2(match.end())
+
+    @staticmethod
+    def _head_value(head, key):
+        match = re.search(r'"%s"\s*:\s*' % key, head)
+        if match is None:
+            return None
+        try:
+            return json.JSONDecoder().raw_decode(head, match.end())[0]
+        except ValueError:
+            return None
+
+    def _read_chunk(self):
+        data = self._reader.read(V2_READ_CHUNK)
+        self._eof = not data
+        self._text += self._utf8.decode(data, final=self._eof)
+
+    def _scan_v2(self, pos):
+        """Yield the turns of "turn_sequence" one object at a time, with their byte spans."""
+        decoder = json.JSONDecoder()
+        mark_char, mark_byte = 0, 0 # A position in self._text and its byte offset in the file
+        while True:
+            text = self._text
+            pos = _V2_SEPARATORS.match(text, pos).end()
+            if pos == len(text):
+                if self._eof:
+                    return
+                self._read_chunk()
+                continue
+            if text[pos] == "]":
+                return
+            try:
+                turn, end = decoder.raw_decode(text, pos)
+            except ValueError:
+                if self._eof:
+                    return # Truncated document
+                self._read_chunk()
+                continue
+
+            start = mark_byte + _utf8_len(text, mark_char, pos)
+            length = _utf8_len(text, pos, end)
+            mark_char, mark_byte = end, start + length
+            pos = end
+            if mark_char > V2_READ_CHUNK: # Drop text already indexed
+                self._text = self._text[mark_char:]
+                pos -= mark_char
+                mark_char = 0
+            yield start, length, turn
+
+    def index_more(self, count):
+        """Index up to count more turns; returns how many were added (0 once complete)."""
+        added = 0
+        while added < count and not self.complete:
+            try:
+                offset, length, record = next(self._scanner)
+            except StopIteration:
+                self.complete = True
+                self._reader.close()
+                self._text = ""
+                break
+            self._add_turn(offset, length, record)
+            added += 1
+        return added
+
+    def index_all(self):
+        """Index every remaining turn."""
+        while self.index_more(10_000):
+            pass
+        return len(self)
+
+    def _add_turn(self, offset, length, record):
+        prev = self.scalars[-1] if self.scalars else {}
+        if record.get("state_kind", "keyframe") == "delta":
+            delta = record.get("state_delta", {})
+            if "scalars" in delta or "scalars_removed" in delta:
+                scalars = dict(prev)
+                for key in delta.get("scalars_removed", []):
+                    scalars.pop(key, None)
+                scalars.update(delta.get("scalars", {}))
+            else:
+                scalars = prev
+        else:
+            self.keyframe_indices.append(len(self.turns))
+            state = record.get("state_t") or {}
+            scalars = {k: v for k, v in state.items() if k != "stones"}
+            if scalars == prev:
+                scalars = prev
+
+        self.turns.append({k: v for k, v in record.items() if k not in _STATE_FIELDS})
+        self.scalars.append(scalars)
+        self._offsets.append(offset)
+        self._lengths.append(length)
+
+    # --- Random access ---
+
+    def _state_record(self, index):
+        self._source.seek(self._offsets[index])
+        record = json.loads(self._source.read(self._lengths[index]))
+        if record.get("state_kind", "keyframe") == "delta":
+            return "delta", record.get("state_delta", {})
+        return "keyframe", record.get("state_t") or {}
+
+    def close(self):
+        """Stop indexing and release the file handles (and the spool file)."""
+        self.complete = True
+        for handle in (self._reader, self._source):
+            if handle is not None:
+                handle.close()
+        self._text = ""
+
+
+def write_v2_json(path, metadata, turns, log_version="2.0.0", indent=None):
+    """Write a V2 JSON document from an iterable of turns, one turn at a time."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"log_version": %s, "metadata": %s, "turn_sequence": [' % (
+            json.dumps(log_version), json.dumps(metadata)))
+        first = True
+        for turn in turns:
+            if not first:
+                f.write(",")
+            f.write("\n" + json.dumps(turn, indent=indent))
+            first = False
+        f.write("\n]}\n")
+
+
+def convert_log(src, dst, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL, max_turns=None, metadata=None):
+    """
+    Convert between V2 JSON and streaming logs; the target format follows dst's extension.
+
+    max_turns stops after that many turns and metadata replaces the
+    source's, so a log that is still being written can be exported as it
+    was at one moment (see GameRecorder.snapshot).
+    """
+    from _01_core_logic.recorder import GameRecorder
+
+    if metadata is None:
+        if is_stream_log(src):
+            metadata = read_header(src).get("metadata", {})
+        else:
+            metadata = GameRecorder.load_game(src).get("metadata", {})
+    turns = GameRecorder.iter_turns(src)
+    if max_turns is not None:
+        turns = itertools.islice(turns, max_turns)
+
+    if is_stream_log(dst):
+        writer = GameLogWriter(dst, metadata, keyframe_interval)
+        try:
+            for turn in turns:
+                writer.write_turn(turn)
+        finally:
+            writer.close()
+    else:
+        write_v2_json(dst, metadata, turns)
+    return dst
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Convert GoLuminamics game logs between V2 JSON and JSON Lines")
+    parser.add_argument("src", help="Source log (.json, .jsonl, .jsonl.gz, .jsonl.zst)")
+    parser.add_argument("dst", help="Target log; format follows the extension")
+    parser.add_argument("--keyframe-interval", type=int, default=DEFAULT_KEYFRAME_INTERVAL)
+    args = parser.parse_args()
+
+    convert_log(args.src, args.dst, args.keyframe_interval)
+    print(f"Converted {args.src} -> {args.dst} ({os.path.getsize(args.dst)} bytes)")
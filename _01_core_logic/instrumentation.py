@@ -0,0 +1,302 @@
+"""
+File: instrumentation.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Opt-in counters, histograms and span timers for the hot paths (headless).
+
+Everything is off by default. While disabled, span() hands back a shared
+no-op context manager, timed() methods are the plain undecorated functions
+(enable() swaps the timing wrappers onto their classes) and timed()
+module-level functions pay one flag check per call.
+
+Usage:
+    from _01_core_logic import instrumentation
+
+    instrumentation.enable(trace=True)
+    with instrumentation.span("laser.calculate_path"):
+        ...
+    instrumentation.count("ai.cache_hit")
+    instrumentation.observe("laser.segments", len(paths))
+
+    @instrumentation.timed("server.step")
+    def step(self, action): ...
+
+    instrumentation.write_summary("profile/summary.json")
+    instrumentation.write_chrome_trace("profile/trace.json")   # chrome://tracing or ui.perfetto.dev
+"""
+
+import functools
+import json
+import math
+import os
+import threading
+import time
+
+_enabled = False
+_lock = threading.Lock()
+_counters = {}
+_spans = {}       # name -> _Histogram of durations (ms)
+_values = {}      # name -> _Histogram of observed values
+_trace = None     # Chrome trace events while tracing, else None
+_max_trace_events = 0
+_dropped_events = 0
+_t0 = time.perf_counter()
+_timed_methods = [] # (class, attribute, plain function, timing wrapper)
+
+
+class _Histogram:
+    """Count/sum/min/max plus power-of-two buckets for approximate percentiles."""
+
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.buckets = {} # exponent e -> count of values in [2**(e-1), 2**e); None for values <= 0
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        e = math.frexp(value)[1] if value > 0 else None
+        self.buckets[e] = self.buckets.get(e, 0) + 1
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th percentile (clamped to the observed max)."""
+        rank = q / 100 * self.count
+        seen = 0
+        for e in sorted(self.buckets, key=lambda k: -math.inf if k is None else k):
+            seen += self.buckets[e]
+            if seen >= rank:
+                return 0.0 if e is None else min(2.0 ** e, self.max)
+        return self.max
+
+    def to_dict(self, unit=""):
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            f"total{unit}": round(self.total, 4),
+            f"mean{unit}": round(self.total / self.count, 4),
+            f"min{unit}": round(self.min, 4),
+            f"p50{unit}": round(self.percentile(50), 4),
+            f"p95{unit}": round(self.percentile(95), 4),
+            f"p99{unit}": round(self.percentile(99), 4),
+            f"max{unit}": round(self.max, 4),
+        }
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _TimedMethod:
+    """Class-body placeholder: installs the plain or the timed function once the class exists."""
+
+    def __init__(self, fn, wrapper):
+        self.fn = fn
+        self.wrapper = wrapper
+
+    def __set_name__(self, owner, attr):
+        _timed_methods.append((owner, attr, self.fn, self.wrapper))
+        setattr(owner, attr, self.wrapper if _enabled else self.fn)
+
+
+def _install_timed_methods(timed_on):
+    for owner, attr, fn, wrapper in _timed_methods:
+        setattr(owner, attr, wrapper if timed_on else fn)
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _record_span(self.name, self.start, time.perf_counter())
+        return False
+
+
+def _record_span(name, start, end):
+    global _dropped_events
+    with _lock:
+        hist = _spans.get(name)
+        if hist is None:
+            hist = _spans[name] = _Histogram()
+        hist.add((end - start) * 1000.0)
+        if _trace is not None:
+            if len(_trace) < _max_trace_events:
+                _trace.append((name, start, end, threading.get_ident()))
+            else:
+                _dropped_events += 1
+
+
+def enabled():
+    return _enabled
+
+
+def enable(trace=False, max_trace_events=1_000_000):
+    """Start collecting; with trace=True every span is also kept for write_chrome_trace()."""
+    global _enabled, _trace, _max_trace_events
+    with _lock:
+        _max_trace_events = max_trace_events
+        if trace and _trace is None:
+            _trace = []
+        _enabled = True
+        _install_timed_methods(True)
+
+
+def disable():
+    """Stop collecting (data gathered so far is kept until reset())."""
+    global _enabled
+    with _lock:
+        _enabled = False
+        _install_timed_methods(False)
+
+
+def reset():
+    """Drop all counters, histograms and trace events."""
+    global _trace, _dropped_events, _t0
+    with _lock:
+        _counters.clear()
+        _spans.clear()
+        _values.clear()
+        if _trace is not None:
+            _trace = []
+        _dropped_events = 0
+        _t0 = time.perf_counter()
+
+
+def count(name, n=1):
+    """Add n to counter name."""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def observe(name, value):
+    """Add value to histogram name."""
+    if not _enabled:
+        return
+    with _lock:
+        hist = _values.get(name)
+        if hist is None:
+            hist = _values[name] = _Histogram()
+        hist.add(value)
+
+
+def span(name):
+    """Context manager timing its block into span histogram name."""
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+def timed(name=None):
+    """
+    Decorator: time every call of the function as span name (default: module.qualname).
+
+    On methods defined in a class body this costs nothing while disabled:
+    the class holds the undecorated function until enable().
+    """
+    def decorator(fn):
+        span_name = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record_span(span_name, start, time.perf_counter())
+
+        scope = fn.__qualname__.rpartition(".")[0]
+        if scope and not scope.endswith("<locals>"):
+            return _TimedMethod(fn, wrapper) # Defined in a class body
+        return wrapper
+    return decorator
+
+
+def summary():
+    """Snapshot of everything collected so far, as a JSON-serialisable dict."""
+    with _lock:
+        return {
+            "uptime_s": round(time.perf_counter() - _t0, 3),
+            "counters": dict(sorted(_counters.items())),
+            "spans": {name: h.to_dict("_ms") for name, h in sorted(_spans.items())},
+            "histograms": {name: h.to_dict() for name, h in sorted(_values.items())},
+            "trace_events": None if _trace is None else len(_trace),
+            "trace_events_dropped": _dropped_events,
+        }
+
+
+def _write_json(path, data):
+    """Write atomically, so a reader never sees a half-written summary."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+def write_summary(path):
+    _write_json(path, summary())
+
+
+def write_chrome_trace(path):
+    """Write collected spans in Chrome trace event format (needs enable(trace=True))."""
+    with _lock:
+        events = list(_trace or [])
+    pid = os.getpid()
+    names = {t.ident: t.name for t in threading.enumerate()}
+    trace_events = [
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": names.get(tid, str(tid))}}
+        for tid in sorted({e[3] for e in events})
+    ]
+    for name, start, end, tid in events:
+        trace_events.append({
+            "name": name, "cat": name.split(".", 1)[0], "ph": "X", "pid": pid, "tid": tid,
+            "ts": round((start - _t0) * 1e6, 1), "dur": round((end - start) * 1e6, 1),
+        })
+    _write_json(path, {"traceEvents": trace_events, "displayTimeUnit": "ms"})
+
+
+class PeriodicSummary(threading.Thread):
+    """Background thread rewriting a JSON summary every interval seconds until stop()."""
+
+    def __init__(self, path, interval=10.0):
+        super().__init__(name="instrumentation-summary", daemon=True)
+        self.path = path
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            write_summary(self.path)
+
+    def stop(self):
+        """Stop the thread and write a final summary."""
+        self._stop_event.set()
+        write_summary(self.path)
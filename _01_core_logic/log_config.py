@@ -0,0 +1,77 @@
+"""
+File: log_config.py
+Creation Date: 2026-10-19
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: Logging setup for the entry points: one handler, per-module levels.
+
+Engine modules log through logging.getLogger(__name__) and never print, so
+stdout stays free for the game_server IPC channel and nothing is formatted
+unless a handler wants the record. Entry points call configure() once.
+
+Level specs are comma separated. A bare level sets the root level and
+name=LEVEL sets one logger and its children:
+    WARNING
+    INFO,_02_engines.ai_player=DEBUG
+    _01_core_logic.board_state=DEBUG
+When no spec is given the GOLUMINAMICS_LOG environment variable is used,
+then the entry point's default.
+"""
+
+import logging
+import os
+import sys
+
+ENV_VAR = "GOLUMINAMICS_LOG"
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+_configured_loggers = set() # Loggers given a level by the previous configure()
+
+
+def _level(name):
+    level = logging.getLevelName(name.strip().upper())
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown log level {name!r}")
+    return level
+
+
+def parse_levels(spec):
+    """Split a level spec into (root level or None, {logger name: level})."""
+    root_level = None
+    module_levels = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        if "=" in part:
+            name, level = part.split("=", 1)
+            module_levels[name.strip()] = _level(level)
+        else:
+            root_level = _level(part)
+    return root_level, module_levels
+
+
+def configure(spec=None, default="WARNING", stream=None, fmt=LOG_FORMAT):
+    """
+    Install a stream handler (stderr unless stream is given) on the root logger.
+
+    Calling it again replaces the handler and module levels of the previous call.
+    """
+    root_level, module_levels = parse_levels(default)
+    override_root, override_modules = parse_levels(spec or os.environ.get(ENV_VAR, ""))
+    if override_root is not None:
+        root_level = override_root
+    module_levels.update(override_modules)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if getattr(handler, "_log_config", False):
+            root.removeHandler(handler)
+    handler = logging.StreamHandler(stream if stream is not None else sys.stderr)
+    handler.setFormatter(logging.Formatter(fmt))
+    handler._log_config = True
+    root.addHandler(handler)
+    root.setLevel(root_level if root_level is not None else logging.WARNING)
+    for name in _configured_loggers - module_levels.keys():
+        logging.getLogger(name).setLevel(logging.NOTSET)
+    for name, level in module_levels.items():
+        logging.getLogger(name).setLevel(level)
+    _configured_loggers.clear()
+    _configured_loggers.update(module_levels)
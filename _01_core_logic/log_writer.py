@@ -0,0 +1,166 @@
+"""
+File: log_writer.py
+Creation Date: 2026-10-19
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: Queue-backed background log file writer with size-based rotation (headless).
+
+Usage:
+    writer = AsyncLogWriter("logs/match.txt", max_bytes=10 * 1024 * 1024, backup_count=5)
+    writer.write("text\n")   # returns at once, the disk write happens on the writer thread
+    writer.flush()           # wait until everything queued so far is on disk
+    writer.close()           # also runs at interpreter exit
+"""
+
+import atexit
+import gzip
+import os
+import shutil
+import threading
+
+
+class AsyncLogWriter:
+    """
+    Append text to a log file from a background thread.
+
+    write() only queues the text, so callers such as the GUI thread never
+    wait on the disk. The writer thread takes everything queued, writes it
+    as one block and flushes once per block.
+
+    At most max_buffer_chars characters wait in memory. Beyond that new
+    text is dropped, and a note with the dropped amount is written once
+    the queue drains.
+
+    When the file would grow past max_bytes it is rotated like
+    logging.handlers.RotatingFileHandler: path.1 ... path.<backup_count>,
+    gzip-compressed (path.1.gz ...) when compress is set.
+    """
+
+    def __init__(self, path, max_bytes=10 * 1024 * 1024, backup_count=5, compress=True,
+                 max_buffer_chars=4 * 1024 * 1024, encoding="utf-8"):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress = compress
+        self.max_buffer_chars = max_buffer_chars
+        self.encoding = encoding
+
+        self.dropped_chars = 0 # Total dropped because the buffer was full
+        self.last_error = None # Last error of the writer thread (writing goes on)
+        self._pending = []
+        self._pending_chars = 0
+        self._unreported_drop = 0
+        self._queued = 0  # Sequence number of the last write() queued
+        self._written = 0 # ... and of the last one on disk
+        self._closed = False
+        self._cond = threading.Condition()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "ab")
+        self._size = self._file.tell()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, text):
+        """Queue text; never blocks on I/O. Returns False if it was dropped."""
+        if not text:
+            return True
+        with self._cond:
+            if self._closed:
+                return False
+            if self._pending_chars + len(text) > self.max_buffer_chars:
+                self.dropped_chars += len(text)
+                self._unreported_drop += len(text)
+                return False
+            self._pending.append(text)
+            self._pending_chars += len(text)
+            self._queued += 1
+            self._cond.notify()
+        return True
+
+    def flush(self, timeout=5.0):
+        """Wait until everything queued so far is written; returns False on timeout."""
+        with self._cond:
+            target = self._queued
+            return self._cond.wait_for(lambda: self._written >= target or not self._thread.is_alive(), timeout)
+
+    def close(self, timeout=5.0):
+        """Write everything still queued, stop the thread and close the file."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        self._file.close()
+        atexit.unregister(self.close)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                batch, self._pending, self._pending_chars = self._pending, [], 0
+                dropped, self._unreported_drop = self._unreported_drop, 0
+                seq = self._queued
+                closing = self._closed
+            text = "".join(batch)
+            if dropped:
+                text += f"\n[log writer: {dropped} characters dropped, buffer full]\n"
+            if text:
+                try:
+                    self._write_block(text)
+                except (OSError, ValueError) as e: # ValueError: a failed rotation left the file closed
+                    self.last_error = e
+                    self._reopen()
+            with self._cond:
+                self._written = seq
+                self._cond.notify_all()
+                if closing and not self._pending:
+                    return
+
+    def _write_block(self, text):
+        data = text.encode(self.encoding)
+        while self.max_bytes and self._size + len(data) > self.max_bytes:
+            # Fill the current file up to the last whole line that fits, then rotate
+            room = self.max_bytes - self._size
+            if room <= 0:
+                self._rotate() # The file was already full when it was opened
+                continue
+            cut = data.rfind(b"\n", 0, room) + 1
+            if cut == 0 and self._size == 0:
+                cut = room # A single line longer than max_bytes
+            self._file.write(data[:cut])
+            data = data[cut:]
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+
+    def _backup_name(self, index):
+        return f"{self.path}.{index}.gz" if self.compress else f"{self.path}.{index}"
+
+    def _reopen(self):
+        """Reopen the log for appending if an error left it closed (the next block retries otherwise)."""
+        if not self._file.closed:
+            return
+        try:
+            self._file = open(self.path, "ab")
+            self._size = self._file.tell()
+        except OSError as e:
+            self.last_error = e
+
+    def _rotate(self):
+        self._file.close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                if os.path.exists(self._backup_name(i)):
+                    os.replace(self._backup_name(i), self._backup_name(i + 1))
+            if self.compress:
+                with open(self.path, "rb") as src, gzip.open(self._backup_name(1), "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                os.replace(self.path, self._backup_name(1))
+        self._file = open(self.path, "wb")
+        self._size = 0
@@ -1,14 +1,96 @@
 import json
+import copy
 import datetime
+import os
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
 from pathlib import Path
 
+from _01_core_logic.game_log import (GameLogWriter, DEFAULT_KEYFRAME_INTERVAL, is_stream_log,
+                                     stream_path_for, read_header, convert_log, GameLogIndex)
+from _01_core_logic.game_log import iter_turns as iter_stream_turns
+
+# Everything a save needs, frozen (see GameRecorder.snapshot). stream_path and stream_turns (turns in
+# the stream when the snapshot was taken) are set for streaming recorders.
+GameSnapshot = namedtuple("GameSnapshot", "game_id log_version metadata turns keyframe_interval stream_path stream_turns",
+                          defaults=(None,))
+
+
+def default_save_path(snapshot):
+    return f"games/{snapshot.game_id}.json"
+
+
+@contextmanager
+def _atomic_target(filename):
+    """
+    Yield a temporary path next to filename and move it into place on success.
+
+    The temporary name keeps filename's extension (the log format follows
+    it), and a reader never sees a half-written file.
+    """
+    target = Path(filename)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.parent / f".tmp-{os.getpid()}-{threading.get_ident()}-{target.name}"
+    try:
+        yield str(tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_snapshot(snapshot, filename=None):
+    """
+    Serialise a GameSnapshot (safe on any thread); returns the filename written.
+
+    A .jsonl / .jsonl.gz / .jsonl.zst filename writes the keyframe + delta stream
+    format, anything else V2 JSON. The file is replaced atomically.
+    """
+    if filename is None:
+        filename = default_save_path(snapshot)
+    
+    if snapshot.stream_path:
+        # The stream holds every turn (flushed by snapshot()); export it without loading it all, stopping at
+        # the turns it had then, since the GUI thread may record more while this runs
+        if Path(filename).resolve() != Path(snapshot.stream_path).resolve():
+            with _atomic_target(filename) as tmp:
+                convert_log(snapshot.stream_path, tmp, snapshot.keyframe_interval,
+                            max_turns=snapshot.stream_turns, metadata=snapshot.metadata)
+        return filename
+    
+    with _atomic_target(filename) as tmp:
+        if is_stream_log(filename):
+            # Keyframe + delta encoding, same as a live stream
+            writer = GameLogWriter(tmp, snapshot.metadata, snapshot.keyframe_interval, game_id=snapshot.game_id)
+            try:
+                for step_data in snapshot.turns:
+                    writer.write_turn(step_data)
+            finally:
+                writer.close()
+        else:
+            game_data = {
+                "log_version": snapshot.log_version,
+                "metadata": snapshot.metadata,
+                "turn_sequence": list(snapshot.turns)
+            }
+            with open(tmp, 'w') as f:
+                json.dump(game_data, f, indent=2)
+    return filename
+
 class GameRecorder:
     """
     Records game moves and saves to JSON with strategic annotations.
     Updated for Protocol V2: Supports Replayable JSON Log schema for DRL and LLM training.
+    
+    With stream_path set, turns are appended to a JSON Lines log (see game_log.py)
+    and flushed as they happen instead of being kept in memory. With
+    discard_empty also set, close() deletes that log if no turn was recorded.
     """
     
-    def __init__(self, player1_name="Player 1", player2_name="Player 2", grid_size=19, metadata=None):
+    def __init__(self, player1_name="Player 1", player2_name="Player 2", grid_size=19, metadata=None,
+                 stream_path=None, compression=None, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL,
+                 discard_empty=False):
         self.game_id = f"2d_game_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.players = [player1_name, player2_name]
         
@@ -24,6 +106,14 @@ class GameRecorder:
         }
         self.turn_sequence = []
         self.current_turn = 1
+        
+        # Streaming mode (optional)
+        self.keyframe_interval = keyframe_interval
+        self.discard_empty = discard_empty
+        self.stream = None
+        if stream_path:
+            self.stream = GameLogWriter(stream_path_for(stream_path, compression), self.metadata,
+                                        keyframe_interval, game_id=self.game_id)
     
     def record_step(self, turn_id, state_t, agent_action, reward_t, terminal, event_log):
         """
@@ -45,7 +135,12 @@ class GameRecorder:
             "terminal": terminal,
             "event_log": event_log
         }
-        self.turn_sequence.append(step_data)
+        if self.stream:
+            if self.stream.closed:
+                raise ValueError(f"Cannot record turn {turn_id}: the game log {self.stream.path} is closed")
+            self.stream.write_turn(step_data)
+        else:
+            self.turn_sequence.append(step_data)
         self.current_turn = turn_id + 1
 
     def record_move(self, player, action, position=None, stone_type=None, direction=None, angle=None, comment="", captures=None):
@@ -79,28 +174,75 @@ class GameRecorder:
             event_log=event_log
         )
     
-    def save_game(self, filename=None):
-        """Save game to JSON file following the Replayable JSON Log schema."""
-        if filename is None:
-            filename = f"games/{self.game_id}.json"
-        
-        # Ensure games directory exists
-        Path("games").mkdir(exist_ok=True)
-        
-        game_data = {
-            "log_version": self.log_version,
-            "metadata": self.metadata,
-            "turn_sequence": self.turn_sequence
-        }
+    def snapshot(self):
+        """
+        Freeze what a save needs; cheap enough for the GUI thread.
         
-        with open(filename, 'w') as f:
-            json.dump(game_data, f, indent=2)
+        Recorded turns are never modified afterwards, so the snapshot shares
+        them and only copies the turn list and the metadata. A streaming
+        recorder records the current metadata and flushes instead: its log
+        file is the snapshot, cut at the turns written so far. Once the
+        recorder is closed the log is final and is returned as it is.
+        """
+        metadata = copy.deepcopy(self.metadata)
+        if self.stream:
+            if not self.stream.closed:
+                self.stream.write_metadata(metadata)
+                self.stream.flush()
+            return GameSnapshot(self.game_id, self.log_version, metadata, (), self.keyframe_interval,
+                                self.stream.path, self.stream.turns_written)
+        return GameSnapshot(self.game_id, self.log_version, metadata, tuple(self.turn_sequence),
+                            self.keyframe_interval, None)
+    
+    def save_game(self, filename=None):
+        """
+        Save game to JSON file following the Replayable JSON Log schema.
         
+        A .jsonl / .jsonl.gz / .jsonl.zst filename writes the keyframe + delta stream format instead.
+        Runs on the calling thread; see _03_ui/save_worker.py for saving in the background.
+        """
+        filename = write_snapshot(self.snapshot(), filename)
         print(f"Game saved to {filename}")
         return filename
     
+    def close(self):
+        """Close the streaming log, if any (deleting it if discard_empty is set and it holds no turns)."""
+        if self.stream and not self.stream.closed:
+            self.stream.close()
+            if self.discard_empty and not self.stream.turns_written:
+                try:
+                    os.remove(self.stream.path)
+                except OSError:
+                    pass
+    
     @staticmethod
     def load_game(filename):
-        """Load a game from JSON file."""
+        """
+        Load a game from a V2 JSON file or a streaming log.
+
+        For a V2 JSON file turn_sequence is a list. For a streaming log it is
+        a one-shot iterator (iter_turns) that decodes turns as it is read;
+        wrap it in list() for random access, or use open_log().
+        """
+        if is_stream_log(filename):
+            header = read_header(filename)
+            return {
+                "log_version": header.get("log_version"),
+                "game_id": header.get("game_id"),
+                "metadata": header.get("metadata", {}),
+                "turn_sequence": iter_stream_turns(filename)
+            }
         with open(filename, 'r') as f:
             return json.load(f)
+    
+    @staticmethod
+    def iter_turns(filename):
+        """Lazily yield turns (with full state_t) from either log format."""
+        if is_stream_log(filename):
+            return iter_stream_turns(filename)
+        return iter(GameRecorder.load_game(filename).get("turn_sequence", []))
+    
+    @staticmethod
+    def open_log(filename):
+        """Open either log format for random access (GameLogIndex.state_at / turn_at)."""
+        return GameLogIndex(filename)
@@ -7,6 +7,7 @@ Description: Source file.
 """
 
 from _01_core_logic.recorder import GameRecorder
+from _01_core_logic.game_library import GameLibrary
 from _01_core_logic.board_state import BoardState2D
 from _02_engines.laser import LaserCalculator2D
 
@@ -90,11 +91,14 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         game_file = sys.argv[1]
     else:
-        # Try to find the most recent game file
-        import glob
-        game_files = glob.glob("games/*.json")
-        if game_files:
-            game_file = max(game_files, key=lambda x: x)
+        # Most recently written game this replayer can read, from the game library index
+        library = GameLibrary()
+        try:
+            library.update()
+            game_file = library.latest(log_format="legacy")
+        finally:
+            library.close()
+        if game_file:
             print(f"Loading most recent game: {game_file}\n")
         else:
             print("No game files found. Run simulate_game.py first.")
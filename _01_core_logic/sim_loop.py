@@ -0,0 +1,96 @@
+"""
+File: sim_loop.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Fixed-timestep simulation loop, decoupled from rendering (headless, no Qt).
+
+Usage:
+    loop = FixedStepLoop(step_fn, tick_rate=2.0)
+    loop.start()
+    # from any frame callback, as often as the display refreshes:
+    steps = loop.advance()
+    draw(loop.alpha)   # 0..1, how far real time is into the next tick
+"""
+
+import time
+
+
+class FixedStepLoop:
+    """
+    Run step_fn(dt) at a fixed rate, however often advance() is called.
+
+    advance() adds the real time since the previous call to an accumulator and
+    runs as many whole ticks as fit in it, so the simulation keeps wall-clock
+    pace whether frames come fast or slow. alpha is the leftover fraction of a
+    tick, for renderers that interpolate between the last two ticks.
+
+    If ticks themselves are slower than real time, catching up would never
+    finish; at most max_catch_up ticks run per advance() and any further
+    backlog is dropped (the simulation slows down instead of freezing).
+    max_catch_up=None never drops time (for cheap ticks such as clocks).
+    """
+
+    def __init__(self, step_fn, tick_rate=10.0, max_catch_up=5, clock=time.perf_counter):
+        if tick_rate <= 0:
+            raise ValueError(f"tick_rate must be positive, got {tick_rate}")
+        self.step_fn = step_fn
+        self.dt = 1.0 / tick_rate
+        self.max_catch_up = max_catch_up
+        self.clock = clock
+
+        self.running = False
+        self.sim_time = 0.0     # Simulated seconds (ticks * dt)
+        self.ticks = 0
+        self.dropped_time = 0.0 # Real seconds skipped by the catch-up limit
+        self._accumulator = 0.0
+        self._last = None
+
+    @property
+    def tick_rate(self):
+        return 1.0 / self.dt
+
+    @property
+    def alpha(self):
+        """Progress into the next tick, in [0, 1)."""
+        return min(self._accumulator / self.dt, 1.0)
+
+    def start(self):
+        """Start (or resume) measuring real time from now."""
+        self.running = True
+        self._last = self.clock()
+
+    def pause(self):
+        """Stop advancing; time spent paused is not simulated."""
+        self.running = False
+        self._last = None
+
+    def reset(self):
+        """Pause and rewind to tick 0."""
+        self.pause()
+        self.sim_time = 0.0
+        self.ticks = 0
+        self.dropped_time = 0.0
+        self._accumulator = 0.0
+
+    def advance(self, now=None):
+        """Simulate up to the current time; returns the number of ticks run."""
+        if not self.running:
+            return 0
+        now = self.clock() if now is None else now
+        self._accumulator += max(0.0, now - self._last)
+        self._last = now
+
+        steps = 0
+        while self._accumulator >= self.dt and self.running:
+            if steps == self.max_catch_up: # Never true for None
+                backlog = self._accumulator - (self._accumulator % self.dt)
+                self.dropped_time += backlog
+                self._accumulator -= backlog
+                break
+            self._accumulator -= self.dt
+            self.step_fn(self.dt)
+            self.sim_time += self.dt
+            self.ticks += 1
+            steps += 1
+        return steps
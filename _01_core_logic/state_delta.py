@@ -0,0 +1,83 @@
+"""
+File: state_delta.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Delta encoding between BoardState2D.to_dict() snapshots.
+"""
+
+STONE_FIELDS = ("type", "player")
+
+
+def diff_states(prev, curr):
+    """
+    Compute the delta that turns snapshot prev into snapshot curr.
+
+    Stones are compared per cell: a stone that appears or changes type/owner
+    is "added" (full record), one that only turned is "rotated" (angle only),
+    and one that disappeared is "removed". Every other top-level field is a
+    scalar that is copied whole when it changes.
+
+    Empty fields are omitted, so an unchanged board yields an empty dict.
+    """
+    delta = {}
+
+    prev_stones = prev.get("stones", {})
+    curr_stones = curr.get("stones", {})
+
+    added = {}
+    rotated = {}
+    for key, stone in curr_stones.items():
+        old = prev_stones.get(key)
+        if old is None or any(old.get(f) != stone.get(f) for f in STONE_FIELDS):
+            added[key] = stone
+        elif old.get("rotation") != stone.get("rotation"):
+            rotated[key] = stone.get("rotation")
+    removed = [key for key in prev_stones if key not in curr_stones]
+
+    if added:
+        delta["stones_added"] = added
+    if removed:
+        delta["stones_removed"] = removed
+    if rotated:
+        delta["stones_rotated"] = rotated
+
+    scalars = {}
+    for key, value in curr.items():
+        if key == "stones":
+            continue
+        if key not in prev or prev[key] != value:
+            scalars[key] = value
+    dropped = [key for key in prev if key != "stones" and key not in curr]
+
+    if scalars:
+        delta["scalars"] = scalars
+    if dropped:
+        delta["scalars_removed"] = dropped
+
+    return delta
+
+
+def apply_delta(state, delta):
+    """Return a new snapshot: state with delta applied. The input is not modified."""
+    result = dict(state)
+
+    if "scalars_removed" in delta:
+        for key in delta["scalars_removed"]:
+            result.pop(key, None)
+    if "scalars" in delta:
+        result.update(delta["scalars"])
+
+    if any(k in delta for k in ("stones_added", "stones_removed", "stones_rotated")):
+        stones = dict(state.get("stones", {}))
+        for key in delta.get("stones_removed", []):
+            stones.pop(key, None)
+        for key, stone in delta.get("stones_added", {}).items():
+            stones[key] = stone
+        for key, rotation in delta.get("stones_rotated", {}).items():
+            stone = dict(stones[key])
+            stone["rotation"] = rotation
+            stones[key] = stone
+        result["stones"] = stones
+
+    return result
@@ -0,0 +1,181 @@
+"""
+File: symmetry.py
+Creation Date: 2026-10-19
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: The 8 symmetries of the square board, applied to boards, state dicts and actions (headless).
+
+A transform t in 0..7 mirrors x (x -> g-1-x) when t >= 4, then turns the
+board t % 4 quarter turns ((x, y) -> (g-1-y, x)). Stone rotations turn
+with the board: a stone's surface normal is (cos a, sin a), so a quarter
+turn adds 90 degrees and the mirror maps a to 180 - a. Laser directions
+and curve control points transform like positions, so the laser paths of
+a transformed board are the transformed paths of the original (territory
+can still differ by a cell or two where LaserCalculator2D rounds points
+lying half-way between cells).
+
+Placed stones start at rotation 0 on every board, so a place action
+commutes with t up to the new stone's rotation.
+
+Usage:
+    board_c, t = canonicalize(board)            # same result for all 8 symmetric boards
+    action = transform_action(action_c, inverse(t), board.grid_size)   # back to board's frame
+
+    key, t = canonical_key(board)               # hashable, for caches keyed on positions
+"""
+
+TRANSFORMS = tuple(range(8))
+IDENTITY = 0
+
+
+def inverse(t):
+    """The transform undoing t (mirrored transforms are their own inverse)."""
+    return t if t >= 4 else (4 - t) % 4
+
+
+def transform_point(x, y, t, grid_size):
+    """Map a position (ints stay ints; floats and off-board points such as laser sources are fine)."""
+    if t >= 4:
+        x = grid_size - 1 - x
+    for _ in range(t % 4):
+        x, y = grid_size - 1 - y, x
+    return x, y
+
+
+def transform_vector(dx, dy, t):
+    """Map a direction."""
+    if t >= 4:
+        dx = -dx
+    for _ in range(t % 4):
+        dx, dy = -dy, dx
+    return dx, dy
+
+
+def transform_angle(angle, t):
+    """Map a stone rotation in degrees (result in [0, 360))."""
+    if t >= 4:
+        angle = 180 - angle
+    return (angle + 90 * (t % 4)) % 360
+
+
+def cell_permutation(t, grid_size):
+    """dest[y * g + x] = the cell index (x, y) maps to, in the y-major order of GameServer observations."""
+    dest = []
+    for y in range(grid_size):
+        for x in range(grid_size):
+            tx, ty = transform_point(x, y, t, grid_size)
+            dest.append(ty * grid_size + tx)
+    return dest
+
+
+def transform_stones(stones, t, grid_size):
+    """New {(x, y): StoneData2D} with every stone moved and turned."""
+    from _01_core_logic.board_state import StoneData2D
+
+    out = {}
+    for pos, stone in stones.items():
+        new_stone = StoneData2D(stone.stone_type, stone.player)
+        new_stone.rotation_angle = transform_angle(stone.rotation_angle, t)
+        new_stone.velocity = stone.velocity
+        out[transform_point(pos[0], pos[1], t, grid_size)] = new_stone
+    return out
+
+
+def transform_board(board, t):
+    """A copy of board with stones and laser sources transformed (everything else unchanged)."""
+    g = board.grid_size
+    new_board = board.clone()
+    if t == IDENTITY:
+        return new_board
+    new_board.stones = transform_stones(board.stones, t, g)
+    new_board.laser_sources = [
+        (transform_point(pos[0], pos[1], t, g), transform_vector(d[0], d[1], t), player)
+        for pos, d, player in board.laser_sources
+    ]
+    return new_board
+
+
+def transform_state(state, t):
+    """A copy of a to_dict() / state_t dict with its "x,y"-keyed stones transformed."""
+    g = state.get("grid_size", 19)
+    new_state = dict(state)
+    stones = {}
+    for key, stone in (state.get("stones") or {}).items():
+        x, y = transform_point(*map(int, key.split(",")), t, g)
+        stones[f"{x},{y}"] = dict(stone, rotation=transform_angle(stone.get("rotation", 0.0), t))
+    new_state["stones"] = stones
+    return new_state
+
+
+_POINT_KEYS = (("x", "y"), ("from_x", "from_y"), ("to_x", "to_y"), ("control_x", "control_y"), ("end_x", "end_y"))
+
+
+def _transform_fields(fields, t, grid_size, kind):
+    out = dict(fields)
+    for kx, ky in _POINT_KEYS:
+        if out.get(kx) is not None and out.get(ky) is not None:
+            out[kx], out[ky] = transform_point(out[kx], out[ky], t, grid_size)
+    if out.get("dx") is not None and out.get("dy") is not None:
+        out["dx"], out["dy"] = transform_vector(out["dx"], out["dy"], t)
+    for key in ("position", "to"):
+        if out.get(key) is not None:
+            out[key] = transform_point(out[key][0], out[key][1], t, grid_size)
+    if out.get("direction") is not None:
+        out["direction"] = transform_vector(out["direction"][0], out["direction"][1], t)
+    for key in ("positions", "captures"):
+        if out.get(key):
+            out[key] = [transform_point(p[0], p[1], t, grid_size) for p in out[key]]
+    if kind == "rotate" and out.get("angle") is not None:
+        out["angle"] = transform_angle(out["angle"], t) # Rotations are absolute
+    return out
+
+
+def transform_action(action, t, grid_size):
+    """
+    Map a GameServer action ({"type", "x", "y", ...}) or a recorded one
+    ({"type", "params": {...}}) onto the transformed board.
+
+    GameServer fires a laser action from the cell's (x + 0.5, y + 0.5), which
+    does not turn with the board, so laser actions match only up to that
+    half-cell offset.
+    """
+    if not action:
+        return action
+    kind = action.get("type")
+    out = _transform_fields(action, t, grid_size, kind)
+    if isinstance(action.get("params"), dict):
+        out["params"] = _transform_fields(action["params"], t, grid_size, kind)
+    return out
+
+
+def position_key(board, t=IDENTITY):
+    """Hashable key of board's stones and laser sources as seen through t."""
+    g = board.grid_size
+    stones = sorted(
+        transform_point(pos[0], pos[1], t, g)
+        + (s.stone_type.value, s.player, round(transform_angle(s.rotation_angle, t), 6))
+        for pos, s in board.stones.items()
+    )
+    sources = sorted(
+        tuple(round(v, 6) for v in transform_point(pos[0], pos[1], t, g) + transform_vector(d[0], d[1], t))
+        + (player,)
+        for pos, d, player in board.laser_sources
+    )
+    return tuple(stones), tuple(sources)
+
+
+def canonical_key(board):
+    """
+    (key, t): the smallest position_key over the 8 transforms and the
+    transform giving it (the lowest one when the board is itself symmetric).
+
+    Symmetric boards share the key. It covers stones and laser sources
+    only; callers add energy, captures or the player to move if they matter.
+    """
+    return min((position_key(board, t), t) for t in TRANSFORMS)
+
+
+def canonicalize(board):
+    """(canonical board, t) with canonical board = transform_board(board, t)."""
+    t = canonical_key(board)[1]
+    return transform_board(board, t), t
@@ -0,0 +1,72 @@
+"""
+File: zobrist.py
+Creation Date: 2026-10-19
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: 64-bit Zobrist hashes of board positions, for transposition tables (headless).
+
+Each (cell, stone type, owner) has a fixed random key; a stone's rotation
+is mixed into its key, since rotations are continuous. The player to move,
+energies (unless infinite), captures, consecutive passes and game over are
+folded in as well. The keys come from a fixed seed, so every process
+hashes a position to the same value (tables can be shared between them).
+Turn counts are not hashed.
+
+Usage:
+    key = zobrist_hash(server.board, server.current_player)
+"""
+
+from functools import lru_cache
+import random
+import struct
+
+from _01_core_logic.board_state import StoneType
+
+ZOBRIST_SEED = 0x60_1A_51_CA
+MASK64 = (1 << 64) - 1
+
+_SIDE_TO_MOVE = 0x9E3779B97F4A7C15
+_ENERGY = (0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9)
+_CAPTURES = (0x27D4EB2F165667C5, 0x85EBCA77C2B2AE63)
+_PASSES = 0xFF51AFD7ED558CCD
+_GAME_OVER = 0xC4CEB9FE1A85EC53
+
+
+def _mix64(z):
+    """splitmix64 finaliser: spreads any 64-bit value over all bits."""
+    z = (z + 0x9E3779B97F4A7C15) & MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+@lru_cache(maxsize=None)
+def stone_keys(grid_size):
+    """Random key per (y * g + x) * 8 + (player - 1) * 4 + (type - 1)."""
+    rng = random.Random(ZOBRIST_SEED ^ grid_size)
+    return tuple(rng.getrandbits(64) for _ in range(grid_size * grid_size * 2 * len(StoneType)))
+
+
+def _rotation_bits(angle):
+    return struct.unpack("<Q", struct.pack("<d", float(angle) % 360))[0]
+
+
+def zobrist_hash(board, player_to_move=1):
+    """64-bit hash of a BoardState2D with player_to_move (1 or 2) to move."""
+    g = board.grid_size
+    keys = stone_keys(g)
+    h = _mix64(g)
+    for (x, y), stone in board.stones.items():
+        key = keys[((y * g + x) * 2 + stone.player - 1) * len(StoneType) + stone.stone_type.value - 1]
+        h ^= _mix64(key ^ _rotation_bits(stone.rotation_angle)) if stone.rotation_angle else key
+    if player_to_move == 2:
+        h ^= _SIDE_TO_MOVE
+    for player in (1, 2):
+        if not board.infinite_energy:
+            h ^= _mix64(_ENERGY[player - 1] ^ int(board.player_energy.get(player, 0)))
+        h ^= _mix64(_CAPTURES[player - 1] ^ int(board.player_captures.get(player, 0)))
+    if board.consecutive_passes:
+        h ^= _mix64(_PASSES ^ board.consecutive_passes)
+    if board.game_over:
+        h ^= _GAME_OVER
+    return h
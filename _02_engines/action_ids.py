@@ -0,0 +1,131 @@
+"""
+File: action_ids.py
+Creation Date: 2026-10-19
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: Integer ids for game actions, shared by the training data export and the search engine.
+
+Every action on a g x g board maps to one id in [0, num_actions(g)), laid
+out as ACTION_BLOCKS describes; angles and directions are binned to
+multiples of 45 degrees.
+
+Usage:
+    action_id = encode_action(recorded_or_server_action, grid_size)   # -1 if it has none
+    action = decode_action(action_id, grid_size)                       # a GameServer action
+"""
+
+import math
+
+from _01_core_logic.board_state import StoneType
+
+# Action id layout for a g x g board (cell = y * g + x, the observation order):
+# each block below holds bins * g * g ids, then pass and surrender.
+ACTION_BLOCKS = (
+    ("place", len(StoneType)),  # bin: stone type (StoneType.value - 1)
+    ("rotate", 8),              # bin: angle // 45
+    ("laser", 8),               # bin: direction, k * 45 degrees from +x (as GameServer's laser actions)
+    ("move", 8),                # bin: direction to the target cell
+    ("curve_move", 8),          # bin: direction to the end cell (the control point is not kept)
+)
+SINGLE_ACTIONS = ("pass", "surrender")
+
+
+def num_actions(grid_size):
+    """Size of the action id space for grid_size."""
+    return sum(bins for _, bins in ACTION_BLOCKS) * grid_size * grid_size + len(SINGLE_ACTIONS)
+
+
+def _direction_bin(dx, dy):
+    return int(round(math.atan2(dy, dx) / (math.pi / 4))) % 8
+
+
+def _wrapped_delta(a, b, grid_size):
+    """b - a along one axis, taking the shorter way around the wrapping board."""
+    d = (b - a) % grid_size
+    return d - grid_size if d > grid_size / 2 else d
+
+
+def encode_action(action, grid_size):
+    """
+    Integer id of a recorded action ({"type", "params"} as MainWindow records
+    it, or a flat GameServer action), or -1 if it has none (e.g. select).
+
+    Continuous parameters are binned: angles and directions to the nearest
+    multiple of 45 degrees.
+    """
+    action = action or {}
+    params = dict(action)
+    params.update(action.get("params") or {})
+    kind = action.get("type")
+    if kind in SINGLE_ACTIONS:
+        return sum(bins for _, bins in ACTION_BLOCKS) * grid_size * grid_size + SINGLE_ACTIONS.index(kind)
+
+    if "position" in params and params["position"] is not None:
+        x, y = params["position"]
+    elif "from_x" in params:
+        x, y = params["from_x"], params["from_y"]
+    else:
+        x, y = params.get("x"), params.get("y")
+    if x is None or y is None:
+        return -1
+    cell = (int(y) % grid_size) * grid_size + int(x) % grid_size
+
+    if kind == "place":
+        try:
+            b = StoneType[params.get("stone_type", "PRISM")].value - 1
+        except KeyError:
+            return -1
+    elif kind == "rotate":
+        b = int(round(float(params.get("angle") or 0) / 45)) % 8
+    elif kind == "laser":
+        if params.get("direction") is not None:
+            dx, dy = params["direction"]
+        else:
+            dx, dy = params.get("dx", 1), params.get("dy", 0)
+        b = _direction_bin(dx, dy)
+    elif kind in ("move", "curve_move"):
+        if params.get("to") is not None:
+            tx, ty = params["to"]
+        else:
+            tx, ty = params.get("to_x", params.get("end_x")), params.get("to_y", params.get("end_y"))
+        if tx is None or ty is None:
+            return -1
+        b = _direction_bin(_wrapped_delta(x, tx, grid_size), _wrapped_delta(y, ty, grid_size))
+    else:
+        return -1
+
+    offset = 0
+    for name, bins in ACTION_BLOCKS:
+        if name == kind:
+            return offset + b * grid_size * grid_size + cell
+        offset += bins * grid_size * grid_size
+    return -1
+
+
+def decode_action(action_id, grid_size):
+    """GameServer action for an id (binned values come back as the bin's centre)."""
+    cells = grid_size * grid_size
+    offset = 0
+    for name, bins in ACTION_BLOCKS:
+        if action_id < offset + bins * cells:
+            b, cell = divmod(action_id - offset, cells)
+            y, x = divmod(cell, grid_size)
+            if name == "place":
+                return {"type": "place", "x": x, "y": y, "stone_type": StoneType(b + 1).name}
+            if name == "rotate":
+                return {"type": "rotate", "x": x, "y": y, "angle": b * 45}
+            rad = b * math.pi / 4
+            if name == "laser":
+                return {"type": "laser", "x": x, "y": y, "dx": math.cos(rad), "dy": math.sin(rad)}
+            dx, dy = int(round(math.cos(rad))), int(round(math.sin(rad)))
+            if name == "move":
+                return {"type": "move", "from_x": x, "from_y": y,
+                        "to_x": (x + dx) % grid_size, "to_y": (y + dy) % grid_size}
+            return {"type": "curve_move", "from_x": x, "from_y": y,
+                    "control_x": x + dx, "control_y": y + dy,
+                    "end_x": (x + 2 * dx) % grid_size, "end_y": (y + 2 * dy) % grid_size}
+        offset += bins * cells
+    index = action_id - offset
+    if 0 <= index < len(SINGLE_ACTIONS):
+        return {"type": SINGLE_ACTIONS[index]}
+    raise ValueError(f"action id {action_id} out of range for grid size {grid_size}")
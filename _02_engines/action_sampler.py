@@ -0,0 +1,159 @@
+"""
+File: action_sampler.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Uniform sampling of valid actions without enumerating the full action list.
+"""
+
+import math
+import random
+
+from _01_core_logic import instrumentation
+
+STONE_TYPES = ["PRISM", "MIRROR", "SPLITTER", "BLOCKER"]
+ROTATION_ANGLES = [0, 45, 90, 135, 180, 225, 270, 315]
+MOVE_DIRECTIONS = [
+    (0, -1), (0, 1), (-1, 0), (1, 0),
+    (-1, -1), (1, -1), (-1, 1), (1, 1)
+]
+
+# Sample sizes used for LLM prompts when the caller does not specify any
+DEFAULT_K_PER_TYPE = {"place": 5, "rotate": 1, "laser": 3, "move": 3, "curve_move": 3, "pass": 0}
+
+
+def _resolve_k(k_per_type):
+    """Normalise k_per_type (int, dict or None) into a per-type dict."""
+    if k_per_type is None:
+        return dict(DEFAULT_K_PER_TYPE)
+    if isinstance(k_per_type, int):
+        return {action_type: k_per_type for action_type in DEFAULT_K_PER_TYPE}
+    return {action_type: k_per_type.get(action_type, 0) for action_type in DEFAULT_K_PER_TYPE}
+
+
+def _nth_empty_cell(rank, occupied_sorted, grid_size):
+    """Return the rank-th empty cell in row-major order, given sorted occupied linear indices."""
+    index = rank
+    for occupied in occupied_sorted:
+        if occupied <= index:
+            index += 1
+        else:
+            break
+    return index % grid_size, index // grid_size
+
+
+@instrumentation.timed("actions.sample")
+def sample_valid_actions(board, player, k_per_type=None, rng=None, realtime_mode=False):
+    """
+    Draw up to k valid actions of each type, uniformly from the legal set.
+
+    Place, rotate and laser actions are drawn by index sampling over the
+    (cell x option) space, so the cost depends on k and the stone count,
+    not on the board area. Move actions are drawn by shuffled rejection over
+    the 8 neighbours of each own stone. Curve moves are random by nature and
+    are generated the same way get_valid_actions() does.
+
+    Args:
+        board: BoardState2D
+        player: Player to move (1 or 2)
+        k_per_type: int for every type, or dict {action_type: k}
+        rng: random.Random (or the random module) used for all draws
+        realtime_mode: Whether move/curve_move actions are legal
+
+    Returns:
+        {"valid_actions": [...], "count": n, "available": {action_type: legal count}}
+    """
+    if rng is None:
+        rng = random
+    k = _resolve_k(k_per_type)
+    grid_size = board.grid_size
+
+    sample = []
+    available = {}
+
+    own_positions = sorted(pos for pos, stone in board.stones.items() if stone.player == player)
+
+    # Place: (empty cell, stone type) pairs
+    occupied_sorted = sorted(
+        y * grid_size + x for (x, y) in board.stones
+        if 0 <= x < grid_size and 0 <= y < grid_size
+    )
+    n_place = (grid_size * grid_size - len(occupied_sorted)) * len(STONE_TYPES)
+    if not board.has_energy(player, 1):
+        n_place = 0
+    available["place"] = n_place
+    if n_place and k["place"]:
+        for index in rng.sample(range(n_place), min(k["place"], n_place)):
+            cell_rank, type_index = divmod(index, len(STONE_TYPES))
+            x, y = _nth_empty_cell(cell_rank, occupied_sorted, grid_size)
+            sample.append({"type": "place", "x": x, "y": y, "stone_type": STONE_TYPES[type_index]})
+
+    # Rotate: (own stone, angle) pairs
+    n_rotate = len(own_positions) * len(ROTATION_ANGLES)
+    available["rotate"] = n_rotate
+    if n_rotate and k["rotate"]:
+        for index in rng.sample(range(n_rotate), min(k["rotate"], n_rotate)):
+            stone_index, angle_index = divmod(index, len(ROTATION_ANGLES))
+            pos = own_positions[stone_index]
+            sample.append({"type": "rotate", "x": pos[0], "y": pos[1], "angle": ROTATION_ANGLES[angle_index]})
+
+    # Laser: (own stone, direction) pairs
+    n_laser = len(own_positions) * 8
+    available["laser"] = n_laser
+    if n_laser and k["laser"]:
+        for index in rng.sample(range(n_laser), min(k["laser"], n_laser)):
+            stone_index, direction = divmod(index, 8)
+            pos = own_positions[stone_index]
+            rad = direction * math.pi / 4
+            sample.append({"type": "laser", "x": pos[0], "y": pos[1], "dx": math.cos(rad), "dy": math.sin(rad)})
+
+    if realtime_mode:
+        # Move: rejection over shuffled (own stone, direction) candidates
+        n_candidates = len(own_positions) * len(MOVE_DIRECTIONS)
+        moves = []
+        n_move = 0
+        for index in rng.sample(range(n_candidates), n_candidates):
+            stone_index, direction_index = divmod(index, len(MOVE_DIRECTIONS))
+            pos = own_positions[stone_index]
+            dx, dy = MOVE_DIRECTIONS[direction_index]
+            nx = (pos[0] + dx) % grid_size
+            ny = (pos[1] + dy) % grid_size
+            if (nx, ny) in board.stones:
+                continue
+            n_move += 1
+            if len(moves) < k["move"]:
+                moves.append({"type": "move", "from_x": pos[0], "from_y": pos[1], "to_x": nx, "to_y": ny})
+        available["move"] = n_move
+        sample.extend(moves)
+
+        # Curve move: random quadratic Bezier per draw (bounded attempts)
+        if own_positions and k["curve_move"]:
+            curves = 0
+            attempts = 0
+            while curves < k["curve_move"] and attempts < k["curve_move"] * 4:
+                attempts += 1
+                pos = own_positions[rng.randrange(len(own_positions))]
+                angle = rng.uniform(0, 2 * math.pi)
+                radius = rng.randint(1, max(1, min(3, grid_size // 4)))
+                cx = round(pos[0] + radius * math.cos(angle), 1)
+                cy = round(pos[1] + radius * math.sin(angle), 1)
+                ex = int(round(pos[0] + 2 * radius * math.cos(angle))) % grid_size
+                ey = int(round(pos[1] + 2 * radius * math.sin(angle))) % grid_size
+                # Same (cached) sweep the move itself will use; reject curves blocked at the first step
+                final_pos, _ = board.trace_curve(pos, [(cx, cy), (ex, ey)])
+                if final_pos == pos:
+                    continue
+                curves += 1
+                sample.append({
+                    "type": "curve_move",
+                    "from_x": pos[0], "from_y": pos[1],
+                    "control_x": cx, "control_y": cy,
+                    "end_x": ex, "end_y": ey
+                })
+
+    # Pass is always legal
+    available["pass"] = 1
+    if k["pass"]:
+        sample.append({"type": "pass"})
+
+    return {"valid_actions": sample, "count": len(sample), "available": available}
@@ -1,4 +1,5 @@
 import json
+import logging
 import ollama
 import sys
 import random
@@ -6,15 +7,22 @@ import os
 
 # Importamos el servidor del juego proporcionado
 from _00_entry.game_server import GameServer
+from _01_core_logic import instrumentation
 
+logger = logging.getLogger(__name__)
 MODEL_NAME = "gemma3:4b"  # Cambia a "gemma3" si ya lo tienes en tu lista de 'ollama list'
 
 class AIAgent:
-    def __init__(self, player_id: int, model_name: str = MODEL_NAME, mechanics_path: str = "MECHANICS.md", use_all_playbooks: bool = False):
+    def __init__(self, player_id: int, model_name: str = MODEL_NAME, mechanics_path: str = "MECHANICS.md", use_all_playbooks: bool = False,
+                 temperature: float = 0.2, cache=None, playbook: str = None, rng=None):
         self.player_id = player_id
+        self.rng = rng if rng is not None else random  # Semilla reproducible para las muestras de acciones
         self.model_name = model_name
+        self.temperature = temperature
+        self.cache = cache  # Optional LLMResponseCache
+        self.playbook_name = None  # Estrategia cargada: nombre del playbook, "all" o None
         self.mechanics_content = self._load_mechanics(mechanics_path)
-        self.playbook_content = self._load_playbooks(use_all_playbooks)
+        self.playbook_content = self._load_playbooks(use_all_playbooks, playbook)
         self.my_symbols = "MAYÚSCULAS (P, M, S)" if player_id == 1 else "minúsculas (p, m, s)"
         self.opp_symbols = "minúsculas (p, m, s)" if player_id == 1 else "MAYÚSCULAS (P, M, S)"
 
@@ -30,11 +38,11 @@ class AIAgent:
                     return f.read()
             return "No se pudo cargar MECHANICS.md. Usa tu conocimiento general del juego."
         except Exception as e:
-            print(f"Error cargando mechanics: {e}")
+            logger.warning("Error cargando mechanics: %s", e)
             return "Error cargando reglas."
 
-    def _load_playbooks(self, use_all: bool) -> str:
-        """Carga una o todas las estrategias de la carpeta playbooks."""
+    def _load_playbooks(self, use_all: bool, playbook: str = None) -> str:
+        """Carga una estrategia concreta, una aleatoria o todas las de la carpeta playbooks."""
         try:
             playbook_dir = "_02_engines/playbooks"
             if not os.path.exists(playbook_dir):
@@ -43,12 +51,21 @@ class AIAgent:
                 if not os.path.exists(playbook_dir):
                      return ""
             
-            files = [f for f in os.listdir(playbook_dir) if f.endswith(".md")]
+            # Orden estable: el contenido (y la clave de caché) no depende del sistema de archivos
+            files = sorted(f for f in os.listdir(playbook_dir) if f.endswith(".md"))
             if not files:
                 return ""
             
+            if playbook:
+                chosen_file = playbook if playbook.endswith(".md") else f"{playbook}.md"
+                logger.info("Agente %s usa la estrategia fijada: %s", self.player_id, chosen_file)
+                self.playbook_name = chosen_file[:-len(".md")]
+                with open(os.path.join(playbook_dir, chosen_file), 'r', encoding='utf-8') as f:
+                    return f.read()
+            
             if use_all:
-                print(f"Agente {self.player_id} cargando TODAS las estrategias ({len(files)} playbooks)...")
+                logger.info("Agente %s cargando TODAS las estrategias (%d playbooks)...", self.player_id, len(files))
+                self.playbook_name = "all"
                 content = ""
                 for filename in files:
                     with open(os.path.join(playbook_dir, filename), 'r', encoding='utf-8') as f:
@@ -57,12 +74,13 @@ class AIAgent:
             else:
                 chosen_file = random.choice(files)
                 path = os.path.join(playbook_dir, chosen_file)
-                print(f"Agente {self.player_id} ha seleccionado estrategia: {chosen_file}")
+                logger.info("Agente %s ha seleccionado estrategia: %s", self.player_id, chosen_file)
+                self.playbook_name = chosen_file[:-len(".md")]
                 with open(path, 'r', encoding='utf-8') as f:
                     return f.read()
 
         except Exception as e:
-            print(f"Error cargando playbook: {e}")
+            logger.warning("Error cargando playbook: %s", e)
             return ""
 
     def render_board_ascii(self, server: GameServer) -> str:
@@ -95,6 +113,13 @@ class AIAgent:
         """
         Obtiene acciones válidas y devuelve un resumen o una muestra aleatoria.
         """
+        if hasattr(server, "sample_valid_actions"):
+            # Muestreo directo: no se construye la lista completa de acciones
+            sample = server.sample_valid_actions(None, self.rng).get("valid_actions", [])
+            sample = [a for a in sample if a['type'] != 'pass']
+            sample.append({"type": "select", "positions": [[3, 3], [4, 4], [5, 5]]})
+            return sample, json.dumps(sample)
+        
         actions_response = server.get_valid_actions()
         valid_actions = actions_response.get("valid_actions", [])
         
@@ -167,8 +192,8 @@ class AIAgent:
             directive = "ESTADO EQUILIBRADO: Busca una apertura táctica o línea de tiro clara."
 
         # Tactical Insight: Specifically check for laser shots that score
-        laser_actions = server.get_valid_actions().get("valid_actions", [])
-        score_potential = [a for a in laser_actions if a['type'] == 'laser']
+        # Hay disparos disponibles si tenemos al menos una pieza propia
+        score_potential = any(stone.player == self.player_id for stone in server.board.stones.values())
         if score_potential:
             directive += "\n¡OPORTUNIDAD DE DISPARO! Tienes acciones de LÁSER disponibles. Úsalas para puntuar o capturar."
 
@@ -187,6 +212,7 @@ class AIAgent:
         DIRECTIVA ESTRATÉGICA: {directive}
         """
 
+    @instrumentation.timed("ai.get_move")
     def get_move(self, server: GameServer) -> dict:
         """Consulta a Ollama para obtener el siguiente movimiento."""
         board_ascii = self.render_board_ascii(server)
@@ -265,43 +291,58 @@ class AIAgent:
             valid_sample=valid_sample
         )
         
-        # 2. Log Prompt (Truncated for readability)
-        log_prompt = prompt_template.format(
-            player_id=self.player_id,
-            mechanics=mech_summary,
-            playbooks=play_summary,
-            my_symbols=self.my_symbols,
-            opp_symbols=self.opp_symbols,
-            board_ascii=board_ascii,
-            structured_state=structured_state,
-            valid_sample=valid_sample
-        )
-
         try:
-            print(f"Agente {self.player_id} ({self.model_name}) pensando...")
+            logger.info("Agente %s (%s) pensando...", self.player_id, self.model_name)
+            
+            # 2. Log Prompt (Truncated for readability), only built at DEBUG
+            if logger.isEnabledFor(logging.DEBUG):
+                log_prompt = prompt_template.format(
+                    player_id=self.player_id,
+                    mechanics=mech_summary,
+                    playbooks=play_summary,
+                    my_symbols=self.my_symbols,
+                    opp_symbols=self.opp_symbols,
+                    board_ascii=board_ascii,
+                    structured_state=structured_state,
+                    valid_sample=valid_sample
+                )
+                logger.debug("\n--- PROMPT LOG (Player %s) ---\n%s\n--- PROMPT END ---", self.player_id, log_prompt)
             
-            # Print elegant log prompt
-            print(f"\n--- PROMPT LOG (Player {self.player_id}) ---\n{log_prompt}\n--- PROMPT END ---")
+            raw_response = None
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key(self.model_name, self.playbook_content, prompt, self.temperature)
+                raw_response = self.cache.get(cache_key)
+                instrumentation.count("ai.cache_hit" if raw_response is not None else "ai.cache_miss")
+                if raw_response is not None:
+                    logger.info("Agente %s: respuesta recuperada de la caché.", self.player_id)
+                elif self.cache.replay:
+                    logger.warning("Agente %s: sin entrada en caché (modo replay), no se consulta el modelo.", self.player_id)
+                    return None
             
-            response = ollama.generate(
-                model=self.model_name, 
-                prompt=prompt, 
-                format="json",
-                options={"temperature": 0.2, "num_ctx": 4096}
-            )
+            if raw_response is None:
+                with instrumentation.span("ai.llm_generate"):
+                    response = ollama.generate(
+                        model=self.model_name, 
+                        prompt=prompt, 
+                        format="json",
+                        options={"temperature": self.temperature, "num_ctx": 4096}
+                    )
+                raw_response = response['response']
+                if self.cache is not None:
+                    self.cache.put(cache_key, self.model_name, raw_response)
             
-            raw_response = response['response']
-            print(f"\n--- RAW RESPONSE ---\n{raw_response}\n--- END RESPONSE ---")
+            logger.debug("\n--- RAW RESPONSE ---\n%s\n--- END RESPONSE ---", raw_response)
             
             clean_json = raw_response.replace("```json", "").replace("```", "").strip()
             action = json.loads(clean_json)
             
             if "thought" in action:
-                print(f"💭 PENSAMIENTO (Agente {self.player_id}): {action['thought']}")
+                logger.info("💭 PENSAMIENTO (Agente %s): %s", self.player_id, action['thought'])
                 
             return action
         except Exception as e:
-            print(f"Error en Agente {self.player_id}: {e}")
+            logger.warning("Error en Agente %s: %s", self.player_id, e)
             return None
 
 def main():
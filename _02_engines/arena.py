@@ -1,4 +1,5 @@
 import json
+import sys
 import time
 import random
 import ollama
@@ -7,20 +8,33 @@ from typing import List, Dict, Any
 # Importamos el servidor del juego y el agente unificado
 from _00_entry.game_server import GameServer
 from _02_engines.ai_player import AIAgent
+from _02_engines.llm_cache import LLMResponseCache
+from _01_core_logic import log_config
 
 # --- CONFIGURACIÓN DE LA ARENA ---
 MODELO_JUGADOR_1 = "gemma3:4b"
 MODELO_JUGADOR_2 = "gemma3:4b"
 DELAY_ENTRE_TURNOS = 3.0
+RUTA_CACHE_LLM = "cache/llm_cache.sqlite"
 
-def main():
+def main(cache_path=None, replay=False, seed=None):
+    # Semilla fija: prompts y fallbacks reproducibles (necesario para el modo replay)
+    if seed is not None:
+        random.seed(seed)
+    
+    # Caché de respuestas LLM (opcional)
+    cache = None
+    if cache_path or replay:
+        cache = LLMResponseCache(cache_path or RUTA_CACHE_LLM, replay=replay)
+        print(f"Caché LLM activa: {cache.path} (replay={replay})")
+    
     # 1. Inicializar Servidor y Agentes
     server = GameServer(grid_size=9) # Reducido a 9x9 para que sea más rápido para la IA
     server.reset({"starting_energy": 10})
     
     # El nuevo Agente carga mechanics y playbooks automáticamente
-    p1 = AIAgent(1, MODELO_JUGADOR_1, mechanics_path="MECHANICS.md", use_all_playbooks=True)
-    p2 = AIAgent(2, MODELO_JUGADOR_2, mechanics_path="MECHANICS.md", use_all_playbooks=True)
+    p1 = AIAgent(1, MODELO_JUGADOR_1, mechanics_path="MECHANICS.md", use_all_playbooks=True, cache=cache)
+    p2 = AIAgent(2, MODELO_JUGADOR_2, mechanics_path="MECHANICS.md", use_all_playbooks=True, cache=cache)
     
     agents = {1: p1, 2: p2}
     
@@ -61,7 +75,9 @@ def main():
                 server.step({"type": "pass"})
 
         turn += 1
-        time.sleep(DELAY_ENTRE_TURNOS)
+        # Sin esperas en modo replay: no hay servidor de modelos que proteger
+        if not replay:
+            time.sleep(DELAY_ENTRE_TURNOS)
 
 
     # Fin del juego
@@ -70,6 +86,20 @@ def main():
     print(f"Ganador: Jugador {server.winner}")
     print(f"Razón: {server.victory_reason}")
     print("="*30)
+    
+    if cache is not None:
+        print(f"Estadísticas de caché: {cache.stats()}")
+        cache.close()
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="GoLuminamics CLI Arena")
+    parser.add_argument("--cache", type=str, default=None, help="Path to the SQLite LLM response cache")
+    parser.add_argument("--replay", action="store_true", help="Serve moves only from the cache (offline, no model server)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible prompts and fallbacks")
+    parser.add_argument("--log-level", type=str, default=None,
+                        help="Log levels, e.g. 'DEBUG' or 'INFO,_02_engines.ai_player=DEBUG' (prompts are DEBUG)")
+    
+    args = parser.parse_args()
+    log_config.configure(args.log_level, default="INFO", stream=sys.stdout, fmt="%(message)s")
+    main(cache_path=args.cache, replay=args.replay, seed=args.seed)
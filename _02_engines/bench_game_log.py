@@ -0,0 +1,123 @@
+"""
+File: bench_game_log.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Benchmark game log formats (V2 JSON vs keyframe + delta JSON Lines) on self-play games.
+
+Usage:
+    python -m _02_engines.bench_game_log --turns 500 --grid-size 19 --keyframe-interval 10
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from _00_entry.game_server import GameServer
+from _01_core_logic.recorder import GameRecorder
+
+# Actions drawn per turn for the random self-play policy (no passes)
+SELF_PLAY_K = {"place": 2, "rotate": 1, "laser": 1, "move": 2, "curve_move": 1}
+
+
+def _recorded_action(action, player):
+    """Convert a GameServer action into the {"type", "params"} form MainWindow records."""
+    params = {"player": player}
+    if "x" in action:
+        params["position"] = (action["x"], action["y"])
+    elif "from_x" in action:
+        params["position"] = (action["from_x"], action["from_y"])
+        params["to"] = (action.get("to_x", action.get("end_x")), action.get("to_y", action.get("end_y")))
+    if "stone_type" in action:
+        params["stone_type"] = action["stone_type"]
+    if "angle" in action:
+        params["angle"] = action["angle"]
+    if "dx" in action:
+        params["direction"] = (action["dx"], action["dy"])
+    return {"type": action["type"], "params": params}
+
+
+def self_play(recorder, turns, grid_size, seed):
+    """
+    Play a random self-play game into recorder.
+
+    Realtime rules keep stones moving and passes are never sampled, so the
+    game runs its full length instead of ending on a mutual pass.
+    """
+    random.seed(seed)
+    rng = random.Random(seed)
+    server = GameServer(grid_size=grid_size)
+    server.reset({"realtime_mode": True, "infinite_energy": True, "infinite_score": True,
+                  "max_turns": turns + 1})
+
+    for turn_id in range(1, turns + 1):
+        actions = server.sample_valid_actions(k_per_type=SELF_PLAY_K, rng=rng)["valid_actions"]
+        action = rng.choice(actions) if actions else {"type": "pass"}
+        player = server.current_player
+        result = server.step(action)
+        recorder.record_step(turn_id, server.board.to_dict(), _recorded_action(action, player),
+                             result.get("reward", 0.0),
+                             server.game_over, [])
+        if server.game_over:
+            break
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def run(turns, grid_size, keyframe_interval, seed, random_reads):
+    out_dir = tempfile.mkdtemp(prefix="gl_bench_")
+    rows = []
+
+    # Baseline: in-memory recorder saved as V2 JSON (full state_t every turn)
+    baseline = os.path.join(out_dir, "game.json")
+    recorder = GameRecorder(grid_size=grid_size)
+    self_play(recorder, turns, grid_size, seed)
+    _, write_s = _timed(lambda: recorder.save_game(baseline))
+    rows.append(("V2 JSON", baseline, write_s))
+
+    for compression in (None, "gzip", "zstd"):
+        path = os.path.join(out_dir, "game")
+        try:
+            recorder = GameRecorder(grid_size=grid_size, stream_path=path, compression=compression,
+                                    keyframe_interval=keyframe_interval)
+        except ImportError as e:
+            print(f"skipping {compression}: {e}")
+            continue
+        _, write_s = _timed(lambda: self_play(recorder, turns, grid_size, seed))
+        recorder.close()
+        rows.append((f"JSONL K={keyframe_interval} ({compression or 'plain'})", recorder.stream.path, write_s))
+
+    print(f"\n{turns} turns, {grid_size}x{grid_size}, seed {seed}\n")
+    print(f"{'format':<26} {'size':>12} {'load all':>10} {'index':>10} {'rand read':>11}")
+    rng = random.Random(seed)
+    for name, path, _write_s in rows:
+        size = os.path.getsize(path)
+        _, load_s = _timed(lambda: list(GameRecorder.load_game(path)["turn_sequence"])) # Decode every turn
+        log, index_s = _timed(lambda: GameRecorder.open_log(path))
+        indices = [rng.randrange(len(log)) for _ in range(random_reads)]
+        _, reads_s = _timed(lambda: [log.state_at(i) for i in indices])
+        print(f"{name:<26} {size:>10,} B {load_s * 1000:>8.1f}ms {index_s * 1000:>8.1f}ms "
+              f"{reads_s / max(1, random_reads) * 1e6:>8.1f}us")
+    print(f"\nFiles kept in {out_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GoLuminamics game log formats")
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--grid-size", type=int, default=19)
+    parser.add_argument("--keyframe-interval", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--random-reads", type=int, default=200, help="Random state_at() calls per format")
+    args = parser.parse_args()
+
+    run(args.turns, args.grid_size, args.keyframe_interval, args.seed, args.random_reads)
+
+
+if __name__ == "__main__":
+    main()
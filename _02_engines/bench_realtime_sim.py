@@ -0,0 +1,87 @@
+"""
+File: bench_realtime_sim.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Ticks/sec of the headless realtime simulator against stone count.
+
+Usage:
+    python -m _02_engines.bench_realtime_sim --grid-size 39 --stones 16 64 256 1024 --ticks 2000
+"""
+
+import argparse
+import random
+import time
+
+from _01_core_logic.board_state import BoardState2D, StoneData2D, StoneType
+from _02_engines.realtime_sim import RealtimeSimulator
+
+HEADINGS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx, dy) != (0, 0)]
+
+
+def make_board(grid_size, stones, seed):
+    """Random stones (all moving) plus two laser sources per player."""
+    rng = random.Random(seed)
+    board = BoardState2D(grid_size)
+    cells = rng.sample([(x, y) for x in range(grid_size) for y in range(grid_size)], stones)
+    headings = {}
+    for pos in cells:
+        stone = StoneData2D(rng.choice(list(StoneType)), rng.choice([1, 2]))
+        stone.set_rotation(rng.choice(range(0, 360, 45)))
+        stone.velocity = rng.choice([1, 1, 2])
+        board.stones[pos] = stone
+        headings[pos] = rng.choice(HEADINGS)
+    for player, y in ((1, 3), (1, grid_size - 4), (2, grid_size // 2), (2, 7)):
+        board.add_laser_source((0.5, y + 0.5), (1, 0.25), player)
+    return board, headings
+
+
+def bench_simulator(grid_size, stones, ticks, seed, with_territory):
+    board, headings = make_board(grid_size, stones, seed)
+    sim = RealtimeSimulator(board)
+    for pos, heading in headings.items():
+        sim.set_velocity(pos, heading)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        sim.step()
+        if with_territory:
+            sim.territory()
+    return ticks / (time.perf_counter() - start)
+
+
+def bench_dict_loop(grid_size, stones, ticks, seed):
+    """Reference: the same motion applied stone by stone through BoardState2D.move_stone."""
+    board, headings = make_board(grid_size, stones, seed)
+    moving = [(pos, heading, board.stones[pos].velocity) for pos, heading in headings.items()]
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for i, (pos, (dx, dy), speed) in enumerate(moving):
+            for _ in range(speed):
+                new_pos = board.move_stone(pos, (pos[0] + dx, pos[1] + dy))
+                if new_pos is None:
+                    break
+                pos = new_pos
+            moving[i] = (pos, (dx, dy), speed)
+    return ticks / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the headless realtime simulator")
+    parser.add_argument("--grid-size", type=int, default=39, choices=BoardState2D.GRID_SIZES)
+    parser.add_argument("--stones", type=int, nargs="+", default=[16, 64, 256, 1024])
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{args.grid_size}x{args.grid_size}, {args.ticks} ticks, every stone moving (speed 1-2)\n")
+    print(f"{'stones':>7} {'dict loop':>12} {'simulator':>12} {'+ territory':>12}   (ticks/sec)")
+    for stones in args.stones:
+        stones = min(stones, args.grid_size * args.grid_size)
+        dict_tps = bench_dict_loop(args.grid_size, stones, args.ticks, args.seed)
+        sim_tps = bench_simulator(args.grid_size, stones, args.ticks, args.seed, False)
+        terr_tps = bench_simulator(args.grid_size, stones, max(1, args.ticks // 10), args.seed, True)
+        print(f"{stones:>7} {dict_tps:>12,.0f} {sim_tps:>12,.0f} {terr_tps:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
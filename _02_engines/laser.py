@@ -8,6 +8,8 @@ Description: Source file.
 
 import math
 
+from _01_core_logic import instrumentation
+
 class LaserCalculator2D:
     """Calculate 2D laser paths using ray tracing."""
     def __init__(self, grid_size=19):
@@ -15,6 +17,7 @@ class LaserCalculator2D:
         self.max_bounces = 20 # Reduced for performance with ray tracing
         self.stone_radius = 0.4 # Matches GameBoard radius (cell_size * 0.4 normalized to 1.0 cell)
 
+    @instrumentation.timed("laser.calculate_path")
     def calculate_path(self, start_pos, start_dir, stone_map):
         """
         Calculate laser path using ray casting with branching support.
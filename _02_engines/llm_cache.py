@@ -0,0 +1,170 @@
+"""
+File: llm_cache.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Persistent SQLite cache for LLM agent responses.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+class LLMResponseCache:
+    """
+    On-disk cache of raw LLM responses.
+
+    Entries are keyed by (model, playbook set, prompt hash, temperature), so an
+    arena rematch that reaches an identical position reuses the previous
+    generation instead of querying the model again.
+
+    In replay mode the cache is read-only and a miss never falls through to the
+    model server, which lets CI re-run recorded arena matches offline.
+
+    One instance may be shared by agents deciding on different threads (the
+    realtime arena): every use of the connection holds a lock.
+    """
+
+    def __init__(self, path="cache/llm_cache.sqlite", max_entries=50000,
+                 max_bytes=256 * 1024 * 1024, max_age_days=30.0, replay=False):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_days * 86400 if max_age_days else None
+        self.replay = replay
+
+        self.hits = 0
+        self.misses = 0
+        self._puts_since_evict = 0
+        self.evict_every = 100  # Run eviction every N insertions
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Several arena processes may share one cache file
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON responses(last_used)")
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(model, playbook_content, prompt, temperature):
+        """Build the cache key for one generation request."""
+        playbook_hash = hashlib.sha256(playbook_content.encode("utf-8")).hexdigest()
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        raw_key = json.dumps([model, playbook_hash, prompt_hash, round(float(temperature), 4)])
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    def get(self, key) -> Optional[str]:
+        """Return the cached raw response for key, or None on a miss."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            response, created_at = row
+            now = time.time()
+
+            # Expired entries are misses, except in replay mode where the
+            # recording must stay usable no matter how old it is
+            if not self.replay and self.max_age_seconds and now - created_at > self.max_age_seconds:
+                self.misses += 1
+                return None
+
+            if not self.replay:
+                self.conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+                self.conn.commit()
+
+            self.hits += 1
+            return response
+
+    def put(self, key, model, response):
+        """Store a raw response. Ignored in replay mode."""
+        with self._lock:
+            if self.replay:
+                return
+
+            now = time.time()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, len(response.encode("utf-8")), now, now)
+            )
+            self.conn.commit()
+
+            self._puts_since_evict += 1
+            if self._puts_since_evict >= self.evict_every:
+                self.evict()
+
+    def evict(self):
+        """Drop expired entries, then least recently used ones until within limits."""
+        with self._lock:
+            self._puts_since_evict = 0
+            removed = 0
+
+            if self.max_age_seconds:
+                cursor = self.conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?",
+                    (time.time() - self.max_age_seconds,)
+                )
+                removed += cursor.rowcount
+
+            count, total_bytes = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+            if count > self.max_entries or total_bytes > self.max_bytes:
+                # Walk from the least recently used entry until both limits hold
+                rows = self.conn.execute("SELECT key, size FROM responses ORDER BY last_used ASC")
+                doomed = []
+                for key, size in rows:
+                    if count <= self.max_entries and total_bytes <= self.max_bytes:
+                        break
+                    doomed.append((key,))
+                    count -= 1
+                    total_bytes -= size
+                self.conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+                removed += len(doomed)
+
+            self.conn.commit()
+            return removed
+
+    def stats(self):
+        """Return hit/miss counters and current cache size."""
+        with self._lock:
+            count, total_bytes = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            return {
+                "entries": count,
+                "bytes": total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "replay": self.replay
+            }
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,300 @@
+"""
+File: log_analytics.py
+Creation Date: 2026-10-19
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: Aggregate statistics over many recorded games, computed in parallel worker processes.
+
+Each worker reads its share of the logs one at a time (LazyGameLog: no
+board is kept in memory) and folds them into a partial Aggregate; the
+parent merges partials as they arrive. Results: win rates by model and by
+playbook, average game length, victory reasons, action mix, and capture
+and territory curves averaged per turn bucket. Territory is the score the
+game logged with each turn. Logs without one (state_t has no laser sources,
+so it cannot be traced afterwards) add no territory samples, and their
+winner is unknown unless the log recorded one; so is the winner of an
+unfinished game.
+
+Usage:
+    python -m _02_engines.log_analytics games/ --workers 8 --output analytics/
+    python -m _02_engines.log_analytics games/arena_*.jsonl.gz --bucket 5
+"""
+
+import argparse
+import csv
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from _01_core_logic.game_library import find_logs, final_result, recorded_territory
+from _01_core_logic.game_log import LazyGameLog
+
+FILES_PER_TASK = 16
+
+
+def _ranked(counter, limit=None):
+    """Counter as a dict, largest first (ties by key, so merge order does not show)."""
+    return dict(sorted(counter.items(), key=lambda item: (-item[1], item[0]))[:limit])
+
+
+class Aggregate:
+    """
+    Mergeable statistics over a set of games.
+
+    Every field is a sum or a count, so partial aggregates built from
+    disjoint sets of games merge into exactly the aggregate of their union.
+    """
+
+    def __init__(self, bucket=10):
+        self.bucket = bucket
+        self.games = 0
+        self.turns = 0
+        self.min_turns = None
+        self.max_turns = 0
+        self.failed = Counter()          # error -> files
+        self.skipped = 0                 # Legacy logs without snapshots, empty or non-game files
+        self.winners = Counter()         # "1" / "2" / "draw" / "unknown"
+        self.reasons = Counter()
+        self.results = {}                # (group, name) -> [games, wins, draws, losses]
+        self.actions = {}                # model -> Counter of action types
+        self.captures = {}               # bucket -> [turns, p1 sum, p2 sum]
+        self.territory = {}              # bucket -> [samples, p1 sum, p2 sum]
+
+    def add_game(self, metadata, turns, scalars, sampled_territory, result):
+        """
+        Fold one game in.
+
+        turns/scalars are LazyGameLog's per-turn summaries; sampled_territory
+        is [(turn index, {"player1", "player2"})]; result is final_result().
+        """
+        n = len(turns)
+        self.games += 1
+        self.turns += n
+        self.min_turns = n if self.min_turns is None else min(self.min_turns, n)
+        self.max_turns = max(self.max_turns, n)
+
+        winner = result["winner"]
+        self.winners["unknown" if winner is None else "draw" if winner == 0 else str(winner)] += 1
+        self.reasons[result["victory_reason"] or "unknown"] += 1
+
+        settings = metadata.get("game_settings", {})
+        models = settings.get("models", {})
+        playbooks = settings.get("playbooks", {})
+        for side in (1, 2):
+            if winner is None:
+                break # No score to decide the game: it counts towards no one's record
+            outcome = 2 if winner == 0 else (1 if winner == side else 3) # Index into [games, wins, draws, losses]
+            model = models.get(str(side)) or settings.get(f"player{side}") or f"Player {side}"
+            groups = [("model", model)]
+            if playbooks.get(str(side)):
+                groups.append(("playbook", playbooks[str(side)]))
+            for key in groups:
+                entry = self.results.setdefault(key, [0, 0, 0, 0])
+                entry[0] += 1
+                entry[outcome] += 1
+
+        for turn in turns:
+            action = turn.get("agent_action") or {}
+            player = (action.get("params") or {}).get("player", action.get("player"))
+            model = models.get(str(player)) or settings.get(f"player{player}") or f"Player {player}"
+            self.actions.setdefault(model, Counter())[action.get("type") or "none"] += 1
+
+        for i, state in enumerate(scalars):
+            caps = state.get("player_captures", {})
+            entry = self.captures.setdefault(i // self.bucket, [0, 0, 0])
+            entry[0] += 1
+            entry[1] += int(caps.get("1", 0))
+            entry[2] += int(caps.get("2", 0))
+
+        for i, score in sampled_territory:
+            entry = self.territory.setdefault(i // self.bucket, [0, 0, 0])
+            entry[0] += 1
+            entry[1] += score["player1"]
+            entry[2] += score["player2"]
+
+    def merge(self, other):
+        """Add other's games into this aggregate."""
+        if other.bucket != self.bucket:
+            raise ValueError(f"Cannot merge aggregates with buckets {self.bucket} and {other.bucket}")
+        self.games += other.games
+        self.turns += other.turns
+        if other.min_turns is not None:
+            self.min_turns = other.min_turns if self.min_turns is None else min(self.min_turns, other.min_turns)
+        self.max_turns = max(self.max_turns, other.max_turns)
+        self.failed.update(other.failed)
+        self.skipped += other.skipped
+        self.winners.update(other.winners)
+        self.reasons.update(other.reasons)
+        for key, counts in other.results.items():
+            entry = self.results.setdefault(key, [0, 0, 0, 0])
+            for i, value in enumerate(counts):
+                entry[i] += value
+        for model, counts in other.actions.items():
+            self.actions.setdefault(model, Counter()).update(counts)
+        for mine, theirs in ((self.captures, other.captures), (self.territory, other.territory)):
+            for bucket, sums in theirs.items():
+                entry = mine.setdefault(bucket, [0, 0, 0])
+                for i, value in enumerate(sums):
+                    entry[i] += value
+        return self
+
+    def summary(self):
+        """JSON-serialisable totals and rates."""
+        results = {}
+        for (group, name), (games, wins, draws, losses) in sorted(self.results.items()):
+            results.setdefault(group, {})[name] = {
+                "games": games, "wins": wins, "draws": draws, "losses": losses,
+                "win_rate": round(wins / games, 4),
+                "points_rate": round((wins + 0.5 * draws) / games, 4),
+            }
+        return {
+            "games": self.games,
+            "skipped": self.skipped,
+            "failed": sum(self.failed.values()),
+            "turns": self.turns,
+            "avg_turns": round(self.turns / self.games, 2) if self.games else 0.0,
+            "min_turns": self.min_turns,
+            "max_turns": self.max_turns,
+            "winners": dict(sorted(self.winners.items())),
+            "victory_reasons": _ranked(self.reasons),
+            "results": results,
+            "actions": {model: _ranked(counts) for model, counts in sorted(self.actions.items())},
+            "errors": _ranked(self.failed, 20),
+        }
+
+    def curve_rows(self):
+        """Per turn bucket: games reaching it and mean captures / territory per player."""
+        rows = []
+        for bucket in sorted(set(self.captures) | set(self.territory)):
+            turns, c1, c2 = self.captures.get(bucket, (0, 0, 0))
+            samples, t1, t2 = self.territory.get(bucket, (0, 0, 0))
+            rows.append({
+                "turn_from": bucket * self.bucket + 1,
+                "turn_to": (bucket + 1) * self.bucket,
+                "turns": turns,
+                "p1_captures": round(c1 / turns, 4) if turns else "",
+                "p2_captures": round(c2 / turns, 4) if turns else "",
+                "territory_samples": samples,
+                "p1_territory": round(t1 / samples, 4) if samples else "",
+                "p2_territory": round(t2 / samples, 4) if samples else "",
+            })
+        return rows
+
+
+def analyze_files(paths, bucket=10):
+    """Worker: fold the games in paths into a fresh Aggregate."""
+    aggregate = Aggregate(bucket)
+    for path in paths:
+        try:
+            log = LazyGameLog(path)
+        except ValueError:
+            aggregate.skipped += 1
+            continue
+        except Exception as e:
+            aggregate.failed[f"{type(e).__name__}: {e}"] += 1
+            continue
+        try:
+            log.index_all()
+            if not len(log):
+                aggregate.skipped += 1
+                continue
+            sampled = [(i, t) for i, t in enumerate(map(recorded_territory, log.turns)) if t]
+            last = log.turns[-1]
+            result = final_result(log.state_at(-1), recorded_territory(last), last.get("terminal"))
+            aggregate.add_game(log.metadata, log.turns, log.scalars, sampled, result)
+        except Exception as e:
+            aggregate.failed[f"{type(e).__name__}: {e}"] += 1
+        finally:
+            log.close()
+    return aggregate
+
+
+def collect_paths(inputs):
+    """Expand directories into the game logs under them."""
+    for item in inputs:
+        if os.path.isdir(item):
+            yield from find_logs(item)
+        else:
+            yield item
+
+
+def run(inputs, workers=None, bucket=10, progress=True):
+    """Analyze every log in inputs and return the merged Aggregate."""
+    paths = sorted(collect_paths(inputs))
+    tasks = [paths[i:i + FILES_PER_TASK] for i in range(0, len(paths), FILES_PER_TASK)]
+    workers = workers or os.cpu_count() or 1
+    total = Aggregate(bucket)
+
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            total.merge(analyze_files(task, bucket))
+        return total
+
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(analyze_files, task, bucket) for task in tasks]
+        for future in as_completed(futures):
+            total.merge(future.result())
+            done += 1
+            if progress:
+                print(f"\r{min(done * FILES_PER_TASK, len(paths))}/{len(paths)} files", end="", flush=True)
+    if progress:
+        print()
+    return total
+
+
+def write_outputs(aggregate, output):
+    """Write summary.json, results.csv and curves.csv into output; returns their paths."""
+    Path(output).mkdir(parents=True, exist_ok=True)
+    summary = aggregate.summary()
+    files = [os.path.join(output, name) for name in ("summary.json", "results.csv", "curves.csv")]
+
+    with open(files[0], "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+
+    with open(files[1], "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["group", "name", "games", "wins", "draws", "losses", "win_rate", "points_rate"])
+        for group, entries in summary["results"].items():
+            for name, r in entries.items():
+                writer.writerow([group, name, r["games"], r["wins"], r["draws"], r["losses"],
+                                 r["win_rate"], r["points_rate"]])
+
+    rows = aggregate.curve_rows()
+    with open(files[2], "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["turn_from", "turn_to", "turns", "p1_captures", "p2_captures",
+                                               "territory_samples", "p1_territory", "p2_territory"])
+        writer.writeheader()
+        writer.writerows(rows)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate statistics over recorded GoLuminamics games")
+    parser.add_argument("inputs", nargs="+", help="Game logs or directories of logs (V2 JSON or JSON Lines)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--bucket", type=int, default=10, help="Turns per bucket of the curves")
+    parser.add_argument("--output", default="analytics", help="Directory for summary.json, results.csv, curves.csv")
+    args = parser.parse_args()
+    if args.bucket < 1:
+        parser.error("--bucket must be at least 1")
+
+    start = time.perf_counter()
+    aggregate = run(args.inputs, workers=args.workers, bucket=args.bucket)
+    files = write_outputs(aggregate, args.output)
+    summary = aggregate.summary()
+
+    print(f"{summary['games']} games, {summary['turns']} turns (avg {summary['avg_turns']}) "
+          f"in {time.perf_counter() - start:.1f}s; {summary['skipped']} skipped, {summary['failed']} failed")
+    for group, entries in summary["results"].items():
+        for name, r in sorted(entries.items(), key=lambda item: -item[1]["points_rate"]):
+            print(f"  {group:<8} {name:<30} {r['games']:>6} games  win {r['win_rate']:.1%}  "
+                  f"(W{r['wins']} D{r['draws']} L{r['losses']})")
+    print("Wrote " + ", ".join(files))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+File: realtime_sim.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Headless realtime-mode simulator: stones drift by their velocity every tick.
+
+Positions, headings and speeds live in numpy arrays and every tick moves all
+stones at once. An occupancy array (stone index per cell) resolves
+collisions, and territory is re-traced only after the geometry
+(positions or rotations) actually changed.
+
+Requires numpy (pip install numpy), which the GUI does not need. It is
+imported with this module when installed; without it the module still
+imports and RealtimeSimulator() raises ImportError with the install hint.
+
+Usage:
+    sim = RealtimeSimulator(board_state)
+    sim.set_velocity((3, 4), (1, 0), speed=2)   # 2 cells per tick to the right
+    sim.step(1000)
+    sim.territory()                             # BoardState2D.calculate_score() of the current tick
+    sim.sync_board()                            # write positions back into board_state.stones
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("the realtime simulator requires the 'numpy' package (pip install numpy)")
+
+
+class RealtimeSimulator:
+    """
+    Advance every moving stone of a BoardState2D by its velocity each tick.
+
+    A stone's velocity is a heading (dx, dy) with components in {-1, 0, 1}
+    times its speed (StoneData2D.velocity, cells per tick). A tick is split
+    into max-speed sub-steps of one cell, so fast stones cannot tunnel
+    through others. Within a sub-step all movers go at once, and
+    coordinates wrap around the board edges. A mover stays where it is if:
+      - its target cell holds a stone that is not leaving,
+      - another mover targets the same cell (nobody gets it), or
+      - the occupant is moving into the mover's own cell (head-on swap).
+    Blocked stones keep their velocity and try again next tick.
+
+    Internally cells are flat ids (x * grid_size + y) and headings are codes
+    0..8, so a whole sub-step is a handful of array operations.
+    """
+
+    STILL = 4 # Heading code of (0, 0)
+
+    def __init__(self, board_state):
+        _require_numpy()
+        self.board = board_state
+        self.grid_size = g = board_state.grid_size
+
+        positions = list(board_state.stones)
+        self.stones = [board_state.stones[pos] for pos in positions] # StoneData2D per index
+        n = len(positions)
+        self.cell = np.array([x * g + y for x, y in positions], dtype=np.int64)
+        self.heading_code = np.full(n, self.STILL, dtype=np.int64)
+        self.speed = np.array([stone.velocity for stone in self.stones], dtype=np.int64).reshape(n)
+
+        # neighbors[cell, code]: wrapped cell one step along heading code
+        xs, ys = np.divmod(np.arange(g * g), g)
+        self.neighbors = np.empty((g * g, 9), dtype=np.int64)
+        for code in range(9):
+            dx, dy = divmod(code, 3)
+            self.neighbors[:, code] = ((xs + dx - 1) % g) * g + (ys + dy - 1) % g
+
+        # Flat occupancy: stone index per cell, n when empty (indexes the -1 sentinel of _local)
+        self.occupancy = np.full(g * g, n, dtype=np.int64)
+        self.occupancy[self.cell] = np.arange(n)
+        self._local = np.full(n + 1, -1, dtype=np.int64) # stone index -> slot in the current sub-step
+        self._substep_movers = None # Per sub-step index arrays, rebuilt when velocities change
+
+        self.tick = 0
+        self.geometry_version = 0 # Bumped whenever a stone moves or turns
+        self._territory = None
+        self._territory_version = -1
+        self._synced_version = 0
+
+    def __len__(self):
+        return len(self.stones)
+
+    def index_at(self, pos):
+        """Index of the stone at pos, or None."""
+        g = self.grid_size
+        i = int(self.occupancy[(pos[0] % g) * g + pos[1] % g])
+        return None if i == len(self.stones) else i
+
+    def set_velocity(self, pos, heading, speed=None):
+        """Set the heading (and optionally the speed) of the stone at pos; (0, 0) stops it."""
+        i = self.index_at(pos)
+        if i is None:
+            raise KeyError(f"No stone at {pos}")
+        dx, dy = (int(np.sign(v)) for v in heading)
+        self.heading_code[i] = (dx + 1) * 3 + dy + 1
+        if speed is not None:
+            self.speed[i] = speed
+            self.stones[i].velocity = speed
+        self._substep_movers = None
+
+    def rotate(self, pos, angle):
+        """Turn the stone at pos (changes laser geometry like a move does)."""
+        i = self.index_at(pos)
+        if i is None:
+            raise KeyError(f"No stone at {pos}")
+        self.stones[i].set_rotation(angle)
+        self.geometry_version += 1
+
+    def step(self, ticks=1):
+        """Run ticks simulation ticks; returns the number of cell moves made."""
+        moves = 0
+        for _ in range(ticks):
+            moves += self._tick()
+        return moves
+
+    def _tick(self):
+        self.tick += 1
+        if self._substep_movers is None:
+            speed = np.where(self.heading_code != self.STILL, self.speed, 0)
+            self._substep_movers = [np.flatnonzero(speed > sub) for sub in range(int(speed.max(initial=0)))]
+        moved = 0
+        for idx in self._substep_movers:
+            moved += self._substep(idx)
+        if moved:
+            self.geometry_version += 1
+        return moved
+
+    def _substep(self, idx):
+        """Move the stones idx by one cell each, where the rules allow it."""
+        src = self.cell[idx]
+        dst = self.neighbors[src, self.heading_code[idx]]
+        occupant = self.occupancy[dst]
+
+        local = self._local
+        local[idx] = np.arange(len(idx))
+        occ_local = local[occupant] # -1: empty cell or a stone that is not moving now
+        local[idx] = -1
+
+        # Head-on swaps are decided once: both stones stay
+        go = ~((occ_local >= 0) & (dst[occ_local] == src))
+        occupied = occupant != len(self.stones)
+        leaving = np.zeros(len(idx) + 1, dtype=bool) # Last slot answers for occ_local == -1
+        while True:
+            contested = np.bincount(dst[go], minlength=len(self.occupancy))[dst] > 1
+            leaving[:-1] = go
+            blocked = go & (contested | (occupied & ~leaving[occ_local]))
+            if not blocked.any():
+                break
+            go &= ~blocked # A blocked stone stays put, which may block whoever wanted its cell
+
+        movers = idx[go]
+        if not len(movers):
+            return 0
+        self.occupancy[src[go]] = len(self.stones)
+        self.occupancy[dst[go]] = movers
+        self.cell[movers] = dst[go]
+        return len(movers)
+
+    def positions(self):
+        """Current (x, y) of every stone, in index order."""
+        return [divmod(int(c), self.grid_size) for c in self.cell]
+
+    def sync_board(self):
+        """Write the simulated positions back into board_state.stones (no-op if nothing moved)."""
+        if self._synced_version != self.geometry_version:
+            self.board.stones = dict(zip(self.positions(), self.stones))
+            self._synced_version = self.geometry_version
+        return self.board
+
+    def territory(self):
+        """Territory score for the current tick; lasers are re-traced only after geometry changed."""
+        if self._territory_version != self.geometry_version:
+            self._territory = self.sync_board().calculate_score()
+            self._territory_version = self.geometry_version
+        return self._territory
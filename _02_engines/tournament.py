@@ -0,0 +1,590 @@
+"""
+File: tournament.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Headless arena tournament runner with parallel matches and Elo ratings.
+
+Usage:
+    python -m _02_engines.tournament random greedy llm:gemma3:4b llm:gemma3:4b#The_Fortress
+    python -m _02_engines.tournament random greedy --format swiss --rounds 5 --workers 8
+    python -m _02_engines.tournament greedy search search:3 --tt-mb 256 --workers 8
+"""
+
+import io
+import json
+import math
+import os
+import random
+import time
+import contextlib
+import copy
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from _00_entry.game_server import GameServer
+from _01_core_logic import log_config
+from _01_core_logic.zobrist import zobrist_hash
+from _02_engines.action_ids import encode_action
+from _02_engines.transposition import BOUND_EXACT, BOUND_LOWER, BOUND_UPPER, TranspositionTable
+
+SEARCH_DEPTH = 2
+SEARCH_K = {"place": 3, "rotate": 1, "laser": 4, "move": 2} # Candidate actions per node
+WIN_VALUE = 1000.0
+DEFAULT_TT_MB = 64
+
+
+class RandomEngine:
+    """Built-in engine: uniformly random valid action."""
+
+    def __init__(self, player_id, rng):
+        self.player_id = player_id
+        self.model_name = "random"
+        self.rng = rng
+
+    def get_move(self, server):
+        valid_actions = server.get_valid_actions().get("valid_actions", [])
+        # Selection never changes the board; skip it so the game progresses
+        valid_actions = [a for a in valid_actions if a["type"] != "select"]
+        return self.rng.choice(valid_actions) if valid_actions else {"type": "pass"}
+
+
+class GreedyLaserEngine:
+    """Built-in engine: fires the laser that captures the most stones, otherwise places randomly."""
+
+    def __init__(self, player_id, rng):
+        self.player_id = player_id
+        self.model_name = "greedy"
+        self.rng = rng
+
+    def get_move(self, server):
+        board = server.board
+        best_action = None
+        best_captures = 0
+
+        for pos, stone in board.stones.items():
+            if stone.player != self.player_id:
+                continue
+            for direction in range(8):
+                rad = direction * math.pi / 4
+                dx, dy = math.cos(rad), math.sin(rad)
+                paths = server.laser_calc.calculate_path((pos[0] + 0.5, pos[1] + 0.5), (dx, dy), board.stones)
+                captures = board.clone().process_laser_captures(self.player_id, paths)
+                if len(captures) > best_captures:
+                    best_captures = len(captures)
+                    best_action = {"type": "laser", "x": pos[0], "y": pos[1], "dx": dx, "dy": dy}
+
+        if best_action:
+            return best_action
+
+        placements = server.sample_valid_actions({"place": 1}, self.rng).get("valid_actions", [])
+        if placements:
+            return placements[0]
+        return {"type": "pass"}
+
+
+def _copy_server(server):
+    """Independent copy of a GameServer to search from (the laser calculator is shared)."""
+    child = copy.copy(server)
+    child.board = server.board.clone()
+    child.selection = list(getattr(server, "selection", []))
+    return child
+
+
+def _evaluate(server):
+    """Final-score margin (territory + 2 per capture) for the player to move; +-WIN_VALUE once decided."""
+    player = server.current_player
+    if server.game_over:
+        if server.winner in (1, 2):
+            return WIN_VALUE if server.winner == player else -WIN_VALUE
+        return 0.0
+    _, p1_final, p2_final = _adjudicate(server.board)
+    return float(p1_final - p2_final if player == 1 else p2_final - p1_final)
+
+
+class SearchEngine:
+    """
+    Built-in engine: depth-limited alpha-beta over sampled actions.
+
+    Positions reached through different move orders are looked up in a
+    transposition table keyed by their Zobrist hash; its stored best move
+    is tried first. Candidate actions are drawn with an RNG seeded by the
+    hash, so a position always gets the same candidates.
+    """
+
+    def __init__(self, player_id, rng, depth=SEARCH_DEPTH, table=None):
+        self.player_id = player_id
+        self.model_name = f"search:{depth}"
+        self.rng = rng
+        self.depth = depth
+        self.table = table if table is not None else TranspositionTable(size_mb=DEFAULT_TT_MB)
+        self.nodes = 0
+
+    def get_move(self, server):
+        self.table.new_search()
+        _, action = self._search(server, self.depth, -math.inf, math.inf, root=True)
+        return action or {"type": "pass"}
+
+    def _search(self, server, depth, alpha, beta, root=False):
+        """Negamax: (value for the player to move, best action)."""
+        self.nodes += 1
+        key = zobrist_hash(server.board, server.current_player)
+        entry = self.table.probe(key)
+        best_id = None
+        if entry is not None:
+            stored_depth, value, bound, best_id = entry
+            if stored_depth >= depth and not root: # The root needs an action, not just a value
+                if bound == BOUND_EXACT:
+                    return value, None
+                if bound == BOUND_LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value, None
+
+        if depth == 0 or server.game_over:
+            return _evaluate(server), None
+
+        grid_size = server.grid_size
+        actions = server.sample_valid_actions(SEARCH_K, random.Random(key)).get("valid_actions", [])
+        if not actions:
+            actions = [{"type": "pass"}]
+        if best_id is not None:
+            actions.sort(key=lambda a: encode_action(a, grid_size) != best_id) # Stored best move first
+
+        alpha_start = alpha
+        best_value, best_action = -math.inf, None
+        for action in actions:
+            child = _copy_server(server)
+            if not child.step(action).get("info", {}).get("action_success"):
+                continue
+            value = -self._search(child, depth - 1, -beta, -alpha)[0]
+            if value > best_value:
+                best_value, best_action = value, action
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+        if best_action is None:
+            return _evaluate(server), None
+
+        if best_value <= alpha_start:
+            bound = BOUND_UPPER
+        elif best_value >= beta:
+            bound = BOUND_LOWER
+        else:
+            bound = BOUND_EXACT
+        self.table.store(key, depth, best_value, bound, encode_action(best_action, grid_size))
+        return best_value, best_action
+
+
+BUILTIN_ENGINES = {
+    "random": RandomEngine,
+    "greedy": GreedyLaserEngine,
+}
+
+
+def build_agent(spec, player_id, rng, cache_path=None, replay=False, table=None):
+    """
+    Create an agent from a participant spec.
+
+    Specs:
+        random | greedy              Built-in engines
+        search | search:<depth>      Alpha-beta engine (table: shared TranspositionTable, else its own)
+        llm:<model>                  LLM agent with all playbooks
+        llm:<model>#<playbook>       LLM agent pinned to one playbook
+    """
+    if spec in BUILTIN_ENGINES:
+        return BUILTIN_ENGINES[spec](player_id, rng)
+
+    if spec == "search" or spec.startswith("search:"):
+        depth = int(spec.partition(":")[2] or SEARCH_DEPTH)
+        return SearchEngine(player_id, rng, depth=depth, table=table)
+
+    if spec.startswith("llm:"):
+        # Imported lazily: built-in only tournaments don't need an LLM client
+        from _02_engines.ai_player import AIAgent
+        from _02_engines.llm_cache import LLMResponseCache
+
+        model, _, playbook = spec[len("llm:"):].partition("#")
+        cache = None
+        if cache_path or replay:
+            cache = LLMResponseCache(cache_path or "cache/llm_cache.sqlite", replay=replay)
+        return AIAgent(player_id, model, mechanics_path="MECHANICS.md",
+                       use_all_playbooks=not playbook, cache=cache, playbook=playbook or None, rng=rng)
+
+    raise ValueError(f"Unknown participant spec '{spec}'. "
+                     "Use random, greedy, search[:<depth>] or llm:<model>[#playbook]")
+
+
+def _adjudicate(board):
+    """Winner by final score (territory + 2 per capture); 0 for a tie."""
+    score = board.calculate_score()
+    p1_final = score["player1"] + board.get_captures(1) * 2
+    p2_final = score["player2"] + board.get_captures(2) * 2
+    if p1_final > p2_final:
+        return 1, p1_final, p2_final
+    if p2_final > p1_final:
+        return 2, p1_final, p2_final
+    return 0, p1_final, p2_final
+
+
+def play_match(match):
+    """
+    Play one headless match. Runs inside a worker process.
+
+    Args:
+        match: dict with match_id, p1, p2, seed, grid_size, max_turns, config,
+               cache_path, replay, verbose and tt_name (shared transposition
+               table for search engines, or None) keys.
+
+    Returns:
+        Result dict (JSON serialisable) with winner, scores and timings.
+    """
+    seed = match["seed"]
+    # GameServer and AIAgent draw from the global RNG; seed it for reproducibility
+    random.seed(seed)
+    rng = random.Random(seed)
+
+    output = None if match.get("verbose") else io.StringIO()
+    # Agent diagnostics use logging; quiet workers only report errors (GOLUMINAMICS_LOG overrides)
+    log_config.configure(default="INFO" if match.get("verbose") else "ERROR")
+    start = time.perf_counter()
+
+    table = TranspositionTable.attach(match["tt_name"]) if match.get("tt_name") else None
+    with contextlib.redirect_stdout(output) if output is not None else contextlib.nullcontext():
+        server = GameServer(grid_size=match["grid_size"])
+        server.reset(dict(match.get("config") or {}, max_turns=match["max_turns"]))
+
+        agents = {
+            1: build_agent(match["p1"], 1, rng, match.get("cache_path"), match.get("replay", False), table),
+            2: build_agent(match["p2"], 2, rng, match.get("cache_path"), match.get("replay", False), table),
+        }
+        think_time = {1: 0.0, 2: 0.0}
+        moves = {1: 0, 2: 0}
+        illegal = {1: 0, 2: 0}
+
+        turn = 0
+        while not server.game_over and turn < match["max_turns"]:
+            pid = server.current_player
+
+            move_start = time.perf_counter()
+            try:
+                action = agents[pid].get_move(server)
+            except Exception as e:
+                print(f"Agent {pid} error: {e}")
+                action = None
+            think_time[pid] += time.perf_counter() - move_start
+            moves[pid] += 1
+
+            result = server.step(action) if action else None
+            if not result or not result.get("info", {}).get("action_success"):
+                # Same policy as the CLI arena: illegal moves fall back to a random action
+                illegal[pid] += 1
+                valid_actions = server.get_valid_actions().get("valid_actions", [])
+                valid_actions = [a for a in valid_actions if a["type"] != "select"]
+                server.step(rng.choice(valid_actions) if valid_actions else {"type": "pass"})
+
+            turn += 1
+
+    winner, p1_score, p2_score = _adjudicate(server.board)
+    if server.winner in (1, 2):
+        winner = server.winner
+    reason = server.victory_reason or ("max_turns" if turn >= match["max_turns"] else "unknown")
+
+    duration = time.perf_counter() - start
+    search = {}
+    for pid, agent in agents.items():
+        if isinstance(agent, SearchEngine):
+            search[str(pid)] = {"nodes": agent.nodes, "tt": agent.table.stats()}
+            if agent.table is not table:
+                agent.table.close()
+    if table is not None:
+        table.close()
+
+    result = {
+        "match_id": match["match_id"],
+        "round": match.get("round", 0),
+        "p1": match["p1"],
+        "p2": match["p2"],
+        "seed": seed,
+        "winner": winner,
+        "reason": reason,
+        "turns": turn,
+        "p1_score": p1_score,
+        "p2_score": p2_score,
+        "illegal_moves": {"1": illegal[1], "2": illegal[2]},
+        "duration_s": round(duration, 4),
+        "avg_move_s": {
+            "1": round(think_time[1] / moves[1], 5) if moves[1] else 0.0,
+            "2": round(think_time[2] / moves[2], 5) if moves[2] else 0.0,
+        },
+    }
+    if search:
+        result["search"] = search # Both sides report the same table counters when they share one
+    return result
+
+
+class EloTable:
+    """Incremental Elo ratings for tournament participants."""
+
+    def __init__(self, participants, initial=1500.0, k_factor=32.0):
+        self.k_factor = k_factor
+        self.ratings = {p: initial for p in participants}
+        self.stats = {p: {"played": 0, "wins": 0, "draws": 0, "losses": 0, "points": 0.0}
+                      for p in participants}
+
+    def expected(self, a, b):
+        """Expected score of a against b."""
+        return 1.0 / (1.0 + 10 ** ((self.ratings[b] - self.ratings[a]) / 400.0))
+
+    def update(self, result):
+        """Apply one match result."""
+        p1, p2 = result["p1"], result["p2"]
+        if result["winner"] == 1:
+            s1 = 1.0
+        elif result["winner"] == 2:
+            s1 = 0.0
+        else:
+            s1 = 0.5
+
+        e1 = self.expected(p1, p2)
+        delta = self.k_factor * (s1 - e1)
+        self.ratings[p1] += delta
+        self.ratings[p2] -= delta
+
+        for player, score in ((p1, s1), (p2, 1.0 - s1)):
+            entry = self.stats[player]
+            entry["played"] += 1
+            entry["points"] += score
+            if score == 1.0:
+                entry["wins"] += 1
+            elif score == 0.0:
+                entry["losses"] += 1
+            else:
+                entry["draws"] += 1
+
+    def standings(self):
+        """Participants sorted by rating, best first."""
+        rows = []
+        for player, rating in self.ratings.items():
+            row = {"participant": player, "elo": round(rating, 1)}
+            row.update(self.stats[player])
+            rows.append(row)
+        rows.sort(key=lambda r: (-r["elo"], -r["points"]))
+        return rows
+
+    def format_table(self):
+        """Human-readable standings table."""
+        lines = [f"{'#':>2}  {'Participant':<36} {'Elo':>7} {'P':>4} {'W':>4} {'D':>4} {'L':>4} {'Pts':>6}"]
+        for rank, row in enumerate(self.standings(), start=1):
+            lines.append(
+                f"{rank:>2}  {row['participant']:<36} {row['elo']:>7.1f} {row['played']:>4} "
+                f"{row['wins']:>4} {row['draws']:>4} {row['losses']:>4} {row['points']:>6.1f}"
+            )
+        return "\n".join(lines)
+
+
+def round_robin_pairings(participants, double=True):
+    """Every participant against every other; with double=True each pairing is played with both colours."""
+    pairings = []
+    for i, a in enumerate(participants):
+        for b in participants[i + 1:]:
+            pairings.append((a, b))
+            if double:
+                pairings.append((b, a))
+    return pairings
+
+
+def swiss_pairings(participants, table, played, colors=None):
+    """
+    Pair participants with similar points for the next Swiss round.
+
+    Greedy: walk the standings and pair each player with the highest-ranked
+    opponent not met yet. With an odd count the lowest player gets a bye.
+    colors (participant -> games as P1 minus games as P2, updated here)
+    balances who moves first: the player owed P1 gets it, and on a tie the
+    higher-ranked player alternates between P1 and P2 down the boards.
+    """
+    if colors is None:
+        colors = {}
+    ranked = [row["participant"] for row in
+              sorted(table.standings(), key=lambda r: (-r["points"], -r["elo"]))]
+    ranked = [p for p in ranked if p in participants]
+
+    pairings = []
+    unpaired = list(ranked)
+    while len(unpaired) > 1:
+        a = unpaired.pop(0)
+        opponent = next((b for b in unpaired if frozenset((a, b)) not in played), unpaired[0])
+        unpaired.remove(opponent)
+        balance = colors.get(a, 0) - colors.get(opponent, 0)
+        if balance > 0 or (balance == 0 and len(pairings) % 2):
+            a, opponent = opponent, a
+        pairings.append((a, opponent))
+        played.add(frozenset((a, opponent)))
+        colors[a] = colors.get(a, 0) + 1
+        colors[opponent] = colors.get(opponent, 0) - 1
+    return pairings
+
+
+class Tournament:
+    """Schedules matches, runs them in worker processes and streams the results."""
+
+    def __init__(self, participants, fmt="round-robin", rounds=3, games_per_pairing=1,
+                 grid_size=9, max_turns=100, workers=None, seed=0, config=None,
+                 output="tournaments/results.jsonl", cache_path=None, replay=False, verbose=False,
+                 tt_mb=DEFAULT_TT_MB):
+        if len(participants) < 2:
+            raise ValueError("A tournament needs at least two participants")
+        if len(set(participants)) != len(participants):
+            raise ValueError("Participant specs must be unique")
+        if fmt not in ("round-robin", "swiss"):
+            raise ValueError(f"Unknown tournament format '{fmt}'")
+
+        self.participants = list(participants)
+        self.format = fmt
+        self.rounds = rounds
+        self.games_per_pairing = games_per_pairing
+        self.grid_size = grid_size
+        self.max_turns = max_turns
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.config = config or {"starting_energy": 10}
+        self.output = output
+        self.cache_path = cache_path
+        self.replay = replay
+        self.verbose = verbose
+        self.tt_mb = tt_mb
+        self._tt_name = None
+
+        self.table = EloTable(self.participants)
+        self.results = []
+        self._next_match_id = 0
+
+    def _make_matches(self, pairings, round_index):
+        matches = []
+        for p1, p2 in pairings:
+            for _ in range(self.games_per_pairing):
+                match_id = self._next_match_id
+                self._next_match_id += 1
+                matches.append({
+                    "match_id": match_id,
+                    "round": round_index,
+                    "p1": p1,
+                    "p2": p2,
+                    "seed": self.seed * 1_000_003 + match_id,
+                    "grid_size": self.grid_size,
+                    "max_turns": self.max_turns,
+                    "config": self.config,
+                    "cache_path": self.cache_path,
+                    "replay": self.replay,
+                    "verbose": self.verbose,
+                    "tt_name": self._tt_name,
+                })
+        return matches
+
+    def _run_batch(self, executor, matches, stream):
+        """
+        Run a batch of matches in parallel, streaming each result as it completes.
+
+        Ratings are updated once the batch is done, in match_id order, so
+        they do not depend on which worker finished first.
+        """
+        futures = [executor.submit(play_match, m) for m in matches]
+        batch = []
+        for future in as_completed(futures):
+            result = future.result()
+            self.results.append(result)
+            batch.append(result)
+
+            stream.write(json.dumps(result) + "\n")
+            stream.flush()
+
+            outcome = f"P{result['winner']} wins" if result["winner"] else "draw"
+            print(f"[match {result['match_id']:>4}] {result['p1']} vs {result['p2']}: {outcome} "
+                  f"({result['reason']}, {result['turns']} turns, {result['duration_s']:.2f}s)", flush=True)
+
+        for result in sorted(batch, key=lambda r: r["match_id"]):
+            self.table.update(result)
+
+    def run(self):
+        """Run the whole tournament. Returns the final standings."""
+        Path(self.output).parent.mkdir(parents=True, exist_ok=True)
+        start = time.perf_counter()
+
+        # Search engines in every worker share one transposition table
+        tt = None
+        if self.tt_mb and any(p == "search" or p.startswith("search:") for p in self.participants):
+            tt = TranspositionTable(size_mb=self.tt_mb, shared=True)
+            self._tt_name = tt.name
+        try:
+            return self._run(start)
+        finally:
+            if tt is not None:
+                tt.close()
+                tt.unlink()
+                self._tt_name = None
+
+    def _run(self, start):
+        with open(self.output, "a", encoding="utf-8") as stream, \
+                ProcessPoolExecutor(max_workers=self.workers) as executor:
+            if self.format == "round-robin":
+                # All matches are independent: submit them at once
+                pairings = round_robin_pairings(self.participants)
+                self._run_batch(executor, self._make_matches(pairings, 0), stream)
+            else:
+                played = set()
+                colors = {}
+                for round_index in range(self.rounds):
+                    pairings = swiss_pairings(self.participants, self.table, played, colors)
+                    print(f"--- Swiss round {round_index + 1}/{self.rounds}: {len(pairings)} matches ---", flush=True)
+                    self._run_batch(executor, self._make_matches(pairings, round_index), stream)
+
+            summary = {
+                "summary": True,
+                "format": self.format,
+                "matches": len(self.results),
+                "wall_time_s": round(time.perf_counter() - start, 3),
+                "match_time_s_total": round(sum(r["duration_s"] for r in self.results), 3),
+                "standings": self.table.standings(),
+            }
+            stream.write(json.dumps(summary) + "\n")
+
+        print()
+        print(self.table.format_table())
+        print(f"\n{summary['matches']} matches in {summary['wall_time_s']:.2f}s wall "
+              f"({summary['match_time_s_total']:.2f}s of match time, {self.workers} workers)")
+        return summary["standings"]
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="GoLuminamics headless arena tournament")
+    parser.add_argument("participants", nargs="+",
+                        help="random | greedy | search[:<depth>] | llm:<model> | llm:<model>#<playbook>")
+    parser.add_argument("--format", choices=["round-robin", "swiss"], default="round-robin")
+    parser.add_argument("--rounds", type=int, default=3, help="Swiss rounds")
+    parser.add_argument("--games", type=int, default=1, help="Games per pairing (and colour)")
+    parser.add_argument("--grid-size", type=int, default=9)
+    parser.add_argument("--max-turns", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, default="tournaments/results.jsonl")
+    parser.add_argument("--cache", type=str, default=None, help="Path to the SQLite LLM response cache")
+    parser.add_argument("--replay", action="store_true", help="Serve LLM moves only from the cache")
+    parser.add_argument("--verbose", action="store_true", help="Show agent output from the workers")
+    parser.add_argument("--tt-mb", type=float, default=DEFAULT_TT_MB,
+                        help="Transposition table shared by search engines across workers, in MB (0 = one per engine)")
+    args = parser.parse_args()
+
+    tournament = Tournament(
+        args.participants, fmt=args.format, rounds=args.rounds, games_per_pairing=args.games,
+        grid_size=args.grid_size, max_turns=args.max_turns, workers=args.workers, seed=args.seed,
+        output=args.output, cache_path=args.cache, replay=args.replay, verbose=args.verbose, tt_mb=args.tt_mb
+    )
+    tournament.run()
+
+
+if __name__ == "__main__":
+    main()
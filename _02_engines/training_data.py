@@ -0,0 +1,417 @@
+"""
+File: training_data.py
+Creation Date: 2026-10-19
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: Export game logs to memory-mapped NumPy shards for training, and sample minibatches from them.
+
+One sample per recorded turn: the board the acting player saw (the previous
+turn's state_t; an empty board for the first turn), as observation planes
+in GameServer._get_observation's layout, plus the action as an integer id,
+the recorded reward and terminal flag, and the acting player.
+
+Output (one dataset per grid size):
+    <output>/grid_<g>/manifest.json
+    <output>/grid_<g>/shard_00000.obs.npy       uint8 (shard_size, g, g, 9)
+    <output>/grid_<g>/shard_00000.action.npy    int32
+    <output>/grid_<g>/shard_00000.reward.npy    float32
+    <output>/grid_<g>/shard_00000.terminal.npy  bool
+    <output>/grid_<g>/shard_00000.player.npy    int8
+Every shard file has shard_size rows; the manifest records how many are used.
+
+Requires numpy (pip install numpy), which the GUI does not need.
+
+Usage:
+    python -m _02_engines.training_data games/ --output datasets/ --workers 8
+    data = ShardDataset("datasets/grid_19")
+    batch = data.sample(256)    # {"obs": float32 (256, 19, 19, 9), "action": ..., ...}
+    batch = data.sample(256, augment=True)      # each sample under a random board symmetry
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from _01_core_logic.board_state import StoneType
+from _01_core_logic.game_library import find_logs
+from _01_core_logic.game_log import LazyGameLog
+from _01_core_logic.symmetry import IDENTITY, TRANSFORMS, cell_permutation, transform_action
+from _02_engines.action_ids import ACTION_BLOCKS, SINGLE_ACTIONS, decode_action, encode_action, num_actions
+
+OBS_FEATURES = 9 # empty, p1 prism/mirror/splitter/blocker, p2 prism/mirror/splitter/blocker
+DEFAULT_SHARD_SIZE = 65536
+FILES_PER_TASK = 16
+FIELDS = {"obs": "uint8", "action": "int32", "reward": "float32", "terminal": "bool", "player": "int8"}
+DEDUP_MODES = ("position", "symmetry", "transition", "none")
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("training data export requires the 'numpy' package (pip install numpy)")
+
+
+def cell_codes(state, grid_size):
+    """
+    Board of a state_t as one byte per cell (y-major): 0 empty, else the
+    index of the stone's one-hot feature in GameServer._get_observation.
+    """
+    codes = bytearray(grid_size * grid_size)
+    for key, stone in (state.get("stones") or {}).items():
+        x, y = map(int, key.split(","))
+        code = (stone["player"] - 1) * 4 + StoneType[stone["type"]].value
+        if code < OBS_FEATURES:
+            codes[y * grid_size + x] = code
+    return bytes(codes)
+
+
+def codes_to_planes(codes, grid_size):
+    """(n, g*g) uint8 cell codes -> (n, g, g, 9) uint8 one-hot planes."""
+    return np.eye(OBS_FEATURES, dtype=np.uint8)[codes].reshape(len(codes), grid_size, grid_size, OBS_FEATURES)
+
+
+@lru_cache(maxsize=None)
+def cell_gather(t, grid_size):
+    """src such that, for (n, g*g, ...) cell arrays, transformed = original[:, src]."""
+    src = np.empty(grid_size * grid_size, dtype=np.int64)
+    src[cell_permutation(t, grid_size)] = np.arange(grid_size * grid_size)
+    src.flags.writeable = False
+    return src
+
+
+@lru_cache(maxsize=None)
+def action_permutation(t, grid_size):
+    """perm[action_id] = the id of that action on the board transformed by t."""
+    perm = np.array([encode_action(transform_action(decode_action(a, grid_size), t, grid_size), grid_size)
+                     for a in range(num_actions(grid_size))], dtype=np.int32)
+    perm.flags.writeable = False
+    return perm
+
+
+def augment(batch, transforms, grid_size):
+    """
+    Turn sample i of batch by transforms[i] (symmetry transform ids), in
+    place: observation planes are permuted cell-wise and action ids mapped
+    with action_permutation. Rewards, terminal flags and players are
+    unchanged by symmetry.
+    """
+    transforms = np.asarray(transforms)
+    obs = batch["obs"].reshape(len(transforms), grid_size * grid_size, OBS_FEATURES)
+    for t in np.unique(transforms):
+        if t == IDENTITY:
+            continue
+        where = np.flatnonzero(transforms == t)
+        obs[where] = obs[where][:, cell_gather(int(t), grid_size)]
+        batch["action"][where] = action_permutation(int(t), grid_size)[batch["action"][where]]
+    return batch
+
+
+def _canonical_codes(codes, grid_size):
+    """Smallest of the 8 symmetric versions of a cell-code board."""
+    board = np.frombuffer(codes, dtype=np.uint8)
+    return min(board[cell_gather(t, grid_size)].tobytes() for t in TRANSFORMS)
+
+
+def extract_samples(paths, dedup="position"):
+    """
+    Worker: the samples of the games in paths, grouped by grid size.
+
+    Returns ({grid_size: columns}, stats), where columns holds "codes"
+    (bytes per sample), "action", "reward", "terminal", "player" and "key"
+    (8-byte hash used for deduplication, None when dedup is "none").
+    Duplicates within the task are already dropped; with dedup "symmetry"
+    a position also repeats its 7 rotated and mirrored versions.
+    """
+    by_grid = {}
+    stats = {"games": 0, "turns": 0, "samples": 0, "duplicates": 0, "unencodable": 0, "skipped": 0, "failed": 0}
+    seen = set()
+    for path in paths:
+        try:
+            log = LazyGameLog(path)
+        except ValueError:
+            stats["skipped"] += 1 # Legacy logs have no snapshots
+            continue
+        except Exception:
+            stats["failed"] += 1
+            continue
+        try:
+            log.index_all()
+            if not len(log):
+                stats["skipped"] += 1
+                continue
+            grid_size = log.scalars[0].get("grid_size") or log.metadata.get("game_settings", {}).get("grid_size", 19)
+            columns = by_grid.setdefault(grid_size, {name: [] for name in ("codes", "action", "reward", "terminal",
+                                                                           "player", "key")})
+            codes = bytes(grid_size * grid_size) # Empty board before the first turn
+            for i, turn in enumerate(log.turns):
+                action = turn.get("agent_action") or {}
+                action_id = encode_action(action, grid_size)
+                player = (action.get("params") or {}).get("player", action.get("player", 0))
+                if action_id < 0:
+                    stats["unencodable"] += 1
+                else:
+                    key = None
+                    if dedup != "none":
+                        board = _canonical_codes(codes, grid_size) if dedup == "symmetry" else codes
+                        digest = hashlib.blake2b(board, digest_size=8)
+                        digest.update(bytes([int(player or 0)]))
+                        if dedup == "transition":
+                            digest.update(action_id.to_bytes(4, "little"))
+                        key = digest.digest()
+                    if key is not None and key in seen:
+                        stats["duplicates"] += 1
+                    else:
+                        if key is not None:
+                            seen.add(key)
+                        columns["codes"].append(codes)
+                        columns["action"].append(action_id)
+                        columns["reward"].append(float(turn.get("reward_t") or 0.0))
+                        columns["terminal"].append(bool(turn.get("terminal")))
+                        columns["player"].append(int(player or 0))
+                        columns["key"].append(key)
+                        stats["samples"] += 1
+                codes = cell_codes(log.state_at(i), grid_size) # What the next player sees
+            stats["games"] += 1
+            stats["turns"] += len(log)
+        except Exception:
+            stats["failed"] += 1
+        finally:
+            log.close()
+    return by_grid, stats
+
+
+class ShardWriter:
+    """Append samples of one grid size into fixed-size memory-mapped shards."""
+
+    def __init__(self, directory, grid_size, shard_size=DEFAULT_SHARD_SIZE):
+        _require_numpy()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.grid_size = grid_size
+        self.shard_size = shard_size
+        self.shards = []     # {"name", "count"} per closed shard
+        self.count = 0
+        self._arrays = None
+        self._fill = 0
+
+    def _open_shard(self):
+        name = f"shard_{len(self.shards):05d}"
+        g = self.grid_size
+        shapes = {"obs": (self.shard_size, g, g, OBS_FEATURES)}
+        self._arrays = {
+            field: np.lib.format.open_memmap(self.directory / f"{name}.{field}.npy", mode="w+", dtype=dtype,
+                                             shape=shapes.get(field, (self.shard_size,)))
+            for field, dtype in FIELDS.items()
+        }
+        self._name = name
+        self._fill = 0
+
+    def _close_shard(self):
+        for array in self._arrays.values():
+            array.flush()
+        self.shards.append({"name": self._name, "count": self._fill})
+        self._arrays = None
+
+    def append(self, codes, action, reward, terminal, player):
+        """Write n samples: codes (n, g*g) uint8 and 1-D columns of length n."""
+        start = 0
+        while start < len(codes):
+            if self._arrays is None:
+                self._open_shard()
+            n = min(len(codes) - start, self.shard_size - self._fill)
+            rows = slice(self._fill, self._fill + n)
+            part = slice(start, start + n)
+            self._arrays["obs"][rows] = codes_to_planes(codes[part], self.grid_size)
+            self._arrays["action"][rows] = action[part]
+            self._arrays["reward"][rows] = reward[part]
+            self._arrays["terminal"][rows] = terminal[part]
+            self._arrays["player"][rows] = player[part]
+            self._fill += n
+            self.count += n
+            start += n
+            if self._fill == self.shard_size:
+                self._close_shard()
+
+    def close(self, extra=None):
+        """Flush the last shard and write manifest.json."""
+        if self._arrays is not None:
+            self._close_shard()
+        manifest = {
+            "grid_size": self.grid_size,
+            "shard_size": self.shard_size,
+            "samples": self.count,
+            "obs_layout": "(y, x, feature); features: empty, p1 prism/mirror/splitter/blocker, "
+                          "p2 prism/mirror/splitter/blocker (GameServer._get_observation)",
+            "num_actions": num_actions(self.grid_size),
+            "action_blocks": [list(block) for block in ACTION_BLOCKS] + [[name, 1] for name in SINGLE_ACTIONS],
+            "fields": FIELDS,
+            "shards": self.shards,
+        }
+        manifest.update(extra or {})
+        with open(self.directory / "manifest.json", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+
+
+def export(inputs, output, workers=None, shard_size=DEFAULT_SHARD_SIZE, dedup="position", progress=True):
+    """
+    Export every game log under inputs into <output>/grid_<g>/ datasets.
+
+    Workers extract and hash samples; this process drops positions seen in
+    earlier tasks and is the only writer. Returns the run statistics.
+    """
+    _require_numpy()
+    if dedup not in DEDUP_MODES:
+        raise ValueError(f"Unknown dedup mode '{dedup}'. Use one of {list(DEDUP_MODES)}")
+    paths = sorted(p for item in inputs for p in (find_logs(item) if os.path.isdir(item) else [item]))
+    tasks = [paths[i:i + FILES_PER_TASK] for i in range(0, len(paths), FILES_PER_TASK)]
+    workers = workers or os.cpu_count() or 1
+
+    writers = {}
+    seen = {}     # grid size -> keys already written
+    totals = {"files": len(paths), "games": 0, "turns": 0, "samples": 0, "duplicates": 0,
+              "unencodable": 0, "skipped": 0, "failed": 0}
+
+    def write(by_grid, stats):
+        for key in stats:
+            if key != "samples":
+                totals[key] += stats[key]
+        for grid_size, columns in by_grid.items():
+            keys = seen.setdefault(grid_size, set())
+            keep = []
+            for i, key in enumerate(columns["key"]):
+                if key is None:
+                    keep.append(i)
+                elif key not in keys:
+                    keys.add(key)
+                    keep.append(i)
+            totals["duplicates"] += len(columns["key"]) - len(keep)
+            if not keep:
+                continue
+            writer = writers.get(grid_size)
+            if writer is None:
+                writer = writers[grid_size] = ShardWriter(os.path.join(output, f"grid_{grid_size}"),
+                                                          grid_size, shard_size)
+            codes = np.frombuffer(b"".join(columns["codes"][i] for i in keep), dtype=np.uint8)
+            writer.append(codes.reshape(len(keep), grid_size * grid_size),
+                          np.asarray(columns["action"], dtype=np.int32)[keep],
+                          np.asarray(columns["reward"], dtype=np.float32)[keep],
+                          np.asarray(columns["terminal"], dtype=bool)[keep],
+                          np.asarray(columns["player"], dtype=np.int8)[keep])
+            totals["samples"] += len(keep)
+
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            write(*extract_samples(task, dedup))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(extract_samples, task, dedup) for task in tasks]
+            for done, future in enumerate(as_completed(futures), 1):
+                write(*future.result())
+                if progress:
+                    print(f"\r{min(done * FILES_PER_TASK, len(paths))}/{len(paths)} files, "
+                          f"{totals['samples']} samples", end="", flush=True)
+        if progress:
+            print()
+
+    for writer in writers.values():
+        writer.close({"dedup": dedup})
+    totals["datasets"] = {g: writers[g].count for g in sorted(writers)}
+    return totals
+
+
+class ShardDataset:
+    """
+    Read-only view of an exported dataset, memory-mapped shard by shard.
+
+    Only the rows a batch touches are read from disk, so datasets larger
+    than memory sample as fast as the page cache allows.
+    """
+
+    def __init__(self, directory):
+        _require_numpy()
+        self.directory = Path(directory)
+        with open(self.directory / "manifest.json", "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.grid_size = self.manifest["grid_size"]
+        self.num_actions = self.manifest["num_actions"]
+        self.shards = [
+            {field: np.load(self.directory / f"{shard['name']}.{field}.npy", mmap_mode="r") for field in FIELDS}
+            for shard in self.manifest["shards"]
+        ]
+        counts = np.array([shard["count"] for shard in self.manifest["shards"]], dtype=np.int64)
+        self._starts = np.concatenate(([0], np.cumsum(counts)))
+
+    def __len__(self):
+        return int(self._starts[-1])
+
+    def get(self, indices, obs_dtype=np.float32, transforms=None):
+        """
+        Samples at the given global indices, as a dict of arrays (obs cast
+        to obs_dtype), each turned by transforms[i] if given (see augment).
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if len(indices) and (indices.min() < 0 or indices.max() >= len(self)):
+            raise IndexError(f"sample index out of range (0..{len(self) - 1})")
+        shard_ids = np.searchsorted(self._starts, indices, side="right") - 1
+        g = self.grid_size
+        batch = {
+            "obs": np.empty((len(indices), g, g, OBS_FEATURES), dtype=obs_dtype),
+            **{field: np.empty(len(indices), dtype=dtype) for field, dtype in FIELDS.items() if field != "obs"},
+        }
+        for shard_id in np.unique(shard_ids):
+            where = np.flatnonzero(shard_ids == shard_id)
+            rows = indices[where] - self._starts[shard_id]
+            order = np.argsort(rows) # Ascending rows read the memmap front to back
+            where, rows = where[order], rows[order]
+            for field, array in self.shards[shard_id].items():
+                batch[field][where] = array[rows]
+        if transforms is not None:
+            augment(batch, transforms, g)
+        return batch
+
+    def sample(self, batch_size, rng=None, obs_dtype=np.float32, augment=False):
+        """
+        A uniformly random minibatch (with replacement); rng is a numpy
+        Generator. With augment=True every sample is also turned by a
+        random one of the board's 8 symmetries, so the shards need not
+        store the copies.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        indices = rng.integers(0, len(self), size=batch_size)
+        transforms = rng.integers(0, len(TRANSFORMS), size=batch_size) if augment else None
+        return self.get(indices, obs_dtype, transforms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export GoLuminamics game logs to memory-mapped training shards")
+    parser.add_argument("inputs", nargs="+", help="Game logs or directories of logs (V2 JSON or JSON Lines)")
+    parser.add_argument("--output", default="datasets", help="Output directory (one grid_<g> dataset per grid size)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE, help="Samples per shard")
+    parser.add_argument("--dedup", choices=DEDUP_MODES, default="position",
+                        help="position: keep the first sample of each (board, player to move); "
+                             "symmetry: the same, counting rotated and mirrored boards as one; "
+                             "transition: of each (board, player, action); none: keep all")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    totals = export(args.inputs, args.output, workers=args.workers, shard_size=args.shard_size, dedup=args.dedup)
+    print(f"{totals['games']} games, {totals['turns']} turns -> {totals['samples']} samples "
+          f"({totals['duplicates']} duplicates, {totals['unencodable']} unencodable actions) "
+          f"in {time.perf_counter() - start:.1f}s; {totals['skipped']} skipped, {totals['failed']} failed files")
+    for grid_size, count in totals["datasets"].items():
+        print(f"  {os.path.join(args.output, f'grid_{grid_size}')}: {count} samples")
+
+
+if __name__ == "__main__":
+    main()
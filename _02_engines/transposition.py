@@ -0,0 +1,217 @@
+"""
+File: transposition.py
+Creation Date: 2026-10-19
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: Fixed-size transposition table for game-tree search, optionally in shared memory.
+
+Entries live in three flat arrays (check word, packed meta word, value)
+over one buffer whose size is fixed at creation, so memory use never grows.
+Slots come in buckets of two: a new position takes an empty slot, else
+evicts an entry left by an older search, else the shallower entry.
+
+A shared table is a multiprocessing.shared_memory block that search worker
+processes attach to by name; a pickled shared table attaches on unpickle.
+Workers must be started through multiprocessing (e.g. ProcessPoolExecutor),
+so that they share the creator's resource tracker.
+Writers take no lock: each slot stores key ^ meta ^ value, so a slot torn
+by two concurrent writers fails the check and reads as a miss.
+
+Hit statistics are counted per process (see stats()).
+
+Usage:
+    table = TranspositionTable(size_mb=64, shared=True)
+    executor.submit(search_worker, table, ...)       # attaches in the worker
+
+    entry = table.probe(key)                        # (depth, value, bound, move) or None
+    table.store(key, depth, value, BOUND_EXACT, move)
+    table.close(); table.unlink()                   # the creator frees the block
+"""
+
+from multiprocessing import shared_memory
+
+BOUND_EXACT = 1
+BOUND_LOWER = 2  # value is a lower bound (search failed high)
+BOUND_UPPER = 3  # value is an upper bound (search failed low)
+
+WAYS = 2
+ENTRY_BYTES = 24  # check (8) + meta (8) + value (8)
+HEADER_BYTES = 64
+MAGIC = 0x314C_4254_4E4C_47 # Marks a shared block as a table
+USAGE_SAMPLE = 2000
+MAX_DEPTH = 0xFFFE
+
+# Meta word: move + 1 (bits 0-31, 0 = none), depth + 1 (bits 32-47, 0 = empty slot),
+# bound (bits 48-49), generation (bits 56-63)
+_MOVE_MASK = 0xFFFFFFFF
+_DEPTH_SHIFT = 32
+_BOUND_SHIFT = 48
+_GENERATION_SHIFT = 56
+
+
+class TranspositionTable:
+    """
+    Array-backed transposition table keyed by 64-bit position hashes.
+
+    Stores (depth, value, bound, move) per position; move is a
+    non-negative integer action id (e.g. action_ids.encode_action) or
+    None.
+    """
+
+    def __init__(self, size_mb=16, shared=False, _shm=None):
+        if _shm is not None:
+            self._shm = _shm
+            buffer = _shm.buf
+            self._header = buffer[:HEADER_BYTES].cast("Q")
+            if self._header[0] != MAGIC:
+                raise ValueError(f"Shared memory block '{_shm.name}' is not a transposition table")
+            entries = self._header[1]
+        else:
+            buckets = 1
+            while (buckets * 2) * WAYS * ENTRY_BYTES + HEADER_BYTES <= size_mb * 1024 * 1024:
+                buckets *= 2
+            entries = buckets * WAYS
+            nbytes = HEADER_BYTES + entries * ENTRY_BYTES
+            if shared:
+                self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+                buffer = self._shm.buf
+            else:
+                self._shm = None
+                buffer = memoryview(bytearray(nbytes))
+            self._header = buffer[:HEADER_BYTES].cast("Q")
+            self._header[0] = MAGIC
+            self._header[1] = entries
+            self._header[2] = 0 # Generation
+
+        self.entries = entries
+        self._mask = entries // WAYS - 1
+        start = HEADER_BYTES
+        self._check = buffer[start:start + 8 * entries].cast("Q")
+        self._meta_bytes = buffer[start + 8 * entries:start + 16 * entries]
+        self._meta = self._meta_bytes.cast("Q")
+        values = buffer[start + 16 * entries:start + 24 * entries]
+        self._value = values.cast("d")
+        self._value_bits = values.cast("Q")
+        self._views = [self._header, self._check, self._meta, self._meta_bytes, self._value, self._value_bits]
+
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.replacements = 0 # Stores that evicted another position
+
+    @classmethod
+    def attach(cls, name):
+        """Open a shared table created in another process."""
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False) # Python 3.13+
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+        return cls(_shm=shm)
+
+    def __reduce__(self):
+        if self._shm is None:
+            raise TypeError("Only shared transposition tables can be sent to other processes")
+        return TranspositionTable.attach, (self._shm.name,)
+
+    @property
+    def name(self):
+        """Shared memory block name (None for a process-local table)."""
+        return self._shm.name if self._shm is not None else None
+
+    @property
+    def memory_bytes(self):
+        """Bytes of table memory (header included)."""
+        return HEADER_BYTES + self.entries * ENTRY_BYTES
+
+    @property
+    def generation(self):
+        return self._header[2]
+
+    def new_search(self):
+        """Start a new search: entries from older searches become the first to be replaced."""
+        self._header[2] = (self._header[2] + 1) & 0xFF
+
+    def clear(self):
+        """Empty every slot (not safe while other processes search)."""
+        self._meta_bytes[:] = bytes(len(self._meta_bytes)) # A zero meta word marks an empty slot
+
+    def probe(self, key):
+        """(depth, value, bound, move) stored for key, or None."""
+        self.probes += 1
+        slot = (key & self._mask) * WAYS
+        for slot in (slot, slot + 1):
+            meta = self._meta[slot]
+            if meta and self._check[slot] ^ meta ^ self._value_bits[slot] == key:
+                self.hits += 1
+                move = meta & _MOVE_MASK
+                return ((meta >> _DEPTH_SHIFT & 0xFFFF) - 1, self._value[slot], meta >> _BOUND_SHIFT & 0x3,
+                        move - 1 if move else None)
+        return None
+
+    def store(self, key, depth, value, bound, move=None):
+        """
+        Record a search result for key. A result for a position already in
+        the table replaces it unless that one is deeper and from this search.
+        """
+        self.stores += 1
+        generation = self._header[2]
+        first = (key & self._mask) * WAYS
+        slot = None
+        for candidate in (first, first + 1):
+            meta = self._meta[candidate]
+            if meta and self._check[candidate] ^ meta ^ self._value_bits[candidate] == key:
+                if meta >> _GENERATION_SHIFT == generation and depth < (meta >> _DEPTH_SHIFT & 0xFFFF) - 1:
+                    return
+                slot = candidate
+                break
+        if slot is None:
+            # Victim: empty first, then older searches, then the shallower (the second slot on ties)
+            slot = min((first + 1, first), key=lambda i: (
+                self._meta[i] != 0,
+                self._meta[i] >> _GENERATION_SHIFT == generation,
+                self._meta[i] >> _DEPTH_SHIFT & 0xFFFF,
+            ))
+            if self._meta[slot]:
+                self.replacements += 1
+
+        meta = ((0 if move is None or move < 0 else move + 1) & _MOVE_MASK
+                | (min(max(depth, 0), MAX_DEPTH) + 1) << _DEPTH_SHIFT
+                | bound << _BOUND_SHIFT
+                | generation << _GENERATION_SHIFT)
+        self._value[slot] = value
+        self._meta[slot] = meta
+        self._check[slot] = key ^ meta ^ self._value_bits[slot]
+
+    def usage(self):
+        """Fraction of sampled slots holding an entry from the current search."""
+        sample = min(self.entries, USAGE_SAMPLE)
+        generation = self._header[2]
+        used = sum(1 for i in range(sample) if self._meta[i] and self._meta[i] >> _GENERATION_SHIFT == generation)
+        return used / sample
+
+    def stats(self):
+        """This process's probe/hit/store counters plus table size and usage."""
+        return {
+            "entries": self.entries,
+            "memory_bytes": self.memory_bytes,
+            "shared": self._shm is not None,
+            "probes": self.probes,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.probes, 4) if self.probes else 0.0,
+            "stores": self.stores,
+            "replacements": self.replacements,
+            "usage": round(self.usage(), 4),
+        }
+
+    def close(self):
+        """Release this process's view of the table."""
+        for view in self._views:
+            view.release()
+        self._views = []
+        if self._shm is not None:
+            self._shm.close()
+
+    def unlink(self):
+        """Free a shared table's memory block (call once, from the creator, after close())."""
+        if self._shm is not None:
+            self._shm.unlink()
@@ -0,0 +1,78 @@
+"""
+File: agent_worker.py
+Creation Date: 2026-10-19
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: AI agent decisions on QThreadPool, so a slow model never stalls the GUI thread.
+"""
+
+from PySide6.QtCore import QObject, Signal
+
+from _03_ui.task_runner import TaskRunner
+
+
+def _decide(is_cancelled, player, agent, server_view, attempts):
+    """Ask one agent for a move on a server view over a private board snapshot (worker thread)."""
+    action = None
+    for _ in range(attempts):
+        if is_cancelled():
+            return None
+        try:
+            action = agent.get_move(server_view)
+        except Exception as e:
+            print(f"Error en decisión de IA (Jugador {player}): {e}")
+            action = None
+        if action:
+            break
+    return action
+
+
+class AgentMoves(QObject):
+    """
+    Runs agent.get_move off the GUI thread, at most one request per player.
+
+    Decisions arrive through move_ready on the GUI thread; take() hands the
+    arrived one to the caller, so a simulation tick only ever applies
+    decisions that are already there. cancel_all() drops pending requests:
+    a running task still finishes, but its result is discarded.
+    """
+    move_ready = Signal(int)  # player
+
+    def __init__(self, parent=None, attempts=3):
+        super().__init__(parent)
+        self.runner = TaskRunner(self, max_threads=2)  # One per player
+        self.runner.finished.connect(self._on_finished)
+        self.attempts = attempts
+        self._arrived = {}  # player -> decided action (None if the agent gave none)
+
+    def request(self, player, agent, server_view):
+        """Queue a decision for player (replacing any pending one) and return its request id."""
+        self._arrived.pop(player, None)
+        return self.runner.start(player, _decide, player, agent, server_view, self.attempts)
+
+    def cancel(self, player):
+        """Forget player's pending request and any undelivered decision."""
+        self.runner.cancel(player)
+        self._arrived.pop(player, None)
+
+    def cancel_all(self):
+        self.runner.cancel_all()
+        self._arrived.clear()
+
+    def is_pending(self, player):
+        return self.runner.is_pending(player)
+
+    def has_move(self, player):
+        return player in self._arrived
+
+    def take(self, player):
+        """Pop player's arrived decision (None if there is none)."""
+        return self._arrived.pop(player, None)
+
+    def wait(self, msecs=-1):
+        """Block until running tasks finish (e.g. before exit)."""
+        return self.runner.wait(msecs)
+
+    def _on_finished(self, player, action):
+        self._arrived[player] = action
+        self.move_ready.emit(player)
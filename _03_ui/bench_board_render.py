@@ -0,0 +1,108 @@
+"""
+File: bench_board_render.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Frame-time benchmark for GameBoard stones: sprite atlas vs vector items.
+
+Usage:
+    python -m _03_ui.bench_board_render --grid-size 39 --frames 20 --theme "Real Stone"
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Render offscreen unless a display platform was chosen explicitly
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QImage, QPainter, QColor
+from PySide6.QtCore import QRectF
+
+from _03_ui.game_board import GameBoard
+from _01_core_logic.board_state import StoneData2D, StoneType
+
+STONE_TYPES = ["PRISM", "MIRROR", "SPLITTER", "BLOCKER"]
+THEMES = ["Classic", "Neon", "Pastel", "Forest", "Real Stone"]
+
+
+def fill_board(board, seed):
+    """Put a stone with random type, owner and rotation on every cell (logical state only)."""
+    rng = random.Random(seed)
+    for x in range(board.grid_size):
+        for y in range(board.grid_size):
+            stone = StoneData2D(StoneType[rng.choice(STONE_TYPES)], rng.choice([1, 2]))
+            stone.rotation_angle = rng.choice(range(0, 360, 45))
+            board.board_state.stones[(x, y)] = stone
+
+
+def render_frame(board, image):
+    """Paint the whole scene once, as the view would on a full repaint."""
+    image.fill(QColor(0, 0, 0))
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setRenderHint(QPainter.SmoothPixmapTransform)
+    board.scene.render(painter, QRectF(image.rect()), board.scene.sceneRect())
+    painter.end()
+
+
+def run_mode(use_sprite_atlas, grid_size, frames, theme, resolution, seed):
+    board = GameBoard()
+    board.stop_timer()
+    board.use_sprite_atlas = use_sprite_atlas
+    board.set_grid_size(grid_size)
+    board.set_theme(theme)
+    fill_board(board, seed)
+
+    start = time.perf_counter()
+    board._sync_stone_items()
+    draw_s = time.perf_counter() - start
+
+    image = QImage(resolution, resolution, QImage.Format_ARGB32_Premultiplied)
+    render_frame(board, image)  # Warm-up
+    start = time.perf_counter()
+    for _ in range(frames):
+        render_frame(board, image)
+    frame_s = (time.perf_counter() - start) / frames
+
+    other = THEMES[(THEMES.index(theme) + 1) % len(THEMES)]
+    start = time.perf_counter()
+    board.set_theme(other)
+    board.set_theme(theme)
+    theme_s = (time.perf_counter() - start) / 2
+
+    return {
+        "stones": len(board.stone_items),
+        "scene_items": len(board.scene.items()),
+        "draw_ms": draw_s * 1000,
+        "frame_ms": frame_s * 1000,
+        "theme_ms": theme_s * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GameBoard stone rendering")
+    parser.add_argument("--grid-size", type=int, default=39)
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--theme", default="Real Stone", choices=THEMES)
+    parser.add_argument("--resolution", type=int, default=1400, help="Square frame size in pixels")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv) # Bound: the scenes need it alive throughout
+
+    print(f"{args.grid_size}x{args.grid_size} full board, theme '{args.theme}', "
+          f"{args.resolution}px frames\n")
+    print(f"{'mode':<14} {'stones':>7} {'items':>7} {'draw all':>10} {'frame':>10} {'theme swap':>11}")
+    for name, use_sprite_atlas in (("vector items", False), ("sprite atlas", True)):
+        app.processEvents() # Let the previous mode's pending events run before timing the next
+        r = run_mode(use_sprite_atlas, args.grid_size, args.frames, args.theme, args.resolution, args.seed)
+        print(f"{name:<14} {r['stones']:>7} {r['scene_items']:>7} {r['draw_ms']:>8.1f}ms "
+              f"{r['frame_ms']:>8.1f}ms {r['theme_ms']:>9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
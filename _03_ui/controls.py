@@ -29,6 +29,7 @@ class UIControls(QWidget):
     timer_settings_changed = Signal(int, int) # total_min, move_sec
     infinite_energy_changed = Signal(bool)
     infinite_score_changed = Signal(bool)
+    territory_overlay_toggled = Signal(bool)
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -146,6 +147,14 @@ class UIControls(QWidget):
         )
         layout.addWidget(self.infinite_score_check)
         
+        # Display Settings
+        self.territory_overlay_check = QCheckBox("Show Territory")
+        self.territory_overlay_check.setToolTip("Shade intersections by who illuminates them (P1, P2, contested)")
+        self.territory_overlay_check.stateChanged.connect(
+            lambda state: self.territory_overlay_toggled.emit(state == 2)
+        )
+        layout.addWidget(self.territory_overlay_check)
+        
         # Score Board
         score_group = QGroupBox("Score")
         score_layout = QGridLayout()
@@ -6,13 +6,19 @@ Version: 2.0.0
 Description: Source file.
 """
 
-from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsLineItem, QGraphicsRectItem
-from PySide6.QtGui import QBrush, QColor, QPen, QRadialGradient, QPixmap, QPainter, QFont
+from PySide6.QtWidgets import (QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsLineItem,
+                               QGraphicsRectItem, QGraphicsPixmapItem)
+from PySide6.QtGui import QBrush, QColor, QPen, QRadialGradient, QPixmap, QPainter, QFont, QPainterPath
 from PySide6.QtCore import Qt, QRectF, QPointF, Signal, QObject, QTimer
 from _01_core_logic.board_state import BoardState2D, StoneType
+from _01_core_logic.sim_loop import FixedStepLoop
+from _01_core_logic import instrumentation
 from _02_engines.laser import LaserCalculator2D
+from _03_ui.laser_worker import LaserTracer
+from _03_ui.territory_overlay import TerritoryOverlay
 import os
 import math
+import bisect
 import json
 from pathlib import Path
 
@@ -25,9 +31,14 @@ class GameBoard(QGraphicsView):
     stone_placed = Signal(tuple, str)  # (x, y), stone_type
     stone_rotated = Signal(tuple, float) # (x, y), angle
     laser_input = Signal(tuple, tuple, int) # pos, direction, player
+    laser_fired = Signal(tuple, tuple, int, list) # pos, direction, player, captured (after shoot_laser_async)
     timer_updated = Signal(float, float, float, int) # p1_time, p2_time, move_time, total_limit
     game_over_signal = Signal() # New signal for time expiration
     
+    # Stones are drawn from pre-rendered pixmaps; False draws the vector items directly
+    use_sprite_atlas = True
+    SPRITE_SCALE = 2 # Sprite pixels per scene unit, keeps stones sharp when the view zooms in
+    
     # Color Themes
     THEMES = {
         "Classic": {
@@ -87,10 +98,30 @@ class GameBoard(QGraphicsView):
         self.setScene(self.scene)
         
         self.stone_items = {} # Stores QGraphicsItem for each stone at (x,y)
-        self.laser_items = [] # Stores QGraphicsLineItem for laser paths
+        self.laser_beams = {} # player -> (glow item or None, core item), reused for every shot
+        self.preview_beam = None # Aiming preview path, last completed trace
+        
+        # Laser traces for aiming previews and interactive shots run off the GUI thread
+        self.laser_tracer = LaserTracer(self)
+        self.laser_tracer.trace_ready.connect(self._on_trace_ready)
+        self._shot_signature = None
+        self._shot_stamp = None # (turn, board generation) the pending shot was fired on
+        self._turn_serial = 0 # Bumped on every change of turn
+        self._board_generation = 0 # Bumped whenever board_state is replaced
         self.aiming_arrow = None # Visual for current aiming direction
         self.victory_items = [] # Stores victory screen items for cleanup
         
+        # Territory heatmap (hidden until toggled on); refreshes are coalesced per event loop pass
+        self.territory_overlay = None
+        self._territory_timer = QTimer(self)
+        self._territory_timer.setSingleShot(True)
+        self._territory_timer.setInterval(0)
+        self._territory_timer.timeout.connect(self.refresh_territory)
+        
+        # Deferred rendering (begin_batch / commit_batch)
+        self._batch_depth = 0
+        self._pending_laser = None # (paths, player) of the last laser shot inside a batch
+        
         self.current_theme = "Classic" # Default theme
         
         # Interaction State
@@ -112,13 +143,19 @@ class GameBoard(QGraphicsView):
         self.current_player = 1
         
         self.texture_cache = {} # Cache for scaled textures
+        self.sprite_atlas = {} # (theme, stone type, player, cell size) -> (QPixmap, offset)
         
-        self.texture_cache = {} # Cache for scaled textures
+        # Interpolated stone motion (realtime mode): target pos -> (grid-unit polyline, cumulative lengths)
+        self.interpolate_moves = False
+        self.stone_motion = {}
         
-        # Timer
+        # Timer: the clock advances in fixed 0.1 s steps of real elapsed time,
+        # so a slow frame delays the display but never the clock itself
+        self.clock_loop = FixedStepLoop(self._clock_step, tick_rate=10, max_catch_up=None)
         self.game_timer = QTimer(self)
         self.game_timer.timeout.connect(self.on_timer_tick)
         self.game_timer.start(100) # 100ms
+        self.clock_loop.start()
         
         self._init_board()
         self._setup_view()
@@ -140,6 +177,15 @@ class GameBoard(QGraphicsView):
             # Load 3D effects configuration for Real Stones theme
             self.stone_3d_config = config.get("stones", {}).get("real_stone_3d_effects", {})
             
+            # Laser beam settings (glow)
+            self.laser_config = config.get("lasers", {})
+            
+            # Territory overlay colors
+            self.territory_config = config.get("territory_overlay", {})
+            
+            # Background checkpoints of the game log
+            self.autosave_config = config.get("autosave", {})
+            
         except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
             # Fallback to default values if config fails
             print(f"Warning: Could not load ui_config.json ({e}), using defaults")
@@ -148,10 +194,15 @@ class GameBoard(QGraphicsView):
             self.margin_horizontal = 40
             self.margin_vertical = 30
             self.stone_3d_config = {}
+            self.laser_config = {}
+            self.territory_config = {}
+            self.autosave_config = {}
 
     def set_theme(self, theme_name):
         """Set the visual theme."""
         if theme_name in self.THEMES:
+            if theme_name != self.current_theme:
+                self.sprite_atlas.clear() # Sprites of the old theme are not needed any more
             self.current_theme = theme_name
             # Update background
             theme = self.THEMES[theme_name]
@@ -184,6 +235,7 @@ class GameBoard(QGraphicsView):
             for pos in self.stone_items:
                 self.scene.removeItem(self.stone_items[pos])
             self.stone_items.clear()
+            self.stone_motion.clear()
             
             for pos, stone in self.board_state.stones.items():
                 self._draw_stone(pos, stone.type_name, stone.player)
@@ -309,6 +361,11 @@ class GameBoard(QGraphicsView):
         # Initial fit
         self.fitInView(self.sceneRect(), Qt.KeepAspectRatio)
 
+    def paintEvent(self, event):
+        """Paint the viewport (timed as board.paint when instrumentation is on)."""
+        with instrumentation.span("board.paint"):
+            super().paintEvent(event)
+
     def resizeEvent(self, event):
         """Handle resize to keep board fitted."""
         super().resizeEvent(event)
@@ -463,28 +520,87 @@ class GameBoard(QGraphicsView):
         
         self.aiming_arrow.setLine(start_point.x(), start_point.y(), end_point.x(), end_point.y())
         self.aiming_arrow.setVisible(True)
+        
+        # Beam preview: the previous trace stays on screen until the next one completes
+        # (LaserTracer runs one preview at a time and keeps only the newest request waiting)
+        if self.aiming_source and direction != (0, 0):
+            self.laser_tracer.request("preview", self.board_state, self.aiming_source, direction,
+                                      self.current_player)
 
     def _clear_aiming_visual(self):
         """Clear the aiming arrow visual."""
         if self.aiming_arrow:
             self.aiming_arrow.setVisible(False)
+        self.laser_tracer.cancel("preview")
+        if self.preview_beam:
+            self.preview_beam.setPath(QPainterPath())
 
     def place_stone(self, pos, stone_type_name="PRISM", player=1, rotation=0):
         """Place a stone at grid position."""
         if self.board_state.place_stone(pos, stone_type_name, player):
             self.board_state.stones[pos].set_rotation(rotation) # Set initial rotation
-            self._draw_stone(pos, stone_type_name, player)
-            self.rotate_stone_to(pos, rotation) # Apply visual rotation
+            if not self._batch_depth:
+                self._draw_stone(pos, stone_type_name, player)
+                self.rotate_stone_to(pos, rotation) # Apply visual rotation
+            self._schedule_territory_refresh()
             self.stone_placed.emit(pos, stone_type_name)
             self.end_turn()
             return True
         return False
 
     def _draw_stone(self, pos, stone_type_name, player):
-        """Draw stone visual with 3D depth and optional texture."""
+        """Draw stone visual as a pixmap item taken from the sprite atlas."""
         x, y = pos
         center_x = self.margin_horizontal + x * self.cell_size
         center_y = self.margin_vertical + y * self.cell_size
+        
+        if self.use_sprite_atlas:
+            pixmap, offset = self._stone_sprite(stone_type_name, player)
+            stone_item = QGraphicsPixmapItem(pixmap)
+            stone_item.setOffset(offset)
+            stone_item.setTransformationMode(Qt.SmoothTransformation)
+        else:
+            stone_item = self._build_stone_item(stone_type_name, player)
+        
+        self.scene.addItem(stone_item)
+        stone_item.setPos(center_x, center_y) # Rotation pivots on the stone centre
+        stone_item.setZValue(1)
+        
+        # Remember what the item shows so batch commits can diff against it
+        stone_item.setData(0, f"{stone_type_name}:{player}")
+        self.stone_items[pos] = stone_item
+
+    def _stone_sprite(self, stone_type_name, player):
+        """
+        Return (pixmap, offset) for a stone look, rendering it on first use.
+        
+        The vector stone from _build_stone_item() is painted once per
+        (theme, stone type, player, cell size) into an offscreen pixmap at
+        SPRITE_SCALE times the scene resolution; offset places the pixmap so
+        the stone centre sits on the item origin.
+        """
+        key = (self.current_theme, stone_type_name, player, self.cell_size)
+        sprite = self.sprite_atlas.get(key)
+        if sprite is None:
+            render_scene = QGraphicsScene()
+            render_scene.addItem(self._build_stone_item(stone_type_name, player))
+            source = render_scene.itemsBoundingRect().adjusted(-1, -1, 1, 1).toAlignedRect()
+            
+            pixmap = QPixmap(source.width() * self.SPRITE_SCALE, source.height() * self.SPRITE_SCALE)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            render_scene.render(painter, QRectF(pixmap.rect()), QRectF(source))
+            painter.end()
+            pixmap.setDevicePixelRatio(self.SPRITE_SCALE)
+            
+            sprite = (pixmap, QPointF(source.topLeft()))
+            self.sprite_atlas[key] = sprite
+        return sprite
+
+    def _build_stone_item(self, stone_type_name, player):
+        """Build the vector stone (3D depth, optional texture) centred on (0, 0)."""
         radius = self.cell_size / 2 - 2
         
         # Check if using textures (Real Stone theme)
@@ -560,8 +676,8 @@ class GameBoard(QGraphicsView):
         if not use_texture:
             # Create 3D depth gradient
             gradient = QRadialGradient(
-                center_x - radius/3,
-                center_y - radius/3, 
+                -radius/3,
+                -radius/3, 
                 radius * 1.8
             )
             
@@ -624,13 +740,9 @@ class GameBoard(QGraphicsView):
         outline_pen = QPen(outline_color, 3)
         
         # Create main stone item first to act as parent
-        stone_group = self.scene.addEllipse(
-            -radius, -radius, radius * 2, radius * 2,
-            outline_pen,
-            brush
-        )
-        stone_group.setPos(center_x, center_y)
-        stone_group.setZValue(1)
+        stone_group = QGraphicsEllipseItem(-radius, -radius, radius * 2, radius * 2)
+        stone_group.setPen(outline_pen)
+        stone_group.setBrush(brush)
 
         # Enhanced 3D effects for Real Stones theme (applies to ALL stone types)
         if self.current_theme == "Real Stone":
@@ -765,10 +877,16 @@ class GameBoard(QGraphicsView):
              x_line1.setZValue(2)
              x_line2.setZValue(2)
         
-        self.stone_items[pos] = stone_group
+        return stone_group
 
     def rotate_stone_to(self, pos, angle):
         """Rotate stone to specific angle (degrees)."""
+        self._schedule_territory_refresh()
+        if self._batch_depth:
+            stone = self.board_state.stones.get(pos)
+            if stone:
+                stone.set_rotation(angle)
+            return
         if pos in self.stone_items:
             stone = self.board_state.stones[pos]
             stone.set_rotation(angle)
@@ -776,13 +894,21 @@ class GameBoard(QGraphicsView):
             item = self.stone_items[pos]
             item.setRotation(angle)
 
-    def move_stone_visual(self, from_pos, to_pos):
+    def move_stone_visual(self, from_pos, to_pos, path=None):
         """Move a stone visual from one grid position to another.
         
         Args:
             from_pos: (x, y) source position
             to_pos: (x, y) destination position (already wrapped)
+            path: optional unwrapped polyline in grid units from from_pos to
+                  to_pos (e.g. BoardState2D.trace_curve) for the stone to follow
         """
+        self._schedule_territory_refresh()
+        if self._batch_depth:
+            return
+        if self.interpolate_moves and from_pos in self.stone_items and to_pos not in self.stone_items:
+            self._start_stone_motion(from_pos, to_pos, path)
+            return
         if from_pos in self.stone_items:
             # Remove old visual
             self.scene.removeItem(self.stone_items[from_pos])
@@ -796,11 +922,6 @@ class GameBoard(QGraphicsView):
 
     def shoot_laser(self, start_pos, direction, player=1):
         """Shoot a laser and visualize the path."""
-        # Clear old lasers
-        for item in self.laser_items:
-            self.scene.removeItem(item)
-        self.laser_items.clear()
-        
         # Calculate path
         paths = self.laser_calc.calculate_path(
             (start_pos[0] + 0.5, start_pos[1] + 0.5),
@@ -808,23 +929,131 @@ class GameBoard(QGraphicsView):
             self.board_state.stones
         )
         
-        # Draw new lasers
-        laser_color = QColor("#FF0000") if player == 1 else QColor("#0000FF")
-        pen = QPen(laser_color, 4)
-        pen.setCapStyle(Qt.RoundCap)
+        # Return captured stones for game logic processing
+        return self._apply_laser(paths, player)
+
+    def shoot_laser_async(self, start_pos, direction, player=1):
+        """
+        Shoot a laser with the trace computed on the worker pool.
+        
+        The GUI thread only applies the finished result (beam, captures) and
+        then emits laser_fired. If the stones changed while the trace was
+        running it is recomputed against the current board; if the turn
+        passed or the board was replaced (restart, load, resize) the shot is
+        dropped, since it belongs to a position that no longer exists.
+        """
+        self._shot_signature = self._stones_signature()
+        self._shot_stamp = (self._turn_serial, self._board_generation)
+        self.laser_tracer.request("shot", self.board_state, start_pos, direction, player)
+
+    def _on_trace_ready(self, kind, result):
+        """Show a finished preview, or apply a finished shot to the live board."""
+        if kind == "preview":
+            if not self.is_aiming:
+                return
+            if self.preview_beam is None:
+                self.preview_beam = self.scene.addPath(QPainterPath())
+                self.preview_beam.setZValue(9) # Under the aiming arrow
+            color = QColor("#FF0000") if result["player"] == 1 else QColor("#0000FF")
+            color.setAlpha(140)
+            self.preview_beam.setPen(QPen(color, 2, Qt.DashLine))
+            self.preview_beam.setPath(self._beam_path(result["paths"]))
+            return
+        
+        if self._shot_stamp != (self._turn_serial, self._board_generation):
+            # Fired on an earlier turn or board: never apply it for a player whose turn is over
+            print(f"Laser shot dropped: Player {result['player']}'s turn is over")
+            return
+        
+        if self._stones_signature() != self._shot_signature:
+            # Traced on a board that has changed since (same turn); trace again
+            self.shoot_laser_async(result["start"], result["direction"], result["player"])
+            return
         
+        captured = self._apply_laser(result["paths"], result["player"])
+        self.laser_fired.emit(result["start"], result["direction"], result["player"], captured)
+
+    def _stones_signature(self):
+        """Everything a laser trace depends on, to detect stale results."""
+        return {pos: (stone.stone_type, stone.player, stone.rotation_angle)
+                for pos, stone in self.board_state.stones.items()}
+
+    def _apply_laser(self, paths, player):
+        """Draw (or defer) a traced beam and apply its captures to the board."""
+        if self._batch_depth:
+            self._pending_laser = (paths, player)
+        else:
+            self._draw_laser_paths(paths, player)
+            
+        captured = self.board_state.process_laser_captures(player, paths)
+        if captured:
+            self._schedule_territory_refresh()
+        
+        if not self._batch_depth:
+            for pos in captured:
+                if pos in self.stone_items:
+                    self.scene.removeItem(self.stone_items.pop(pos))
+        return captured
+
+    def _beam_path(self, paths):
+        """Convert laser path segments (grid units) into one scene QPainterPath."""
+        beam_path = QPainterPath()
         for segment in paths:
             start_x = self.margin_horizontal + (segment[0][0] - 0.5) * self.cell_size
             start_y = self.margin_vertical + (segment[0][1] - 0.5) * self.cell_size
             end_x = self.margin_horizontal + (segment[1][0] - 0.5) * self.cell_size
             end_y = self.margin_vertical + (segment[1][1] - 0.5) * self.cell_size
+            beam_path.moveTo(start_x, start_y)
+            beam_path.lineTo(end_x, end_y)
+        return beam_path
+
+    @instrumentation.timed("board.draw_laser")
+    def _draw_laser_paths(self, paths, player):
+        """Replace the beams on screen with the given path segments."""
+        self.clear_lasers()
+        
+        beam_path = self._beam_path(paths)
+        glow, core = self._laser_beam_items(player)
+        core.setPath(beam_path)
+        if glow:
+            glow.setPath(beam_path)
+
+    def _laser_beam_items(self, player):
+        """
+        Return the (glow, core) path items of a player's beam, creating them once.
+        
+        Each item strokes every segment of a shot in a single pass, so the
+        number of scene items stays constant however many segments a beam
+        has, and overlapping glow does not stack up its alpha.
+        """
+        if player not in self.laser_beams:
+            laser_color = QColor("#FF0000") if player == 1 else QColor("#0000FF")
             
-            line = self.scene.addLine(start_x, start_y, end_x, end_y, pen)
-            line.setZValue(5) # Top layer
-            self.laser_items.append(line)
+            glow = None
+            if self.laser_config.get("glow", False):
+                glow_color = QColor(laser_color)
+                glow_color.setAlpha(int(self.laser_config.get("glow_opacity", 0.35) * 255))
+                glow_pen = QPen(glow_color, self.laser_config.get("glow_width", 12))
+                glow_pen.setCapStyle(Qt.RoundCap)
+                glow_pen.setJoinStyle(Qt.RoundJoin)
+                glow = self.scene.addPath(QPainterPath(), glow_pen)
+                glow.setZValue(4.9) # Just under the core beam
             
-        # Return captured stones for game logic processing
-        return self.board_state.process_laser_captures(player, paths)
+            pen = QPen(laser_color, 4)
+            pen.setCapStyle(Qt.RoundCap)
+            core = self.scene.addPath(QPainterPath(), pen)
+            core.setZValue(5) # Top layer
+            
+            self.laser_beams[player] = (glow, core)
+        return self.laser_beams[player]
+
+    def clear_lasers(self):
+        """Hide all beams (the pooled items stay in the scene)."""
+        empty = QPainterPath()
+        for glow, core in self.laser_beams.values():
+            core.setPath(empty)
+            if glow:
+                glow.setPath(empty)
 
     def highlight_stones(self, positions):
         """Highlight specific stones or cells."""
@@ -1067,20 +1296,37 @@ class GameBoard(QGraphicsView):
     def end_turn(self):
         """Switch current player."""
         self.current_player = (self.current_player % 2) + 1
+        self._turn_serial += 1
         self.reset_move_timer()
 
     def set_current_player(self, player):
         """Set the current player (for energy tracking)."""
         self.current_player = player
+        self._turn_serial += 1
         # Reset move timer on turn switch (handled in end_turn usually, but safe here too)
         self.board_state.current_move_time_remaining = self.board_state.move_time_limit
 
     def on_timer_tick(self):
-        """Handle timer tick."""
+        """Handle timer tick: run the clock steps that are due, then refresh the display once."""
         if self.board_state.game_over:
             return
+        
+        self.clock_loop.advance()
+        if self.board_state.game_over:
+            return # Expired during this frame
             
-        delta = 0.1
+        # Emit update signal
+        self.timer_updated.emit(
+            self.board_state.player_time_remaining[1],
+            self.board_state.player_time_remaining[2],
+            self.board_state.current_move_time_remaining,
+            self.board_state.total_time_limit
+        )
+
+    def _clock_step(self, delta):
+        """Advance the game clock by one fixed step of delta seconds."""
+        if self.board_state.game_over:
+            return
         
         # Decrement Move Timer
         self.board_state.current_move_time_remaining -= delta
@@ -1096,15 +1342,6 @@ class GameBoard(QGraphicsView):
             
         if self.board_state.total_time_limit > 0 and self.board_state.player_time_remaining[self.current_player] <= 0:
             self.handle_time_expiration(f"Player {self.current_player} Total Time Expired")
-            return
-            
-        # Emit update signal
-        self.timer_updated.emit(
-            self.board_state.player_time_remaining[1],
-            self.board_state.player_time_remaining[2],
-            self.board_state.current_move_time_remaining,
-            self.board_state.total_time_limit
-        )
 
     def handle_time_expiration(self, reason):
         """Handle time expiration."""
@@ -1133,16 +1370,19 @@ class GameBoard(QGraphicsView):
         """Stop the game timer (e.g. for replayer)."""
         if self.game_timer:
             self.game_timer.stop()
+        self.clock_loop.pause()
     
     def clear_board(self):
         """Clear all stones and lasers."""
         for item in self.stone_items.values():
             self.scene.removeItem(item)
         self.stone_items.clear()
+        self.stone_motion.clear()
         
-        for item in self.laser_items:
-            self.scene.removeItem(item)
-        self.laser_items.clear()
+        self.clear_lasers()
+        self._pending_laser = None
+        self.laser_tracer.cancel("shot")
+        self._clear_aiming_visual()
         
         if self.aiming_arrow:
             self.scene.removeItem(self.aiming_arrow)
@@ -1154,7 +1394,144 @@ class GameBoard(QGraphicsView):
         self.victory_items.clear()
             
         self.board_state = BoardState2D(self.grid_size, territory_threshold=self.territory_threshold)
+        self._board_generation += 1
         self.current_player = 1
+        self._schedule_territory_refresh()
+
+    def load_state(self, state):
+        """
+        Show a recorded BoardState2D.to_dict() snapshot.
+        
+        Only stones that differ from the current position are redrawn, so
+        jumping between nearby turns costs little more than a single move.
+        """
+        new_state = BoardState2D.from_dict(state)
+        if new_state.grid_size != self.grid_size:
+            self.set_grid_size(new_state.grid_size)
+        
+        self.clear_lasers()
+        self.clear_victory_screen()
+        self.laser_tracer.cancel("shot")
+        
+        self.board_state = new_state
+        self._board_generation += 1
+        self._sync_stone_items()
+        self._schedule_territory_refresh()
+
+    def set_territory_overlay_visible(self, visible):
+        """Show or hide the territory heatmap."""
+        if not visible:
+            if self.territory_overlay is not None:
+                self.scene.removeItem(self.territory_overlay)
+                self.territory_overlay = None
+            self._territory_timer.stop()
+            return
+        if self.territory_overlay is None:
+            colors = []
+            for key, default in (("player1", "#FF0000"), ("player2", "#0000FF"), ("contested", "#B000FF")):
+                color = QColor(self.territory_config.get(key, default))
+                color.setAlpha(int(self.territory_config.get("opacity", 0.3) * 255))
+                colors.append(color)
+            self.territory_overlay = TerritoryOverlay(self.grid_size, self.cell_size, colors)
+            self.territory_overlay.setPos(self.margin_horizontal, self.margin_vertical)
+            self.territory_overlay.setZValue(-0.9) # Over the grid lines, under stones and shadows
+            self.scene.addItem(self.territory_overlay)
+        self.refresh_territory()
+
+    @instrumentation.timed("board.refresh_territory")
+    def refresh_territory(self):
+        """Recompute illuminated territory and repaint the cells that changed."""
+        if self.territory_overlay is not None:
+            self.territory_overlay.update_from_score(self.board_state.calculate_score())
+
+    def _schedule_territory_refresh(self):
+        """Refresh the overlay once control returns to the event loop (no-op while hidden)."""
+        if self.territory_overlay is not None and not self._batch_depth:
+            self._territory_timer.start()
+
+    def _start_stone_motion(self, from_pos, to_pos, path=None):
+        """Re-key a stone item to to_pos and let render_interpolated() move it along path."""
+        item = self.stone_items.pop(from_pos)
+        self.stone_items[to_pos] = item
+        self.stone_motion.pop(from_pos, None)
+        
+        if path is None:
+            dx, dy = to_pos[0] - from_pos[0], to_pos[1] - from_pos[1]
+            if max(abs(dx), abs(dy)) > self.grid_size // 2:
+                # Most likely wrapped around the edge; sliding across the board would mislead
+                item.setPos(self.margin_horizontal + to_pos[0] * self.cell_size,
+                            self.margin_vertical + to_pos[1] * self.cell_size)
+                return
+            path = [from_pos, to_pos]
+        
+        lengths = [0.0]
+        for (x0, y0), (x1, y1) in zip(path, path[1:]):
+            lengths.append(lengths[-1] + math.hypot(x1 - x0, y1 - y0))
+        self.stone_motion[to_pos] = (list(path), lengths)
+
+    @instrumentation.timed("board.render_interpolated")
+    def render_interpolated(self, alpha):
+        """Place moving stones alpha (0..1) of the way along their path of the last simulation tick."""
+        for pos, (path, lengths) in self.stone_motion.items():
+            item = self.stone_items.get(pos)
+            if item is None or len(path) < 2:
+                continue
+            # Constant speed along the polyline
+            distance = lengths[-1] * alpha
+            i = min(max(bisect.bisect_right(lengths, distance) - 1, 0), len(path) - 2)
+            span = lengths[i + 1] - lengths[i]
+            t = (distance - lengths[i]) / span if span else 1.0
+            x = path[i][0] + (path[i + 1][0] - path[i][0]) * t
+            y = path[i][1] + (path[i + 1][1] - path[i][1]) * t
+            # Paths are unwrapped: a stone leaving one edge re-enters at the opposite one
+            item.setPos(self.margin_horizontal + (x % self.grid_size) * self.cell_size,
+                        self.margin_vertical + (y % self.grid_size) * self.cell_size)
+
+    def settle_motion(self):
+        """Snap moving stones to their destinations (before the next tick moves them again)."""
+        self.render_interpolated(1.0)
+        self.stone_motion.clear()
+
+    def begin_batch(self):
+        """
+        Start deferring scene updates (e.g. while replaying many moves at once).
+        
+        Logical board state keeps changing immediately; stone and laser items
+        are left alone until the matching commit_batch(). Batches nest.
+        """
+        if self._batch_depth == 0:
+            self._pending_laser = None
+        self._batch_depth += 1
+
+    def commit_batch(self):
+        """End a batch and bring the scene up to date with one minimal diff."""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
+        
+        self._sync_stone_items()
+        self._schedule_territory_refresh()
+        if self._pending_laser is not None:
+            # Only the last laser of the batch would still be on screen
+            self._draw_laser_paths(*self._pending_laser)
+            self._pending_laser = None
+
+    @instrumentation.timed("board.sync_stones")
+    def _sync_stone_items(self):
+        """Add, remove and rotate stone items so they match board_state."""
+        self.settle_motion()
+        # Drop visuals whose stone vanished or changed type/owner
+        for pos in list(self.stone_items):
+            stone = self.board_state.stones.get(pos)
+            if stone is None or self.stone_items[pos].data(0) != f"{stone.stone_type.name}:{stone.player}":
+                self.scene.removeItem(self.stone_items.pop(pos))
+        
+        for pos, stone in self.board_state.stones.items():
+            if pos not in self.stone_items:
+                self._draw_stone(pos, stone.stone_type.name, stone.player)
+            self.stone_items[pos].setRotation(stone.rotation_angle)
 
     def set_grid_size(self, new_size):
         """Set the grid size and reinitialize the board."""
@@ -1168,12 +1545,20 @@ class GameBoard(QGraphicsView):
         # Clear ALL scene items (including grid, background, stones, lasers)
         self.scene.clear()
         self.stone_items.clear()
-        self.laser_items.clear()
+        self.stone_motion.clear()
+        self.laser_beams.clear() # scene.clear() deleted the pooled beam items
+        self.preview_beam = None
+        self.laser_tracer.cancel("preview")
+        self.laser_tracer.cancel("shot")
         self.victory_items.clear()
         self.aiming_arrow = None
+        self._pending_laser = None
+        territory_visible = self.territory_overlay is not None
+        self.territory_overlay = None # Its texture is sized for the old grid
         
         # Reinitialize board state with new size
         self.board_state = BoardState2D(new_size, territory_threshold=self.territory_threshold)
+        self._board_generation += 1
         self.current_player = 1
         
         # Redraw board with new grid
@@ -1181,6 +1566,9 @@ class GameBoard(QGraphicsView):
         
         # Recalculate scene rect and fit to view
         self._setup_view()
+        
+        if territory_visible:
+            self.set_territory_overlay_visible(True)
 
     def show_victory_screen(self, winner, reason, p1_score=0, p2_score=0):
         """Display a dramatic victory screen overlay with scores."""
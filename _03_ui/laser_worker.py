@@ -0,0 +1,97 @@
+"""
+File: laser_worker.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: Laser tracing and capture scoring on QThreadPool for the interactive board.
+"""
+
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
+from _02_engines.laser import LaserCalculator2D
+from _03_ui.task_runner import TaskRunner
+
+
+def _trace(is_cancelled, kind, board, start_pos, direction, player):
+    """Trace one laser on a private board snapshot (worker thread)."""
+    # Same origin convention as GameBoard.shoot_laser
+    paths = LaserCalculator2D(board.grid_size).calculate_path(
+        (start_pos[0] + 0.5, start_pos[1] + 0.5),
+        direction,
+        board.stones
+    )
+    if is_cancelled():
+        return None
+    # Scoring runs on the snapshot; the live board is only touched on the GUI thread.
+    # Previews only draw the beam, so they skip it.
+    captured = [] if kind == "preview" else board.process_laser_captures(player, paths)
+    return {
+        "start": start_pos,
+        "direction": direction,
+        "player": player,
+        "paths": paths,
+        "captured": captured,
+    }
+
+
+class LaserTracer(QObject):
+    """
+    Runs laser traces off the GUI thread.
+
+    Requests are grouped by kind ("preview", "shot"). A new shot supersedes
+    the previous one: the old task is skipped if it has not started yet and
+    its result is dropped if it has, so only the newest shot is delivered
+    through trace_ready.
+
+    Previews (QUEUED_KINDS) are requested on every mouse move, faster than a
+    dense board can be traced, so a running preview is never superseded: it
+    finishes and is shown, and only then does the newest request made in the
+    meantime start. Queued requests keep a reference to the live board, which
+    is cloned only when the trace starts.
+    """
+    trace_ready = Signal(str, object)  # kind, result dict
+
+    QUEUED_KINDS = ("preview",)
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self.runner = TaskRunner(self, pool=pool or QThreadPool.globalInstance())
+        self.runner.finished.connect(self._on_finished)
+        self.runner.failed.connect(self._on_failed)
+        self._queued = {}  # kind -> newest (board_state, start_pos, direction, player) waiting for a QUEUED_KINDS trace
+
+    def request(self, kind, board_state, start_pos, direction, player):
+        """
+        Trace a laser on board_state (snapshotted when the trace starts).
+        Returns the request id, or None if the request was queued behind a
+        running trace of a QUEUED_KINDS kind.
+        """
+        if kind in self.QUEUED_KINDS and self.runner.is_pending(kind):
+            self._queued[kind] = (board_state, start_pos, direction, player)
+            return None
+        return self._start(kind, board_state, start_pos, direction, player)
+
+    def _start(self, kind, board_state, start_pos, direction, player):
+        return self.runner.start(kind, _trace, kind, board_state.clone(), start_pos, direction, player)
+
+    def cancel(self, kind):
+        """Forget the pending (and queued) request of this kind, if any."""
+        self._queued.pop(kind, None)
+        self.runner.cancel(kind)
+
+    def is_pending(self, kind):
+        return self.runner.is_pending(kind)
+
+    def _start_queued(self, kind):
+        queued = self._queued.pop(kind, None)
+        if queued is not None:
+            self._start(kind, *queued)
+
+    def _on_finished(self, kind, result):
+        self._start_queued(kind)
+        if result is not None:
+            self.trace_ready.emit(kind, result)
+
+    def _on_failed(self, kind, error):
+        print(f"Laser trace failed: {error}")
+        self._start_queued(kind)
@@ -0,0 +1,190 @@
+"""
+File: library_dialog.py
+Creation Date: 2026-10-19
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: Game picker backed by the game library index, rescanned off the GUI thread.
+"""
+
+import threading
+import time
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
+from PySide6.QtWidgets import (QAbstractItemView, QComboBox, QDialog, QHBoxLayout, QHeaderView, QLabel,
+                               QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, QVBoxLayout)
+
+from _01_core_logic.board_state import BoardState2D
+from _01_core_logic.game_library import GameLibrary, DEFAULT_DB, DEFAULT_ROOT
+
+MAX_ROWS = 1000
+HEADERS = ["Date", "Grid", "Turns", "Player 1", "Player 2", "Winner", "Reason", "Score", "File"]
+
+
+class _UpdateSignals(QObject):
+    """Carries a finished rescan back to the GUI thread."""
+    finished = Signal(object, str)  # counts (None on failure), error
+
+
+class _UpdateTask(QRunnable):
+    """Run GameLibrary.update() on its own connection; set cancel to stop it early."""
+
+    def __init__(self, db_path, root):
+        super().__init__()
+        self.db_path = db_path
+        self.root = root
+        self.cancel = threading.Event()
+        self.signals = _UpdateSignals()
+
+    def run(self):
+        try:
+            library = GameLibrary(self.db_path, self.root)
+            try:
+                counts = library.update(cancel=self.cancel)
+            finally:
+                library.close()
+            self.signals.finished.emit(counts, "")
+        except Exception as e:
+            self.signals.finished.emit(None, str(e) or type(e).__name__)
+
+
+class GameLibraryDialog(QDialog):
+    """
+    Browse the indexed games and pick one to open.
+
+    The list comes straight from the index, so it shows at once; a rescan
+    of root starts in the background when the dialog opens and the list is
+    refreshed when it finishes. selected_path holds the chosen file.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB, root=DEFAULT_ROOT, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Game Library")
+        self.resize(1000, 600)
+        self.db_path = db_path
+        self.root = root
+        self.library = GameLibrary(db_path, root)
+        self.selected_path = None
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._task = None # Kept alive until it reports back
+
+        layout = QVBoxLayout(self)
+
+        filters = QHBoxLayout()
+        self.text_filter = QLineEdit()
+        self.text_filter.setPlaceholderText("Search id, player, model, reason...")
+        filters.addWidget(self.text_filter, 1)
+        self.winner_combo = QComboBox()
+        self.winner_combo.addItem("Any result", None)
+        self.winner_combo.addItem("P1 wins", 1)
+        self.winner_combo.addItem("P2 wins", 2)
+        self.winner_combo.addItem("Draw", 0)
+        filters.addWidget(self.winner_combo)
+        self.grid_combo = QComboBox()
+        self.grid_combo.addItem("Any grid", None)
+        for size in BoardState2D.GRID_SIZES:
+            self.grid_combo.addItem(f"{size}x{size}", size)
+        filters.addWidget(self.grid_combo)
+        layout.addLayout(filters)
+
+        self.table = QTableWidget(0, len(HEADERS))
+        self.table.setHorizontalHeaderLabels(HEADERS)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(len(HEADERS) - 1, QHeaderView.Stretch)
+        layout.addWidget(self.table, 1)
+
+        buttons = QHBoxLayout()
+        self.status_label = QLabel()
+        buttons.addWidget(self.status_label, 1)
+        self.rescan_btn = QPushButton("Rescan")
+        buttons.addWidget(self.rescan_btn)
+        self.open_btn = QPushButton("Open")
+        buttons.addWidget(self.open_btn)
+        cancel_btn = QPushButton("Cancel")
+        buttons.addWidget(cancel_btn)
+        layout.addLayout(buttons)
+
+        self.text_filter.textChanged.connect(self.refresh)
+        self.winner_combo.currentIndexChanged.connect(self.refresh)
+        self.grid_combo.currentIndexChanged.connect(self.refresh)
+        self.table.itemDoubleClicked.connect(self.accept)
+        self.rescan_btn.clicked.connect(self.rescan)
+        self.open_btn.clicked.connect(self.accept)
+        cancel_btn.clicked.connect(self.reject)
+
+        self.refresh()
+        self.rescan()
+
+    def refresh(self):
+        """Re-run the query for the current filters."""
+        games = self.library.query(text=self.text_filter.text().strip() or None,
+                                   winner=self.winner_combo.currentData(),
+                                   grid_size=self.grid_combo.currentData(), limit=MAX_ROWS)
+        self.table.setRowCount(len(games))
+        for row, game in enumerate(games):
+            if game["winner"] is None:
+                winner, score = "", ""
+            else:
+                winner = "Draw" if game["winner"] == 0 else f"P{game['winner']}"
+                score = f"{game['p1_score']} - {game['p2_score']}" if game["p1_score"] is not None else ""
+            cells = [
+                time.strftime("%Y-%m-%d %H:%M", time.localtime(game["mtime"])),
+                f"{game['grid_size']}x{game['grid_size']}" if game["grid_size"] else "",
+                str(game["turns"] or 0),
+                game["model1"] or game["player1"] or "",
+                game["model2"] or game["player2"] or "",
+                winner,
+                game["victory_reason"] or "",
+                score,
+                game["path"],
+            ]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                item.setData(Qt.UserRole, game["path"])
+                self.table.setItem(row, column, item)
+        self.table.resizeColumnsToContents()
+        shown = f"{len(games)} games" + (f" (first {MAX_ROWS})" if len(games) == MAX_ROWS else "")
+        if self._task is None:
+            self.status_label.setText(shown)
+        else:
+            self.status_label.setText(f"{shown} - scanning {self.root}...")
+
+    def rescan(self):
+        """Index new and changed games in the background."""
+        if self._task is not None:
+            return
+        self._task = _UpdateTask(self.db_path, self.root)
+        self._task.signals.finished.connect(self.on_rescan_finished)
+        self.rescan_btn.setEnabled(False)
+        self.pool.start(self._task)
+        self.refresh()
+
+    def on_rescan_finished(self, counts, error):
+        if self._task is None:
+            return # Dialog closed while the rescan was running
+        self._task = None
+        self.rescan_btn.setEnabled(True)
+        self.refresh()
+        if error:
+            self.status_label.setText(f"{self.status_label.text()} - rescan failed: {error}")
+        elif counts["added"] or counts["updated"] or counts["removed"]:
+            self.status_label.setText(f"{self.status_label.text()} - {counts['added']} new, "
+                                      f"{counts['updated']} changed, {counts['removed']} removed")
+
+    def accept(self):
+        items = self.table.selectedItems()
+        if not items:
+            return
+        self.selected_path = items[0].data(Qt.UserRole)
+        super().accept()
+
+    def done(self, result):
+        if self._task is not None:
+            # Closing never waits for the rescan: it stops after the file in hand, on its own connection
+            self._task.cancel.set()
+            self._task = None
+        self.library.close()
+        super().done(result)
@@ -0,0 +1,62 @@
+"""
+File: save_worker.py
+Creation Date: 2026-10-19
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: Game saves serialised off the GUI thread from recorder snapshots.
+"""
+
+from PySide6.QtCore import QObject, Signal
+
+from _01_core_logic.recorder import write_snapshot, default_save_path
+from _03_ui.task_runner import TaskRunner
+
+
+def _write(is_cancelled, snapshot, filename):
+    """Write one GameSnapshot (worker thread); returns (filename, error) with error "" on success."""
+    try:
+        write_snapshot(snapshot, filename)
+        return filename, ""
+    except Exception as e:
+        return filename, str(e) or type(e).__name__
+
+
+class GameSaver(QObject):
+    """
+    Saves games without blocking the GUI thread.
+
+    save() snapshots the recorder on the calling thread (a shallow copy of
+    the turn list) and serialises it on a private one-thread pool, so saves
+    reach the disk in the order they were requested and a later save of the
+    same file always wins. kind is a free label ("manual", "checkpoint",
+    ...) handed back with the result.
+    """
+    saved = Signal(str, str)             # kind, filename
+    save_failed = Signal(str, str, str)  # kind, filename, error
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.runner = TaskRunner(self, max_threads=1)
+        self.runner.finished.connect(self._on_finished)
+
+    def save(self, recorder, filename=None, kind="manual"):
+        """Queue a save of recorder's current contents and return the target filename."""
+        snapshot = recorder.snapshot()
+        filename = filename or default_save_path(snapshot)
+        self.runner.start(kind, _write, snapshot, filename, supersede=False) # Every save is written
+        return filename
+
+    def pending(self, kind=None):
+        """Number of queued or running saves (of one kind, if given)."""
+        return self.runner.pending(kind)
+
+    def wait(self, msecs=-1):
+        """Block until every queued save is written (e.g. before quitting)."""
+        return self.runner.wait(msecs)
+
+    def _on_finished(self, kind, result):
+        filename, error = result
+        if error:
+            self.save_failed.emit(kind, filename, error)
+        else:
+            self.saved.emit(kind, filename)
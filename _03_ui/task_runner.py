@@ -0,0 +1,112 @@
+"""
+File: task_runner.py
+Creation Date: 2026-10-19
+Last Updated: 2026-10-19
+Version: 1.0.0
+Description: Keyed background tasks on QThreadPool with results delivered on the GUI thread.
+"""
+
+import traceback
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class _TaskSignals(QObject):
+    """Carries a finished task from the worker thread back to the GUI thread."""
+    finished = Signal(int, object, str)  # request id, result, error ("" on success)
+
+
+class _Task(QRunnable):
+    """Call fn(is_cancelled, *args) on a pool thread."""
+
+    def __init__(self, request_id, key, fn, args):
+        super().__init__()
+        self.request_id = request_id
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.cancelled = False
+        self.signals = _TaskSignals()
+
+    def is_cancelled(self):
+        return self.cancelled
+
+    def run(self):
+        result, error = None, ""
+        if not self.cancelled:
+            try:
+                result = self.fn(self.is_cancelled, *self.args)
+            except Exception as e:
+                traceback.print_exc()
+                error = str(e) or type(e).__name__
+        self.signals.finished.emit(self.request_id, result, error)
+
+
+class TaskRunner(QObject):
+    """
+    Runs functions off the GUI thread, grouped by key (a kind, a player...).
+
+    start() with supersede set (the default) makes the new task the only
+    live one of its key: an older one is skipped if it has not started and
+    its result is dropped if it has, so the newest request wins. With
+    supersede off, tasks of a key all run and all report back.
+
+    fn is called as fn(is_cancelled, *args); long tasks may poll
+    is_cancelled() to stop early. Results arrive on the GUI thread through
+    finished(key, result), or failed(key, error) if fn raised; cancelled
+    tasks report nothing.
+    """
+    finished = Signal(object, object)  # key, result
+    failed = Signal(object, str)       # key, error
+
+    def __init__(self, parent=None, pool=None, max_threads=None):
+        super().__init__(parent)
+        if pool is None:
+            pool = QThreadPool(self)
+            if max_threads:
+                pool.setMaxThreadCount(max_threads)
+        self.pool = pool
+        self._next_id = 0
+        self._tasks = {}  # request id -> task, kept alive until it reports back
+
+    def start(self, key, fn, *args, supersede=True):
+        """Queue fn(is_cancelled, *args) under key and return its request id."""
+        if supersede:
+            self.cancel(key)
+        self._next_id += 1
+        task = _Task(self._next_id, key, fn, args)
+        task.signals.finished.connect(self._on_finished)
+        self._tasks[task.request_id] = task
+        self.pool.start(task)
+        return task.request_id
+
+    def cancel(self, key):
+        """Drop the live tasks of key (running ones finish, unreported)."""
+        for task in self._tasks.values():
+            if task.key == key:
+                task.cancelled = True
+
+    def cancel_all(self):
+        for task in self._tasks.values():
+            task.cancelled = True
+
+    def pending(self, key=None):
+        """Number of live (queued or running, not cancelled) tasks, of one key if given."""
+        return sum(1 for task in self._tasks.values()
+                   if not task.cancelled and (key is None or task.key == key))
+
+    def is_pending(self, key):
+        return self.pending(key) > 0
+
+    def wait(self, msecs=-1):
+        """Block until every queued task has run (e.g. before quitting)."""
+        return self.pool.waitForDone(msecs)
+
+    def _on_finished(self, request_id, result, error):
+        task = self._tasks.pop(request_id, None)
+        if task is None or task.cancelled:
+            return  # Superseded or cancelled
+        if error:
+            self.failed.emit(task.key, error)
+        else:
+            self.finished.emit(task.key, result)
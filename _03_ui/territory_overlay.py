@@ -0,0 +1,71 @@
+"""
+File: territory_overlay.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Territory heatmap for GameBoard, one texel per intersection in a single QImage.
+"""
+
+from PySide6.QtWidgets import QGraphicsItem
+from PySide6.QtGui import QImage, QColor, QPainter
+from PySide6.QtCore import QRectF, Qt
+
+# Cell owner codes (index into TerritoryOverlay.colors)
+EMPTY, PLAYER1, PLAYER2, CONTESTED = 0, 1, 2, 3
+
+
+class TerritoryOverlay(QGraphicsItem):
+    """
+    Shades every intersection by who illuminates it (P1, P2 or contested).
+
+    The whole board is one grid_size x grid_size QImage stretched over the
+    board, so the scene holds a single item however large the grid is.
+    update_from_score() only rewrites the texels whose owner changed and
+    skips the repaint entirely when nothing did.
+    """
+
+    def __init__(self, grid_size, cell_size, colors, parent=None):
+        super().__init__(parent)
+        self.grid_size = grid_size
+        self.cell_size = cell_size
+        self.colors = [QColor(0, 0, 0, 0)] + [QColor(c) for c in colors] # EMPTY, P1, P2, CONTESTED
+        self.owners = bytearray(grid_size * grid_size)
+        self.image = QImage(grid_size, grid_size, QImage.Format_ARGB32)
+        self.image.fill(Qt.transparent)
+        # Texel (x, y) is centred on intersection (x, y)
+        self.rect = QRectF(-cell_size / 2, -cell_size / 2, grid_size * cell_size, grid_size * cell_size)
+
+    def boundingRect(self):
+        return self.rect
+
+    def paint(self, painter, option, widget=None):
+        # Nearest-neighbour scaling keeps every cell a crisp square
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
+        painter.drawImage(self.rect, self.image)
+
+    def update_from_score(self, score):
+        """
+        Apply BoardState2D.calculate_score() output; returns the number of changed cells.
+        """
+        n = self.grid_size
+        owners = bytearray(n * n)
+        for key, code in (("player1_points", PLAYER1), ("player2_points", PLAYER2),
+                          ("contested_points", CONTESTED)):
+            for x, y in score.get(key, ()):
+                if 0 <= x < n and 0 <= y < n:
+                    owners[y * n + x] = code
+
+        changed = 0
+        for i, (old, new) in enumerate(zip(self.owners, owners)):
+            if old != new:
+                self.image.setPixelColor(i % n, i // n, self.colors[new])
+                changed += 1
+
+        if changed:
+            self.owners = owners
+            self.update()
+        return changed
+
+    def clear(self):
+        """Forget all territory (e.g. after the board was reset)."""
+        return self.update_from_score({})
@@ -0,0 +1,4 @@
+"""
+Benchmarks Module
+Seeded scenario boards and timing harness for the core engine
+"""
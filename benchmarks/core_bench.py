@@ -0,0 +1,249 @@
+"""
+File: core_bench.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Canonical core engine benchmarks with a stored JSON baseline and regression check.
+
+Every operation is timed on every scenario board (benchmarks/scenarios.py)
+for every size in BoardState2D.GRID_SIZES. Calls per repeat are calibrated
+so one repeat lasts about --min-time seconds, and the best repeat is the
+figure compared (the least disturbed by the rest of the machine).
+
+Usage:
+    # Record a new baseline
+    python -m benchmarks.core_bench run --output benchmarks/baselines/core.json
+
+    # Measure and flag cases more than 15% slower than the baseline (exit code 1)
+    python -m benchmarks.core_bench run --output bench_current.json --compare benchmarks/baselines/core.json
+
+    # Compare two stored runs
+    python -m benchmarks.core_bench compare benchmarks/baselines/core.json bench_current.json --threshold 0.15
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+from _00_entry.game_server import GameServer
+from _01_core_logic.board_state import BoardState2D
+from _02_engines.laser import LaserCalculator2D
+from benchmarks.scenarios import SCENARIOS, build_scenario
+
+FORMAT_VERSION = 1
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "core.json")
+
+
+def _server_for(board):
+    server = GameServer(grid_size=board.grid_size)
+    server.reset({"realtime_mode": True, "infinite_energy": True})
+    return server
+
+
+def _step_case(board):
+    """server.step(rotate) on a fresh copy of board each call (a step mutates the board)."""
+    server = _server_for(board)
+    own = sorted(pos for pos, stone in board.stones.items() if stone.player == 1)
+    if own:
+        x, y = own[0]
+        action = {"type": "rotate", "x": x, "y": y, "angle": (board.stones[(x, y)].rotation_angle + 45) % 360}
+    else:
+        action = {"type": "pass"}
+
+    def setup():
+        server.board = board.clone()
+        server.current_player = 1
+        server.turn_count = 0
+        server.game_over = False
+    return setup, lambda: server.step(action)
+
+
+def _valid_actions_case(board):
+    server = _server_for(board)
+    server.board = board
+
+    def setup():
+        random.seed(0) # Curve moves are drawn from the random module
+    return setup, server.get_valid_actions
+
+
+def build_cases(board):
+    """{operation: (setup or None, call)} for one scenario board."""
+    laser = LaserCalculator2D(board.grid_size)
+    source_pos, source_dir, _ = board.laser_sources[0]
+    paths = [path for pos, direction, _ in board.laser_sources
+             for path in laser.calculate_path(pos, direction, board.stones)]
+    data = board.to_dict()
+    return {
+        "laser.calculate_path": (None, lambda: laser.calculate_path(source_pos, source_dir, board.stones)),
+        "laser.get_unique_points": (None, lambda: laser.get_unique_points(paths)),
+        "board.calculate_score": (None, board.calculate_score),
+        "board.clone": (None, board.clone),
+        "board.to_dict": (None, board.to_dict),
+        "board.from_dict": (None, lambda: BoardState2D.from_dict(data)),
+        "server.step": _step_case(board),
+        "server.get_valid_actions": _valid_actions_case(board),
+    }
+
+
+OPERATIONS = [
+    "laser.calculate_path", "laser.get_unique_points", "board.calculate_score", "board.clone",
+    "board.to_dict", "board.from_dict", "server.step", "server.get_valid_actions",
+]
+
+
+def measure(call, setup=None, repeat=5, min_time=0.05):
+    """
+    Time call() and return {"best_us", "median_us", "calls"} per call.
+
+    setup() (if given) runs before every call, outside the timed region.
+    """
+    def run_once(calls):
+        total = 0.0
+        for _ in range(calls):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            call()
+            total += time.perf_counter() - start
+        return total
+
+    calls = 1
+    elapsed = run_once(1) # Also warms caches
+    while elapsed < min_time and calls < 1_000_000:
+        calls = min(1_000_000, max(calls * 2, int(calls * min_time / max(elapsed, 1e-9))))
+        elapsed = run_once(calls)
+    per_call = [elapsed / calls] + [run_once(calls) / calls for _ in range(repeat - 1)]
+    return {
+        "best_us": round(min(per_call) * 1e6, 3),
+        "median_us": round(statistics.median(per_call) * 1e6, 3),
+        "calls": calls,
+    }
+
+
+def run(sizes, scenarios, operations, repeat, min_time, seed=0, log=print):
+    results = {}
+    for grid_size in sizes:
+        for name in scenarios:
+            board = build_scenario(name, grid_size, seed)
+            cases = build_cases(board)
+            for op in operations:
+                setup, call = cases[op]
+                key = f"{grid_size}/{name}/{op}"
+                results[key] = measure(call, setup, repeat, min_time)
+                log(f"{key:<48} {results[key]['best_us']:>14,.1f} us  (x{results[key]['calls']})")
+    return {
+        "format_version": FORMAT_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "machine": machine_info(),
+        "settings": {"repeat": repeat, "min_time": min_time, "seed": seed},
+        "results": results,
+    }
+
+
+def machine_info():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(baseline, current, threshold=0.15, log=print):
+    """
+    Compare best times case by case; returns the list of regressed case keys.
+
+    A case regresses when it is more than threshold (0.15 = 15%) slower than
+    the baseline. Cases present in only one of the runs are not judged
+    (a run restricted with --sizes/--scenarios/--ops skips the rest).
+    """
+    if baseline.get("machine") != current.get("machine"):
+        log("Warning: baseline was recorded on a different machine or Python; differences may not be real.\n")
+    base, cur = baseline["results"], current["results"]
+    regressions, improvements = [], []
+    log(f"{'case':<48} {'baseline us':>14} {'current us':>14} {'change':>8}")
+    for key in sorted(base.keys() & cur.keys(), key=_case_order):
+        before, after = base[key]["best_us"], cur[key]["best_us"]
+        change = after / before - 1 if before > 0 else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        elif change < -threshold:
+            improvements.append(key)
+            flag = "  faster"
+        log(f"{key:<48} {before:>14,.1f} {after:>14,.1f} {change:>+8.1%}{flag}")
+    missing = base.keys() - cur.keys()
+    if missing:
+        log(f"({len(missing)} baseline case(s) not in the current run)")
+    for key in sorted(cur.keys() - base.keys(), key=_case_order):
+        log(f"{key:<48} new (no baseline)")
+    log(f"\n{len(regressions)} regression(s), {len(improvements)} improvement(s) beyond {threshold:.0%}")
+    return regressions
+
+
+def _case_order(key):
+    size, scenario, op = key.split("/")
+    return int(size), scenario, op
+
+
+def _load(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported benchmark format {data.get('format_version')!r}")
+    return data
+
+
+def _save(path, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Core engine benchmarks with stored baselines")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="Run the benchmarks")
+    run_p.add_argument("--sizes", type=int, nargs="+", default=BoardState2D.GRID_SIZES, choices=BoardState2D.GRID_SIZES)
+    run_p.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    run_p.add_argument("--ops", nargs="+", default=OPERATIONS, choices=OPERATIONS)
+    run_p.add_argument("--repeat", type=int, default=5)
+    run_p.add_argument("--min-time", type=float, default=0.05, help="Seconds per repeat (calibrates calls)")
+    run_p.add_argument("--seed", type=int, default=0)
+    run_p.add_argument("--output", help="Write results as JSON (use the baseline path to record a baseline)")
+    run_p.add_argument("--compare", metavar="BASELINE", help="Compare against this baseline after running")
+    run_p.add_argument("--threshold", type=float, default=0.15)
+
+    cmp_p = sub.add_parser("compare", help="Compare two stored runs")
+    cmp_p.add_argument("baseline")
+    cmp_p.add_argument("current")
+    cmp_p.add_argument("--threshold", type=float, default=0.15)
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        regressions = compare(_load(args.baseline), _load(args.current), args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    current = run(args.sizes, args.scenarios, args.ops, args.repeat, args.min_time, args.seed)
+    if args.output:
+        _save(args.output, current)
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        print()
+        regressions = compare(_load(args.compare), current, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
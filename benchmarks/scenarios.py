@@ -0,0 +1,111 @@
+"""
+File: scenarios.py
+Creation Date: 2026-10-18
+Last Updated: 2026-10-18
+Version: 1.0.0
+Description: Fixed, seeded scenario boards for the core engine benchmarks (headless).
+
+Every scenario is a function (grid_size, rng) -> BoardState2D filling
+board.stones directly (no energy spent) and adding two laser sources per
+player, so calculate_score() has lasers to trace. build_scenario() seeds
+the rng from the scenario name and grid size: the same call always gives
+the same board.
+
+Usage:
+    from benchmarks.scenarios import SCENARIOS, build_scenario
+    board = build_scenario("mirror_maze", 19)
+"""
+
+import random
+import zlib
+
+from _01_core_logic.board_state import BoardState2D, StoneData2D, StoneType
+
+ANGLES = list(range(0, 360, 45))
+
+
+def _put(board, pos, stone_type, player, angle):
+    stone = StoneData2D(stone_type, player)
+    stone.set_rotation(angle)
+    board.stones[pos] = stone
+
+
+def _add_sources(board):
+    """Two sources per player firing in from the board edges, slightly off-axis."""
+    g = board.grid_size
+    board.add_laser_source((-1, g // 4 + 0.5), (1, 0.15), 1)
+    board.add_laser_source((g // 3 + 0.5, -1), (0.1, 1), 1)
+    board.add_laser_source((g, 3 * g // 4 + 0.5), (-1, -0.15), 2)
+    board.add_laser_source((2 * g // 3 + 0.5, g), (-0.1, -1), 2)
+
+
+def _random_fill(board, rng, fraction):
+    g = board.grid_size
+    cells = [(x, y) for x in range(g) for y in range(g)]
+    for pos in rng.sample(cells, int(len(cells) * fraction)):
+        _put(board, pos, rng.choice(list(StoneType)), rng.choice([1, 2]), rng.choice(ANGLES))
+
+
+def sparse(grid_size, rng):
+    """About 5% of intersections hold a random stone."""
+    board = BoardState2D(grid_size)
+    _random_fill(board, rng, 0.05)
+    return board
+
+
+def dense(grid_size, rng):
+    """About 60% of intersections hold a random stone."""
+    board = BoardState2D(grid_size)
+    _random_fill(board, rng, 0.6)
+    return board
+
+
+def splitter_lattice(grid_size, rng):
+    """Splitters every fourth intersection: every hit branches the beam."""
+    board = BoardState2D(grid_size)
+    for x in range(1, grid_size, 4):
+        for y in range(1, grid_size, 4):
+            _put(board, (x, y), StoneType.SPLITTER, 1 + (x + y) % 2, rng.choice([45, 135, 225, 315]))
+    return board
+
+
+def mirror_maze(grid_size, rng):
+    """Diagonal mirrors every other intersection: long bouncing paths up to max_bounces."""
+    board = BoardState2D(grid_size)
+    for x in range(0, grid_size, 2):
+        for y in range(0, grid_size, 2):
+            _put(board, (x, y), StoneType.MIRROR, rng.choice([1, 2]), rng.choice([45, 135]))
+    return board
+
+
+def blocker_wall(grid_size, rng):
+    """Two blocker walls with a one-cell gap each, plus a few prisms between them."""
+    board = BoardState2D(grid_size)
+    for x in (grid_size // 3, 2 * grid_size // 3):
+        gap = rng.randrange(grid_size)
+        for y in range(grid_size):
+            if y != gap:
+                _put(board, (x, y), StoneType.BLOCKER, 1 if x < grid_size // 2 else 2, 0)
+    for _ in range(grid_size // 2):
+        pos = (rng.randrange(grid_size // 3 + 1, 2 * grid_size // 3), rng.randrange(grid_size))
+        _put(board, pos, StoneType.PRISM, rng.choice([1, 2]), rng.choice(ANGLES))
+    return board
+
+
+SCENARIOS = {
+    "sparse": sparse,
+    "dense": dense,
+    "splitter_lattice": splitter_lattice,
+    "mirror_maze": mirror_maze,
+    "blocker_wall": blocker_wall,
+}
+
+
+def build_scenario(name, grid_size, seed=0):
+    """Build scenario name on a grid_size board; the stones depend only on (name, grid_size, seed)."""
+    if name not in SCENARIOS:
+        raise ValueError(f"Unknown scenario {name!r}. Must be one of {list(SCENARIOS)}")
+    rng = random.Random(zlib.crc32(f"{name}/{grid_size}/{seed}".encode()))
+    board = SCENARIOS[name](grid_size, rng)
+    _add_sources(board)
+    return board